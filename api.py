@@ -0,0 +1,316 @@
+"""읽기 전용 JSON 조회 API
+
+다른 도구가 Streamlit 화면이나 recruit_list.json 전체를 긁어 가는 대신 쓰는
+가벼운 HTTP 서버. 대시보드와 같은 Arrow 스냅샷과 필터 엔진(FilterEngine)을
+쓰므로 지역/과목/상태/검색 결과가 화면과 같다.
+
+    python api.py --host 0.0.0.0 --port 8502
+
+    GET /api/postings?region=수원시&subject=국어&search=기간제&page=1&per_page=50&fields=pbancSn,title
+    GET /api/changes?since=12      데이터 버전 12 이후 변경 기록
+    GET /api/facets                지역/과목/상태 선택지
+    GET /api/health
+
+목록 조건: search, region(여러 번), subject(여러 번), source(게시판, 여러 번), badge, closing_within(일),
+work_starts_after, registered_since(YYYY-MM-DD). badge= 처럼 값을 비우면 상태 배지가 없는 공고다. ETag 는 데이터 버전이라
+크롤링 결과가 바뀌지 않았으면 If-None-Match 에 304 로 답한다. 같은 버전의
+같은 질의는 인코딩한 응답 본문을 캐시해 재사용한다.
+"""
+import argparse
+import datetime
+import json
+import logging
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+from crawler.snapshot import ensure_snapshot, read_snapshot, to_dataframe
+from crawler.store import open_store
+from dashboard.filters import FilterEngine, LRUCache
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PER_PAGE = 50
+MAX_PER_PAGE = 500
+# 데이터 버전을 다시 확인하는 간격(초). 요청마다 SQLite 를 열지 않는다
+VERSION_TTL = 1.0
+
+
+class BadRequest(ValueError):
+    pass
+
+
+class Dataset:
+    """현재 데이터 버전의 DataFrame 과 필터 엔진 (버전이 바뀌면 새로 읽는다)"""
+
+    def __init__(self, store):
+        self.store = store
+        self.lock = threading.Lock()
+        # (버전, DataFrame, 필터 엔진) — 한 번에 바꿔 끼워 세 값이 항상 같은 버전이다
+        self.loaded = None
+        self._version = None
+        self.checked_at = float("-inf")
+        self.bodies = LRUCache(maxsize=1024)
+
+    def current_version(self):
+        now = time.monotonic()
+        if now - self.checked_at >= VERSION_TTL:
+            self._version = self.store.dataset_version()
+            self.checked_at = now
+        return self._version
+
+    def get(self):
+        """(버전, DataFrame, 필터 엔진)"""
+        version = self.current_version()
+        loaded = self.loaded
+        if loaded is None or loaded[0] < version:
+            with self.lock:
+                loaded = self.loaded
+                if loaded is None or loaded[0] < version:
+                    # 그사이 수집이 끝났으면 스냅샷은 더 새 버전이다
+                    path, version = ensure_snapshot(self.store, version)
+                    df = to_dataframe(read_snapshot(path))
+                    loaded = self.loaded = (version, df, FilterEngine(df, version))
+                    self._version = max(self._version, version)
+        return loaded
+
+
+# --- 요청 해석 ---
+def _one(params, name, default=None):
+    values = params.get(name)
+    return values[-1] if values else default
+
+
+def _many(params, name):
+    """region=a&region=b 또는 region=a,b"""
+    return [v.strip() for value in params.get(name, []) for v in value.split(",") if v.strip()]
+
+
+def _int(params, name, default=None, low=None, high=None):
+    value = _one(params, name)
+    if value is None or value == "":
+        return default
+    try:
+        number = int(value)
+    except ValueError:
+        raise BadRequest(f"{name} 은(는) 정수여야 합니다: {value!r}")
+    if (low is not None and number < low) or (high is not None and number > high):
+        raise BadRequest(f"{name} 범위를 벗어났습니다: {number}")
+    return number
+
+
+def _date(params, name):
+    value = _one(params, name)
+    if not value:
+        return None
+    try:
+        return datetime.date.fromisoformat(value)
+    except ValueError:
+        raise BadRequest(f"{name} 은(는) YYYY-MM-DD 형식이어야 합니다: {value!r}")
+
+
+def parse_filters(params):
+    """질의 문자열 → FilterEngine.query 인자"""
+    return dict(
+        search=_one(params, "search", ""),
+        regions=_many(params, "region"),
+        subjects=_many(params, "subject"),
+        sources=_many(params, "source"),
+        badge=_one(params, "badge"),
+        closing_within=_int(params, "closing_within", low=0),
+        work_starts_after=_date(params, "work_starts_after"),
+        registered_since=_date(params, "registered_since"),
+    )
+
+
+def parse_fields(params, columns):
+    fields = _many(params, "fields")
+    if not fields:
+        return list(columns)
+    unknown = [f for f in fields if f not in columns]
+    if unknown:
+        raise BadRequest(f"알 수 없는 필드: {', '.join(unknown)}")
+    return fields
+
+
+# --- 응답 ---
+def _column_values(series):
+    """JSON 으로 쓸 수 있는 값 목록 (날짜는 YYYY-MM-DD, 없으면 null)"""
+    if series.dtype.kind == "M":
+        return [None if value is None or value != value else value.date().isoformat() for value in series]
+    return series.tolist()
+
+
+def page_items(df, rows, fields):
+    """보이는 행만 열 단위로 꺼내 dict 목록으로"""
+    columns = {f: _column_values(df[f].take(rows)) for f in fields}
+    return [dict(zip(columns, values)) for values in zip(*columns.values())]
+
+
+def encode(payload):
+    return json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+# 경로별 응답. loaded 는 요청마다 한 번 읽은 dataset.get() 값이라 ETag 와 본문이 같은 버전이다
+def postings_body(dataset, loaded, params):
+    version, df, engine = loaded
+    filters = parse_filters(params)
+    fields = parse_fields(params, df.columns)
+    page = _int(params, "page", 1, low=1)
+    per_page = _int(params, "per_page", DEFAULT_PER_PAGE, low=1, high=MAX_PER_PAGE)
+
+    key = ("postings", version, engine.normalize(**filters), tuple(fields), page, per_page)
+    body = dataset.bodies.get(key)
+    if body is None:
+        rows = engine.query(**filters)
+        start = (page - 1) * per_page
+        body = encode({
+            "dataset_version": version,
+            "total": len(rows),
+            "page": page,
+            "per_page": per_page,
+            "pages": max(1, -(-len(rows) // per_page)),
+            "items": page_items(df, rows[start:start + per_page], fields),
+        })
+        dataset.bodies.put(key, body)
+    return body
+
+
+def changes_body(dataset, loaded, params):
+    version = loaded[0]
+    since = _int(params, "since", version, low=0)
+    # 스냅샷보다 새 버전의 변경은 다음 ETag 로 내보낸다
+    changes = [c for c in dataset.store.changes_since(since) if c["dataset_version"] <= version]
+    return encode({"dataset_version": version, "since": since, "changes": changes})
+
+
+def facets_body(dataset, loaded, params):
+    version, _, engine = loaded
+    key = ("facets", version)
+    body = dataset.bodies.get(key)
+    if body is None:
+        body = encode({
+            "dataset_version": version,
+            "regions": engine.regions(),
+            "subjects": engine.subjects.roots,
+            "badges": engine.badges(),
+            "sources": engine.sources(),
+        })
+        dataset.bodies.put(key, body)
+    return body
+
+
+def health_body(dataset, loaded, params):
+    version, df, _ = loaded
+    return encode({"status": "ok", "dataset_version": version, "rows": len(df)})
+
+
+ROUTES = {
+    "/api/postings": postings_body,
+    "/api/changes": changes_body,
+    "/api/facets": facets_body,
+    "/api/health": health_body,
+}
+
+
+def etag_for(version, params):
+    """같은 주소의 응답은 데이터 버전이 같으면 같다 (마감 기한 조건만 오늘 날짜에 따라 달라진다)"""
+    if _one(params, "closing_within"):
+        return f'"{version}-{datetime.date.today().isoformat()}"'
+    return f'"{version}"'
+
+
+def not_modified(header, etag):
+    """If-None-Match 목록에 etag 가 있는지 (약한 비교)"""
+    if not header:
+        return False
+    tags = [t.strip() for t in header.split(",")]
+    return "*" in tags or etag in tags or "W/" + etag in tags
+
+
+def make_handler(dataset):
+    class ApiHandler(BaseHTTPRequestHandler):
+        def _send(self, status, body=b"", etag=None, head=False):
+            self.send_response(status)
+            if status != 304:
+                self.send_header("Content-Type", "application/json; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+            if etag:
+                self.send_header("ETag", etag)
+                self.send_header("Cache-Control", "no-cache")
+            self.end_headers()
+            if status != 304 and not head:
+                self.wfile.write(body)
+
+        def _handle(self, head=False):
+            url = urlsplit(self.path)
+            route = ROUTES.get(url.path.rstrip("/"))
+            if route is None:
+                self._send(404, encode({"error": f"없는 경로: {url.path}"}), head=head)
+                return
+            # badge= (상태 없는 공고) 를 살리려고 빈 값도 남긴다
+            params = parse_qs(url.query, keep_blank_values=True)
+            try:
+                loaded = dataset.get()
+                etag = etag_for(loaded[0], params)
+                if not_modified(self.headers.get("If-None-Match"), etag):
+                    self._send(304, etag=etag, head=head)
+                    return
+                body = route(dataset, loaded, params)
+            except BadRequest as e:
+                self._send(400, encode({"error": str(e)}), head=head)
+                return
+            except Exception:
+                logger.exception("API 요청 처리 실패: %s", self.path)
+                self._send(500, encode({"error": "내부 오류"}), head=head)
+                return
+            self._send(200, body, etag=etag, head=head)
+
+        def do_GET(self):
+            self._handle()
+
+        def do_HEAD(self):
+            self._handle(head=True)
+
+        def log_message(self, format, *args):
+            logger.debug("%s - %s", self.address_string(), format % args)
+
+    # keep-alive 로 폴링 연결을 재사용하고, 헤더/본문 사이 Nagle 지연을 막는다
+    ApiHandler.protocol_version = "HTTP/1.1"
+    ApiHandler.disable_nagle_algorithm = True
+    return ApiHandler
+
+
+def start_server(store, host="127.0.0.1", port=0):
+    """백그라운드 스레드로 서버를 띄우고 (server, base_url) 반환"""
+    server = ThreadingHTTPServer((host, port), make_handler(Dataset(store)))
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://{host}:{server.server_address[1]}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="채용 공고 읽기 전용 JSON API")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8502)
+    parser.add_argument("--db", help="SQLite 저장소 경로 (기본: RECRUIT_DB 또는 recruit.db)")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+
+    store = open_store(args.db) if args.db else open_store()
+    dataset = Dataset(store)
+    dataset.get()
+    server = ThreadingHTTPServer((args.host, args.port), make_handler(dataset))
+    server.daemon_threads = True
+    print(f"조회 API 실행 중: http://{args.host}:{args.port}/api/postings")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
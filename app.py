@@ -1,299 +1,191 @@
 import streamlit as st
-import pandas as pd
+import datetime
 import json
 import os
-import re
+import threading
 import time
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.common.by import By
-from webdriver_manager.chrome import ChromeDriverManager
+
+# 화면에 필요한 모듈만 불러온다. 수집 모듈(requests/lxml/Selenium 등)은
+# 스케줄러 스레드 안에서만 불러와 첫 화면과 세션 메모리에 부담을 주지 않는다.
+from crawler import metrics, quality
+from crawler.dates import DATE_FIELDS
+from crawler.snapshot import ensure_snapshot, read_snapshot, to_dataframe
+from crawler.store import open_store
+from dashboard.changes import mark_seen, render_changes_since, render_subscriptions, seen_version
+from dashboard.detail_view import render_detail_list
+from dashboard.filters import FilterEngine
+from dashboard.health import render_crawl_health
 
 # ==========================================
-# 1. [크롤러 로직] Selenium 기능 함수화
+# 1. [크롤러 로직] 저장소 및 백그라운드 수집
 # ==========================================
-def setup_driver():
-    chrome_options = Options()
-    # Streamlit에서 실행 시 브라우저 창이 뜨지 않도록 Headless 모드 사용 권장
-    chrome_options.add_argument("--headless") 
-    chrome_options.add_argument("--no-sandbox")
-    chrome_options.add_argument("--disable-dev-shm-usage")
-    
-    driver = webdriver.Chrome(service=Service(ChromeDriverManager().install()), options=chrome_options)
-    return driver
-
-def get_data_with_post(driver, page_index=500):
-    url = "https://www.goe.go.kr/recruit/ad/func/pb/hnfpPbancList.do"
-    
-    payload = {
-        "mi": "10502",
-        "currPage": "1",
-        "srchEcptDl": "Y",
-        "srchTodayPb": "N",
-        "srchOcptNm": "기간제/사립교원",
-        "srchOcptCd": "A",
-        "pageIndex": str(page_index), # 가져올 게시물 수
-        "orderbyType": "reg",
-        "searchType": "sj"
-    }
-
-    driver.get(url)
-    time.sleep(1) # 페이지 로딩 대기
-
-    js_script = """
-    var form = document.createElement("form");
-    form.method = "POST";
-    form.action = arguments[0];
-    var params = arguments[1];
-
-    for (var key in params) {
-        if (params.hasOwnProperty(key)) {
-            var hiddenField = document.createElement("input");
-            hiddenField.type = "hidden";
-            hiddenField.name = key;
-            hiddenField.value = params[key];
-            form.appendChild(hiddenField);
-        }
-    }
-    document.body.appendChild(form);
-    form.submit();
+@st.cache_resource
+def get_store():
+    """SQLite 저장소 (처음 열 때 기존 recruit_list.json 을 한 번 가져온다)"""
+    return open_store()
+
+def _run_scheduler(store):
+    from crawler.scheduler import CrawlScheduler
+    CrawlScheduler(store).run()
+
+@st.cache_resource
+def start_scheduler():
+    """서버 프로세스당 하나만 뜨는 백그라운드 크롤링 스레드
+
+    CRAWL_SCHEDULER=external 이면 `python -m crawler schedule` 을 따로 띄운 것으로
+    보고 띄우지 않는다. 어느 쪽이든 새로고침 요청은 저장소에 남기면 스케줄러가
+    다음 확인(2초 간격) 때 가져간다.
     """
-    driver.execute_script(js_script, url, payload)
-    time.sleep(3) # 데이터 로딩 대기 (인터넷 속도에 따라 조절 필요)
-
-def parse_recruit_list(driver):
-    items = driver.find_elements(By.CSS_SELECTOR, ".recruit_list > ul > li")
-    results = []
-
-    for item in items:
-        try:
-            # 1. pbancSn 추출
-            anchor = item.find_element(By.TAG_NAME, "a")
-            href_value = anchor.get_attribute("href")
-            pbanc_sn_match = re.search(r"goView\('(\d+)'\)", href_value)
-            pbanc_sn = pbanc_sn_match.group(1) if pbanc_sn_match else ""
-
-            # 2. 상단 정보 추출
-            top_info = item.find_elements(By.CSS_SELECTOR, ".cont_top > span")
-            school = ""
-            phone = ""
-            reg_date = ""
-            
-            if top_info:
-                school = top_info[0].text.strip()
-                for span in top_info[1:]:
-                    text = span.text.strip()
-                    if "등록일" in text:
-                        reg_date = text.replace("등록일", "").replace(":", "").strip()
-                    elif "조회수" in text:
-                        continue
-                    else:
-                        phone = text
-
-            # 3. 제목 및 뱃지
-            title_area = item.find_element(By.CSS_SELECTOR, ".cont_tit")
-            badge_text = ""
-            badges = title_area.find_elements(By.CLASS_NAME, "krds-badge")
-            if badges:
-                badge_text = badges[0].text.strip()
-            
-            full_title = title_area.text.strip()
-            pure_title = full_title.replace(badge_text, "").strip()
-
-            # 4. 상세 정보
-            btm_groups = item.find_elements(By.CSS_SELECTOR, ".cont_btm > div")
-            group1_ps = btm_groups[0].find_elements(By.TAG_NAME, "p")
-            recruit_info = group1_ps[0].find_element(By.TAG_NAME, "span").text.strip()
-            recruit_count = group1_ps[1].text.replace("채용인원", "").strip()
-
-            group2_ps = btm_groups[1].find_elements(By.TAG_NAME, "p")
-            apply_period = group2_ps[0].text.replace("접수기간", "").strip()
-            work_period = group2_ps[1].text.replace("채용기간", "").strip()
-
-            job_field = item.find_element(By.CSS_SELECTOR, ".cont_btm > p").text.replace("직무분야", "").strip()
-
-            results.append({
-                "pbancSn": pbanc_sn,
-                "school": school,
-                "title": pure_title,
-                "badge": badge_text,
-                "job_field": job_field if job_field else "내용없음",
-                "recruit_info": recruit_info,
-                "recruit_count": recruit_count,
-                "apply_period": apply_period,
-                "work_period": work_period,
-                "phone": phone,
-                "reg_date": reg_date
-            })
-        except Exception:
-            continue
-    return results
-
-def crawl_and_save():
-    """실제 크롤링을 수행하고 파일을 저장하는 함수"""
-    driver = setup_driver()
-    try:
-        # 데이터 수집 (500개 기준)
-        get_data_with_post(driver, page_index=500)
-        final_data = parse_recruit_list(driver)
-        
-        # 파일 저장
-        file_name = "recruit_list.json"
-        with open(file_name, "w", encoding="utf-8") as f:
-            json.dump(final_data, f, ensure_ascii=False, indent=4)
-        
-        return len(final_data)
-    except Exception as e:
-        st.error(f"크롤링 중 에러가 발생했습니다: {e}")
-        return 0
-    finally:
-        driver.quit()
+    if os.environ.get("CRAWL_SCHEDULER", "thread") != "thread":
+        return None
+    thread = threading.Thread(target=_run_scheduler, args=(get_store(),), name="crawl-scheduler", daemon=True)
+    thread.start()
+    return thread
 
 # ==========================================
 # 2. [Streamlit UI] 페이지 설정 및 로직
 # ==========================================
 st.set_page_config(page_title="경기도교육청 채용 알림이", layout="wide")
 
-# --- 직무 정제 함수 ---
-def get_clean_tokens(text):
-    tokens = []
-    if not isinstance(text, str):
-        return tokens
-    parts = text.split(',')
-    for part in parts:
-        clean = re.sub(r'\(.*?\)|[0-9]+|명', '', part)
-        clean = re.sub(r'[^가-힣a-zA-Z]', '', clean)
-        if clean:
-            tokens.append(clean)
-    return tokens
-
-def extract_root_subjects(df):
-    all_tokens = set()
-    if df.empty or 'job_field' not in df.columns:
-        return []
-    for text in df['job_field']:
-        tokens = get_clean_tokens(text)
-        all_tokens.update(tokens)
-    sorted_tokens = sorted(list(all_tokens), key=len)
-    roots = []
-    for token in sorted_tokens:
-        is_covered = False
-        for root in roots:
-            if token.startswith(root):
-                is_covered = True
-                break
-        if not is_covered:
-            roots.append(token)
-    return sorted(roots)
+# --- 필터 엔진 (과목/검색 색인 포함) ---
+@st.cache_resource(max_entries=2)
+def get_filter_engine(version, _df):
+    """색인과 값별 마스크는 데이터셋 버전마다 한 번만 만들고 모든 세션이 함께 쓴다"""
+    with metrics.DASHBOARD.timer("dashboard.engine_build"):
+        return FilterEngine(_df, version)
 
 # --- 데이터 로드 함수 ---
-@st.cache_data
-def load_data():
-    file_path = "recruit_list.json"
-    if os.path.exists(file_path):
-        with open(file_path, "r", encoding="utf-8") as f:
-            try:
-                data = json.load(f)
-                df = pd.DataFrame(data)
-                
-                base_url = "https://www.goe.go.kr/recruit/ad/func/pb/hnfpPbancInfoView.do?pbancSn="
-                if not df.empty and 'pbancSn' in df.columns:
-                    df['원본링크'] = base_url + df['pbancSn']
-                
-                def get_region(info_text):
-                    if "|" in str(info_text):
-                        return str(info_text).split("|")[-1].strip()
-                    return "지역미기재"
-                
-                if not df.empty and 'recruit_info' in df.columns:
-                    df['region'] = df['recruit_info'].apply(get_region)
-                    
-                if not df.empty and 'job_field' in df.columns:
-                    df['job_field'] = df['job_field'].fillna("내용없음")
-                    df['job_field'] = df['job_field'].replace("", "내용없음")
-
-                return df
-            except json.JSONDecodeError:
-                return pd.DataFrame()
-    return pd.DataFrame()
+@st.cache_resource(max_entries=2)
+def load_data(version):
+    """(DataFrame, 스냅샷 버전). version 은 캐시 키로, 크롤링이 끝나 버전이 바뀌면 새로 읽는다
+
+    크롤러가 써 둔 Arrow 스냅샷을 memory-map 으로 연다. 원본링크/지역/날짜 열과
+    categorical 인코딩이 이미 들어 있어 여기서는 다시 계산하지 않는다.
+    cache_data 는 rerun 마다 결과를 직렬화해 복사하므로, 읽기 전용으로만 쓰는
+    DataFrame 하나를 모든 세션이 함께 쓰도록 cache_resource 에 둔다.
+    """
+    with metrics.DASHBOARD.timer("dashboard.load_data"):
+        path, version = ensure_snapshot(get_store(), version)
+        return to_dataframe(read_snapshot(path)), version
+
+# 마감일 선택지 → 오늘부터 며칠 안에 마감 (None 이면 조건 없음)
+CLOSING_OPTIONS = {"전체": None, "오늘 마감": 0, "3일 이내": 3, "7일 이내": 7, "14일 이내": 14}
+
+# 표에서 숨길 날짜 보조 열 (마감일만 보여 준다)
+HIDDEN_DATE_COLUMNS = {c: None for c in DATE_FIELDS if c != "apply_end"}
 
 # ==========================================
 # 3. 화면 구성 및 실행
 # ==========================================
 
 # 사이드바: 새로고침 버튼 (가장 위에 배치)
+store = get_store()
+start_scheduler()
+# 화면의 버전은 실제로 읽은 스냅샷의 버전 (필터 캐시와 변경 목록도 이 버전 기준)
+df, version = load_data(store.dataset_version())
+
 st.sidebar.header("⚙️ 데이터 관리")
 if st.sidebar.button("🔄 최신 공고 가져오기 (크롤링)"):
-    with st.spinner('경기도교육청 사이트에서 최신 공고를 가져오는 중입니다... (약 10~15초 소요)'):
-        # 크롤링 실행
-        count = crawl_and_save()
-        
-    if count > 0:
-        st.success(f"성공! {count}개의 공고를 업데이트했습니다.")
-        # 캐시 비우고 페이지 리로드
-        st.cache_data.clear()
-        time.sleep(1) # 사용자가 메시지를 볼 수 있게 잠시 대기
+    # 화면을 막지 않고 요청만 남긴다 (백그라운드 스케줄러가 수집)
+    store.request_refresh()
+    st.sidebar.info("새로고침을 요청했습니다. 수집이 끝나면 자동으로 반영됩니다.")
+
+@st.fragment(run_every=5)
+def crawl_status(shown_version):
+    """마지막 수집 상태 표시. 새 버전이 나오면 전체 화면을 다시 그린다"""
+    if store.dataset_version() != shown_version:
         st.rerun()
+
+    runs = store.recent_runs(1)
+    requested_at = store.refresh_requested_at()
+    if not runs:
+        st.caption("⏳ 새로고침 대기 중" if requested_at else "아직 수집 기록이 없습니다.")
+        return
+    last = runs[0]
+    started = time.strftime("%m/%d %H:%M", time.localtime(last["started_at"]))
+    if requested_at > last["started_at"]:
+        st.caption(f"⏳ 새로고침 대기 중 (마지막 수집 {started})")
+    elif last["status"] == "running":
+        st.caption(f"⏳ 수집 중... ({started} 시작)")
+    elif last["status"] == "ok":
+        st.caption(f"✅ 마지막 수집 {started} · 새 공고 {last['new_count']}건 · 데이터 버전 {shown_version}")
     else:
-        st.warning("데이터를 가져오지 못했거나 공고가 없습니다.")
+        st.caption(f"⚠️ {started} 수집 실패: {last['error']}")
 
-# 메인 로직 시작
-df = load_data()
+@st.fragment(run_every=30)
+def crawl_health():
+    """최근 크롤링 단계별 시간/카운터와 화면 쪽 로드/필터 시간"""
+    render_crawl_health(store.recent_runs(5), metrics.DASHBOARD.summary())
+    # 화면 쪽 메트릭은 크롤러와 따로 .dashboard.prom 에 쓴다
+    metrics.maybe_write_prometheus(metrics.metrics_paths(store.path)[2], metrics.DASHBOARD)
+
+with st.sidebar:
+    crawl_status(version)
+    with st.expander("🩺 크롤링 상태"):
+        crawl_health()
 
+# 메인 로직 시작
 st.title("🍎 경기도교육청 채용 공고 대시보드 (업데이트 성공!)")
 
+# 지난 방문(주소의 ?me= 방문자) 이후 새로 올라오거나 바뀐 공고
+render_changes_since(store, seen_version(store, version), version)
+mark_seen(store, version)
+
 if df.empty:
     st.warning("현재 저장된 데이터가 없습니다. 사이드바의 '최신 공고 가져오기' 버튼을 눌러주세요.")
 else:
     # --- 사이드바 필터 영역 ---
     st.sidebar.header("🔍 검색 및 필터")
     
-    search_term = st.sidebar.text_input("학교명 또는 제목 검색", "")
-    
-    unique_regions = sorted(df['region'].unique().tolist())
-    if "지역미기재" in unique_regions:
-        unique_regions.remove("지역미기재")
-        unique_regions.append("지역미기재")
-    selected_regions = st.sidebar.multiselect("지역 선택", unique_regions)
-    
-    subject_roots = extract_root_subjects(df)
-    selected_subjects = st.sidebar.multiselect("직무(과목) 선택", subject_roots)
+    engine = get_filter_engine(version, df)
 
-    badges = ["전체"] + sorted(df['badge'].unique().tolist())
+    search_term = st.sidebar.text_input("학교명 또는 제목 검색", "")
+    # 게시판이 둘 이상일 때만 게시판 선택지를 보여 준다
+    source_labels = json.loads(store.get_meta("source_labels", "{}"))
+    selected_sources = []
+    if len(engine.sources()) > 1:
+        selected_sources = st.sidebar.multiselect("게시판", engine.sources(),
+                                                  format_func=lambda s: source_labels.get(s, s))
+    selected_regions = st.sidebar.multiselect("지역 선택", engine.regions())
+    selected_subjects = st.sidebar.multiselect("직무(과목) 선택", engine.subjects.roots)
+
+    badges = ["전체"] + engine.badges()
     selected_badge = st.sidebar.selectbox("공고 상태", badges)
 
-    # 필터링
-    filtered_df = df.copy()
-
-    if search_term:
-        filtered_df = filtered_df[
-            filtered_df['school'].str.contains(search_term, na=False) | 
-            filtered_df['title'].str.contains(search_term, na=False)
-        ]
-    
-    if selected_regions:
-        filtered_df = filtered_df[filtered_df['region'].isin(selected_regions)]
-
-    if selected_subjects:
-        def check_subject_match(row_text):
-            row_tokens = get_clean_tokens(row_text)
-            for token in row_tokens:
-                for selected in selected_subjects:
-                    if token.startswith(selected):
-                        return True
-            return False
-        filtered_df = filtered_df[filtered_df['job_field'].apply(check_subject_match)]
-
-    if selected_badge != "전체":
-        filtered_df = filtered_df[filtered_df['badge'] == selected_badge]
+    today = datetime.date.today()
+    selected_closing = st.sidebar.selectbox("마감일", list(CLOSING_OPTIONS))
+    this_week_only = st.sidebar.checkbox("이번 주 등록 공고만")
+    work_starts_after = st.sidebar.date_input("근무 시작일 (이후)", value=None)
+
+    with st.sidebar.expander("🔔 구독 알림"):
+        render_subscriptions(store, version, selected_regions, selected_subjects)
+
+    # 필터링 (결과 행 위치는 세션 공용 캐시에서 재사용, 검색어가 있으면 관련도 순)
+    filters = dict(
+        search=search_term,
+        regions=selected_regions,
+        subjects=selected_subjects,
+        sources=selected_sources,
+        badge=None if selected_badge == "전체" else selected_badge,
+        closing_within=CLOSING_OPTIONS[selected_closing],
+        work_starts_after=work_starts_after,
+        registered_since=today - datetime.timedelta(days=today.weekday()) if this_week_only else None,
+        today=today,
+    )
+    with metrics.DASHBOARD.timer("dashboard.filter"):
+        filtered_rows = engine.query(**filters)
+    filtered_df = df.take(filtered_rows)
 
     # 요약 정보
     conditions = []
     if search_term: conditions.append(f"검색어: '{search_term}'")
     if selected_regions: conditions.append(f"지역: {', '.join(selected_regions)}")
     if selected_subjects: conditions.append(f"직무: {', '.join(selected_subjects)}")
+    if selected_sources: conditions.append(f"게시판: {', '.join(source_labels.get(s, s) for s in selected_sources)}")
     if selected_badge != "전체": conditions.append(f"상태: {selected_badge}")
+    if selected_closing != "전체": conditions.append(f"마감: {selected_closing}")
+    if this_week_only: conditions.append("이번 주 등록")
+    if work_starts_after: conditions.append(f"근무 시작: {work_starts_after} 이후")
 
     summary_text = " / ".join(conditions) if conditions else "전체 공고 조회 중"
     st.info(f"📋 **검색 조건:** {summary_text}")
@@ -309,55 +201,52 @@ else:
             "recruit_info": None,
             "recruit_count": None,
             "region": "지역",
+            "source": "게시판" if len(engine.sources()) > 1 else None,
             "school": "학교명",
             "title": "공고 제목",
             "job_field": "직무(과목)",
             "badge": "상태",
             "apply_period": "접수 기간",
             "reg_date": "등록일",
+            "apply_end": st.column_config.DateColumn("마감일", format="YYYY-MM-DD"),
+            **HIDDEN_DATE_COLUMNS,
+            "quality": None,
             "원본링크": st.column_config.LinkColumn("링크", display_text="공고 보기")
         }
     )
     
-    # 상세 보기 (Expander)
+    # 상세 보기 (Expander) — 현재 페이지의 공고만 그린다
     if len(filtered_df) > 0:
         with st.expander("🔽 상세 공고 리스트 열기/닫기", expanded=False):
-            for i, (index, row) in enumerate(filtered_df.iterrows()):
-                title_header = f"[{row['region']}] {row['school']} - {row['title']}"
-                if row['badge']: title_header += f" ({row['badge']})"
-                
-                st.markdown(f"#### {title_header}")
-                c1, c2, c3 = st.columns([2, 2, 1])
-                with c1:
-                    st.caption("상세정보")
-                    st.write(f"{row['recruit_info']}")
-                    st.write(f"**직무:** {row['job_field']}")
-                with c2:
-                    st.caption("일정")
-                    st.write(f"접수: {row['apply_period']}")
-                    st.write(f"채용: {row['work_period']}")
-                with c3:
-                    st.write("")
-                    st.link_button("공고 바로가기", row['원본링크'])
-                st.divider()
-
-    # 정보 누락 섹션
+            render_detail_list(df, engine, filtered_rows, filter_key=engine.normalize(**filters),
+                               details_loader=store.load_details)
+
+    # 정보 누락 섹션 (수집 시 계산해 둔 품질 검사 플래그로 고른다)
     st.markdown("---")
     st.subheader("🚨 정보 누락 및 분류 불가 공고 (Check List)")
-    
-    missing_condition = (df['region'] == "지역미기재") | (df['job_field'] == "내용없음")
-    missing_df = df[missing_condition].copy()
+
+    selected_rules = st.multiselect(
+        "검사 항목", [flag for flag, _ in quality.RULES],
+        default=[flag for flag, _ in quality.RULES if flag & quality.DEFAULT_CHECKS],
+        format_func=quality.LABELS.get,
+    )
+    rule_flags = 0
+    for flag in selected_rules:
+        rule_flags |= flag
+    missing_rows = engine.flagged(rule_flags)
 
     if search_term:
-        missing_df = missing_df[
-            missing_df['school'].str.contains(search_term, na=False) | 
-            missing_df['title'].str.contains(search_term, na=False)
-        ]
+        hit_mask = engine.row_mask(engine.query(search=search_term))
+        missing_rows = missing_rows[hit_mask[missing_rows]]
+    missing_df = df.take(missing_rows)
 
     if missing_df.empty:
         st.success("🎉 현재 데이터에는 정보가 누락된 공고가 없습니다.")
     else:
         st.error(f"총 **{len(missing_df)}** 건의 정보 불충분 공고가 발견되었습니다.")
+        # 공고마다 걸린 규칙 (선택한 검사 항목만)
+        missing_flags = engine.quality[missing_rows]
+        missing_df.insert(0, "문제", [", ".join(quality.describe(int(q) & rule_flags)) for q in missing_flags])
         st.dataframe(
             missing_df,
             use_container_width=True,
@@ -370,6 +259,17 @@ else:
                 "school": "학교명",
                 "title": "공고 제목",
                 "recruit_info": "상세정보",
+                "source": None,
+                "apply_end": None,
+                **HIDDEN_DATE_COLUMNS,
+                "quality": None,
                 "원본링크": st.column_config.LinkColumn("링크", display_text="확인하기")
             }
-        )
\ No newline at end of file
+        )
+
+        failed_sns = missing_df["pbancSn"][(missing_flags & quality.FLAG_PARSE_FAILED) > 0].tolist()
+        if failed_sns:
+            with st.expander(f"🧩 파싱 실패 원문 ({len(failed_sns)}건)"):
+                for sn, (reason, snippet) in store.load_parse_failures(failed_sns[:20]).items():
+                    st.markdown(f"**{sn}** · {reason}")
+                    st.code(snippet, language="html")
\ No newline at end of file
@@ -0,0 +1,332 @@
+"""단계별 시간/메모리 벤치마크
+
+크롬/네트워크 없이 가짜 레코드(benchmarks.synthetic)와 저장해 둔 목록 HTML
+(fixtures/)만으로 수집부터 화면 필터까지 각 단계를 잰다. 결과 JSON 을 커밋마다
+남겨 두고 compare 로 비교하면 느려진 단계를 찾을 수 있다.
+
+    python -m benchmarks.bench run --sizes 500 10000 100000 --out bench.json
+    python -m benchmarks.bench run --sizes 1000000 --stages tokens subject_index load_data query
+    python -m benchmarks.bench compare base.json bench.json --threshold 0.2
+
+단계마다 --repeat 번 재서 최소/중앙값을 기록하고, tracemalloc 으로 한 번 더
+돌려 파이썬 할당 최고치(peak_kib)를 남긴다.
+"""
+import argparse
+import datetime
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from benchmarks.synthetic import generate_listing_pages, generate_records
+
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "fixtures")
+DEFAULT_SIZES = [500, 10_000, 100_000]
+# 회귀로 볼 최소 차이(초). 이보다 작은 변화는 측정 잡음으로 본다
+MIN_DELTA = 0.001
+
+
+class Context:
+    """한 크기(size)의 측정에 쓰는 데이터. 필요한 것만 처음 쓸 때 만든다"""
+
+    def __init__(self, size, seed, workdir):
+        self.size = size
+        self.seed = seed
+        self.workdir = workdir
+        self._cache = {}
+
+    def _get(self, name, build):
+        if name not in self._cache:
+            self._cache[name] = build()
+        return self._cache[name]
+
+    @property
+    def records(self):
+        return self._get("records", lambda: generate_records(self.size, seed=self.seed))
+
+    @property
+    def store(self):
+        def build():
+            from crawler.store import PostingStore
+            store = PostingStore(os.path.join(self.workdir, "bench.db"))
+            store.publish(self.records)
+            return store
+        return self._get("store", build)
+
+    @property
+    def snapshot(self):
+        def build():
+            from crawler.snapshot import snapshot_path, write_snapshot
+            write_snapshot(self.store)
+            return snapshot_path(self.store.path)
+        return self._get("snapshot", build)
+
+    @property
+    def df(self):
+        def build():
+            from crawler.snapshot import read_snapshot, to_dataframe
+            return to_dataframe(read_snapshot(self.snapshot))
+        return self._get("df", build)
+
+    @property
+    def engine(self):
+        def build():
+            from dashboard.filters import FilterEngine, LRUCache
+            return FilterEngine(self.df, 1, LRUCache())
+        return self._get("engine", build)
+
+
+# --- 단계 ---
+# 각 단계는 ctx 를 받아 (준비가 끝난) 측정 대상 함수를 돌려준다.
+# 준비 시간은 재지 않는다.
+
+def stage_parse_fixture(ctx):
+    """저장해 둔 실제 목록 HTML 파싱 (크기와 무관)"""
+    from crawler.parser import parse_recruit_html
+    with open(os.path.join(FIXTURE_DIR, "hnfpPbancList.html"), "rb") as f:
+        html = f.read()
+    return lambda: parse_recruit_html(html)
+
+
+def stage_parse_html(ctx):
+    """500건 단위 목록 페이지들을 모두 파싱"""
+    from crawler.parser import parse_recruit_html
+    pages = [html.encode("utf-8") for _, html in generate_listing_pages(ctx.records)]
+    return lambda: [parse_recruit_html(page) for page in pages]
+
+
+def stage_normalize(ctx):
+    from crawler.store import normalize_record
+    records = ctx.records
+    return lambda: [normalize_record(r) for r in records]
+
+
+def stage_store_publish(ctx):
+    """빈 저장소에 전체 반영 (매번 새 파일)"""
+    from crawler.store import PostingStore
+    records = ctx.records
+    counter = iter(range(1_000_000))
+
+    def run():
+        PostingStore(os.path.join(ctx.workdir, f"publish_{next(counter)}.db")).publish(records)
+    return run
+
+
+def stage_snapshot_write(ctx):
+    from crawler.snapshot import write_snapshot
+    store = ctx.store
+    path = os.path.join(ctx.workdir, "bench_write.arrow")
+    return lambda: write_snapshot(store, path)
+
+
+def stage_load_data(ctx):
+    """스냅샷 memory-map → DataFrame (app.load_data 와 같은 경로)"""
+    from crawler.snapshot import read_snapshot, to_dataframe
+    path = ctx.snapshot
+    return lambda: to_dataframe(read_snapshot(path))
+
+
+def stage_tokens(ctx):
+    from dashboard.subjects import get_clean_tokens
+    job_fields = [r["job_field"] for r in ctx.records]
+    return lambda: [get_clean_tokens(text) for text in job_fields]
+
+
+def stage_subject_index(ctx):
+    from dashboard.subjects import SubjectIndex
+    job_fields = ctx.df["job_field"].tolist()
+    return lambda: SubjectIndex.build(job_fields)
+
+
+def stage_engine_build(ctx):
+    """필터 엔진(과목/검색/날짜 색인) 만들기"""
+    from dashboard.filters import FilterEngine, LRUCache
+    df = ctx.df
+    return lambda: FilterEngine(df, 1, LRUCache())
+
+
+def _sample_filters(engine):
+    """데이터에 실제로 있는 값으로 대표 질의 몇 개"""
+    regions = engine.regions()
+    roots = engine.subjects.roots
+    today = datetime.date(2026, 1, 3)
+    return [
+        {"regions": regions[:2]},
+        {"subjects": roots[:3]},
+        {"search": "기간제"},
+        {"search": "고등학교 채용"},
+        {"closing_within": 7, "today": today},
+        {"regions": regions[:3], "subjects": roots[:2], "badge": "마감임박", "search": "교사"},
+    ]
+
+
+def stage_query(ctx):
+    """대표 질의 묶음 (결과 캐시가 빈 상태)"""
+    from dashboard.filters import LRUCache
+    engine = ctx.engine
+    filters = _sample_filters(engine)
+
+    def run():
+        engine.cache = LRUCache()
+        return [engine.query(**f) for f in filters]
+    return run
+
+
+def stage_query_cached(ctx):
+    """같은 질의 묶음 (결과 캐시 적중)"""
+    engine = ctx.engine
+    filters = _sample_filters(engine)
+    for f in filters:
+        engine.query(**f)
+    return lambda: [engine.query(**f) for f in filters]
+
+
+def stage_sort(ctx):
+    """전체 결과를 정렬 기준마다 정렬 (열 순위는 미리 계산, 정렬 결과 캐시는 빈 상태)"""
+    import numpy as np
+    from dashboard.detail_view import SORT_OPTIONS, sort_rows
+    from dashboard.filters import LRUCache
+    engine = ctx.engine
+    rows = np.arange(engine.size, dtype=np.int64)
+    for spec in filter(None, SORT_OPTIONS.values()):
+        engine.sort_rank(*spec)
+
+    def run():
+        engine.cache = LRUCache()
+        return [sort_rows(engine, rows, (), name) for name in SORT_OPTIONS]
+    return run
+
+
+STAGES = {
+    "parse_fixture": stage_parse_fixture,
+    "parse_html": stage_parse_html,
+    "normalize": stage_normalize,
+    "store_publish": stage_store_publish,
+    "snapshot_write": stage_snapshot_write,
+    "load_data": stage_load_data,
+    "tokens": stage_tokens,
+    "subject_index": stage_subject_index,
+    "engine_build": stage_engine_build,
+    "query": stage_query,
+    "query_cached": stage_query_cached,
+    "sort": stage_sort,
+}
+
+
+def measure(fn, repeat, memory=True):
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - started)
+    result = {"repeat": repeat, "min_s": min(samples), "median_s": statistics.median(samples)}
+    if memory:
+        tracemalloc.start()
+        try:
+            fn()
+            result["peak_kib"] = tracemalloc.get_traced_memory()[1] // 1024
+        finally:
+            tracemalloc.stop()
+    return result
+
+
+def _git_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                              check=True, cwd=os.path.dirname(FIXTURE_DIR)).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run(sizes, stages, repeat, seed=0, memory=True):
+    import numpy
+    import pandas
+    import pyarrow
+
+    results = []
+    for size in sizes:
+        with tempfile.TemporaryDirectory() as workdir:
+            ctx = Context(size, seed, workdir)
+            for name in stages:
+                fn = STAGES[name](ctx)
+                result = {"stage": name, "size": size, **measure(fn, repeat, memory)}
+                results.append(result)
+                print(f"{size:>8} {name:<15} min {result['min_s'] * 1000:10.2f} ms  "
+                      f"median {result['median_s'] * 1000:10.2f} ms", file=sys.stderr)
+    return {
+        "meta": {
+            "commit": _git_commit(),
+            "created": datetime.datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "numpy": numpy.__version__,
+            "pandas": pandas.__version__,
+            "pyarrow": pyarrow.__version__,
+            "seed": seed,
+            "repeat": repeat,
+        },
+        "results": results,
+    }
+
+
+def compare(base, new, threshold):
+    """(stage, size) 별 중앙값 비율. 느려진 항목 목록을 돌려준다"""
+    base_by_key = {(r["stage"], r["size"]): r for r in base["results"]}
+    regressions = []
+    print(f"{'stage':<15} {'size':>8} {'base ms':>10} {'new ms':>10} {'ratio':>7}")
+    for r in new["results"]:
+        old = base_by_key.get((r["stage"], r["size"]))
+        if old is None:
+            continue
+        ratio = r["median_s"] / old["median_s"] if old["median_s"] else float("inf")
+        slower = ratio > 1 + threshold and r["median_s"] - old["median_s"] > MIN_DELTA
+        mark = "  <-- 느려짐" if slower else ""
+        print(f"{r['stage']:<15} {r['size']:>8} {old['median_s'] * 1000:10.2f} "
+              f"{r['median_s'] * 1000:10.2f} {ratio:7.2f}{mark}")
+        if slower:
+            regressions.append(r)
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="수집/대시보드 단계별 벤치마크")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = sub.add_parser("run", help="벤치마크 실행")
+    run_parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES)
+    run_parser.add_argument("--stages", nargs="+", choices=list(STAGES), default=list(STAGES))
+    run_parser.add_argument("--repeat", type=int, default=5)
+    run_parser.add_argument("--seed", type=int, default=0)
+    run_parser.add_argument("--no-memory", action="store_true", help="tracemalloc 측정 생략")
+    run_parser.add_argument("--out", metavar="PATH", help="결과 JSON 경로 (없으면 표준 출력)")
+
+    cmp_parser = sub.add_parser("compare", help="두 결과 JSON 비교 (느려진 단계가 있으면 종료 코드 1)")
+    cmp_parser.add_argument("base")
+    cmp_parser.add_argument("new")
+    cmp_parser.add_argument("--threshold", type=float, default=0.2, help="허용 비율 (0.2 = 20%%)")
+
+    args = parser.parse_args()
+    if args.command == "run":
+        report = run(args.sizes, args.stages, args.repeat, seed=args.seed, memory=not args.no_memory)
+        text = json.dumps(report, ensure_ascii=False, indent=2)
+        if args.out:
+            with open(args.out, "w", encoding="utf-8") as f:
+                f.write(text + "\n")
+        else:
+            print(text)
+    else:
+        with open(args.base, encoding="utf-8") as f:
+            base = json.load(f)
+        with open(args.new, encoding="utf-8") as f:
+            new = json.load(f)
+        if compare(base, new, args.threshold):
+            raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
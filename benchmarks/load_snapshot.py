@@ -0,0 +1,131 @@
+"""대시보드 데이터 로드(load_data) 콜드 스타트 비교
+
+recruit_list.json 을 복제해 500 / 10k / 100k 건 저장소를 만들고, 방식마다 새
+프로세스에서 한 번씩 읽어 걸린 시간과 늘어난 RSS 를 잰다.
+
+- json:   예전 방식 (JSON 파일 → DataFrame → 원본링크 문자열 연결 → 지역 apply)
+- sqlite: SQLite 조회 → DataFrame → categorical/날짜 변환
+- arrow:  크롤러가 써 둔 Arrow 스냅샷 memory-map
+
+    python -m benchmarks.load_snapshot --sizes 500 10000 100000
+"""
+import argparse
+import json
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+METHODS = ["json", "sqlite", "arrow"]
+DETAIL_URL = "https://www.goe.go.kr/recruit/ad/func/pb/hnfpPbancInfoView.do?pbancSn="
+
+
+def _rss_kb():
+    with open("/proc/self/statm") as f:
+        return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") // 1024
+
+
+def load_json(directory):
+    import pandas as pd
+    from crawler.store import get_region
+
+    with open(os.path.join(directory, "recruit_list.json"), encoding="utf-8") as f:
+        df = pd.DataFrame(json.load(f))
+    df['원본링크'] = DETAIL_URL + df['pbancSn'].astype(str)
+    df['region'] = df['recruit_info'].apply(get_region)
+    return df
+
+
+def load_sqlite(directory):
+    import pandas as pd
+    from crawler.dates import DATE_FIELDS
+    from crawler.store import ORDER_BY, RECORD_FIELDS, PostingStore
+
+    store = PostingStore(os.path.join(directory, "recruit.db"))
+    with store.connect() as conn:
+        df = pd.read_sql_query(f"SELECT {', '.join(RECORD_FIELDS + ['region'] + DATE_FIELDS)} "
+                               f"FROM postings ORDER BY {ORDER_BY}", conn)
+    df.insert(len(RECORD_FIELDS), '원본링크', DETAIL_URL + df['pbancSn'])
+    for column in ["region", "badge", "school", "job_field"]:
+        df[column] = df[column].astype("category")
+    for column in DATE_FIELDS:
+        df[column] = pd.to_datetime(df[column], format="%Y-%m-%d")
+    return df
+
+
+def load_arrow(directory):
+    from crawler.snapshot import read_snapshot, to_dataframe
+
+    return to_dataframe(read_snapshot(os.path.join(directory, "recruit.arrow")))
+
+
+def measure(method, directory):
+    """(자식 프로세스) 라이브러리 import 는 빼고 로드만 잰다"""
+    import pandas  # noqa: F401
+    import pyarrow  # noqa: F401
+    import crawler.snapshot  # noqa: F401
+    import crawler.store  # noqa: F401
+
+    loader = {"json": load_json, "sqlite": load_sqlite, "arrow": load_arrow}[method]
+    before = _rss_kb()
+    started = time.perf_counter()
+    df = loader(directory)
+    elapsed = time.perf_counter() - started
+    print(json.dumps({"rows": len(df), "seconds": elapsed, "rss_kb": _rss_kb() - before,
+                      "maxrss_kb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss}))
+
+
+def prepare(directory, size, source="recruit_list.json"):
+    """원본 공고를 공고번호만 바꿔 size 건으로 늘린 JSON/SQLite/Arrow 를 만든다"""
+    from crawler.snapshot import write_snapshot
+    from crawler.store import PostingStore, load_json_records, save_json_records
+
+    base = load_json_records(source)
+    records = []
+    for i in range(size):
+        record = dict(base[i % len(base)])
+        record["pbancSn"] = str(10_000_000 - i)
+        records.append(record)
+    save_json_records(records, os.path.join(directory, "recruit_list.json"))
+    store = PostingStore(os.path.join(directory, "recruit.db"))
+    store.publish(records)
+    write_snapshot(store)
+
+
+def run(sizes, repeat):
+    results = []
+    for size in sizes:
+        with tempfile.TemporaryDirectory() as directory:
+            prepare(directory, size)
+            for method in METHODS:
+                samples = []
+                for _ in range(repeat):
+                    out = subprocess.run(
+                        [sys.executable, "-m", "benchmarks.load_snapshot", "--measure", method, directory],
+                        check=True, capture_output=True, text=True,
+                    ).stdout
+                    samples.append(json.loads(out))
+                best = min(samples, key=lambda s: s["seconds"])
+                results.append({"size": size, "method": method, **best})
+                print(f"{size:>7} {method:<6} {best['seconds'] * 1000:9.1f} ms  +{best['rss_kb'] / 1024:7.1f} MiB",
+                      file=sys.stderr)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="load_data 콜드 스타트 벤치마크")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[500, 10_000, 100_000])
+    parser.add_argument("--repeat", type=int, default=3, help="방식별 반복 횟수 (가장 빠른 값 기록)")
+    parser.add_argument("--measure", nargs=2, metavar=("METHOD", "DIR"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.measure:
+        measure(*args.measure)
+        return
+    print(json.dumps(run(args.sizes, args.repeat), ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+"""벤치마크용 가짜 공고/목록 HTML 생성기
+
+recruit_list.json 의 필드 모양을 본떠 원하는 건수(500 ~ 1M)의 레코드를 만든다.
+같은 seed 면 항상 같은 결과가 나오므로 커밋 사이 측정값을 비교할 수 있다.
+
+- 지역은 "시급 경력무관 | 수원시" 형태, 약 10% 는 지역 없이 "시급 신입"
+- 직무는 과목 1~4개를 ",", ", ", "·" 로 잇고 "1명", "(세부전공 구분없음)" 같은
+  잡음을 섞는다. 약 5% 는 비어 있다(내용없음)
+- 상태는 마감임박 75% / 없음 19% / 오늘마감 6%
+- 채용기간은 대부분 "2026/03/01 ~ 2027/02/28", 약 10% 는 "~"
+
+    python -m benchmarks.synthetic --size 10000 --html fixtures/synthetic_10000.html
+"""
+import argparse
+import datetime
+import json
+import random
+
+from crawler.stub_server import render_listing_html
+
+REGIONS = [
+    "수원시", "성남시", "고양시", "용인시", "부천시", "안산시", "안양시", "남양주시",
+    "화성시", "평택시", "의정부시", "시흥시", "파주시", "김포시", "광명시", "광주시",
+    "군포시", "하남시", "오산시", "이천시", "안성시", "의왕시", "양주시", "구리시",
+    "포천시", "여주시", "동두천시", "과천시", "가평군", "양평군", "연천군",
+]
+SCHOOL_PREFIXES = [
+    "안산", "상원", "매향", "고양장항", "송우", "김포", "백석", "수원", "분당", "일산",
+    "청석", "한빛", "새솔", "푸른", "동탄", "광교", "운정", "별내", "다산", "한울",
+]
+SCHOOL_KINDS = ["초등학교", "중학교", "고등학교", "여자고등학교", "유치원", "외국어고등학교", "특수학교"]
+SUBJECTS = [
+    "국어", "영어", "수학", "물리", "화학", "생물", "지구과학", "공통과학", "통합과학",
+    "일반사회", "공통사회", "역사", "지리", "도덕.윤리", "음악", "미술", "체육", "정보",
+    "정보.컴퓨터", "기술", "가정", "상업", "보건", "보건교사", "영양", "특수", "전문상담",
+    "진로", "사서", "유아영어", "유아체육", "초등", "영어회화", "중국어", "일본어",
+]
+SUBJECT_NOISE = ["", "", "", " 1명", " 2명", "(세부전공 구분없음)", "(유사과목 지원 가능)", "(1년)"]
+TITLE_TEMPLATES = [
+    "{year}학년도 기간제교사 신규채용 공고",
+    "{year}학년도 기간제교사 신규채용 재공고",
+    "계약제 교원({subjects}) 채용 공고",
+    "{year}학년도 {school} {n}차 기간제교사 ({subjects}) 채용 공고",
+    "[{short}] {subject}과 기간제교원 채용 {n}차 공고",
+    "{school} 기간제교원({subject}) 채용 공고",
+]
+BADGES = ["마감임박"] * 75 + [""] * 19 + ["오늘마감"] * 6
+
+
+def _date(day):
+    return day.strftime("%Y/%m/%d")
+
+
+def _job_field(rng, subjects):
+    if rng.random() < 0.05:
+        return ""
+    parts = [s + rng.choice(SUBJECT_NOISE) for s in subjects]
+    text = rng.choice([",", ", ", "·"]).join(parts)
+    if len(parts) > 1 and rng.random() < 0.1:
+        text = f"{len(parts)}과목 / {text}"
+    return text
+
+
+def generate_records(size, seed=0, start_sn=30000, start_day=datetime.date(2026, 1, 3)):
+    """최신순(공고번호 내림차순) 레코드 size 건"""
+    rng = random.Random(seed)
+    records = []
+    for i in range(size):
+        short = rng.choice(SCHOOL_PREFIXES)
+        school = short + rng.choice(SCHOOL_KINDS)
+        subjects = rng.sample(SUBJECTS, rng.choice([1, 1, 1, 2, 2, 3, 4]))
+        # 하루에 수십 건씩 올라오는 게시판처럼 뒤로 갈수록 등록일이 이르다
+        reg_day = start_day - datetime.timedelta(days=i // 40)
+        apply_end = reg_day + datetime.timedelta(days=rng.randint(2, 10))
+        region = rng.choice(REGIONS)
+        recruit_info = "시급 신입" if rng.random() < 0.1 else f"시급 경력무관 | {region}"
+
+        if rng.random() < 0.1:
+            work_period = "~"
+        elif rng.random() < 0.8:
+            work_period = "2026/03/01 ~ 2027/02/28"
+        else:
+            work_start = apply_end + datetime.timedelta(days=rng.randint(1, 30))
+            work_period = f"{_date(work_start)} ~ {_date(work_start + datetime.timedelta(days=rng.randint(30, 365)))}"
+
+        title = rng.choice(TITLE_TEMPLATES).format(
+            year=reg_day.year, school=school, short=short[:2] + "고", n=rng.randint(1, 3),
+            subject=subjects[0], subjects=",".join(subjects),
+        )
+        records.append({
+            "pbancSn": str(start_sn + size - i),
+            "school": school,
+            "title": title,
+            "badge": rng.choice(BADGES),
+            "job_field": _job_field(rng, subjects) or "내용없음",
+            "recruit_info": recruit_info,
+            "recruit_count": str(max(1, len(subjects) + rng.choice([0, 0, 0, 1, 2]))),
+            "apply_period": f"{_date(reg_day)} ~ {_date(apply_end)}",
+            "work_period": work_period,
+            "phone": "" if rng.random() < 0.2 else f"031-{rng.randint(200, 999)}-{rng.randint(1000, 9999)}",
+            "reg_date": _date(reg_day),
+        })
+    return records
+
+
+def generate_listing_pages(records, page_size=500):
+    """(페이지 번호, 목록 HTML) 을 차례로 — 큰 건수에서도 한 페이지씩만 메모리에 둔다"""
+    for start in range(0, len(records), page_size):
+        yield start // page_size + 1, render_listing_html(records[start:start + page_size], total=len(records))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="가짜 공고 레코드/목록 HTML 생성")
+    parser.add_argument("--size", type=int, default=500)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", metavar="PATH", help="레코드를 JSON 으로 저장 (recruit_list.json 형식)")
+    parser.add_argument("--html", metavar="PATH", help="전체를 목록 페이지 HTML 하나로 저장")
+    args = parser.parse_args()
+
+    records = generate_records(args.size, seed=args.seed)
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(records, f, ensure_ascii=False, indent=4)
+    if args.html:
+        with open(args.html, "w", encoding="utf-8") as f:
+            f.write(render_listing_html(records))
+    if not args.json and not args.html:
+        print(json.dumps(records[:3], ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1 @@
+"""경기도교육청 채용 공고 크롤러 패키지"""
@@ -0,0 +1,217 @@
+"""Selenium 기반 목록 조회 (HTTP 백엔드가 실패했을 때의 대체 수단)
+
+크롤링마다 ChromeDriverManager().install() (버전 확인 네트워크 요청)과 Chrome
+실행/종료를 반복하면 몇 초씩 든다. 드라이버 경로는 프로세스당 한 번만
+찾고(CHROMEDRIVER_PATH 로 지정 가능), 띄운 브라우저는 DriverPool 에 두고
+빌려 쓴다. 빌릴 때 살아 있는지 확인하고, N번 쓰거나 에러가 나면 새로 띄운다.
+selenium 은 브라우저를 실제로 띄울 때 불러온다.
+
+    with get_pool().lease() as driver:
+        get_data_with_post(driver)
+"""
+import atexit
+import logging
+import os
+import threading
+from contextlib import contextmanager
+
+from crawler import metrics
+from crawler.http_fetch import BASE_URL, LIST_PATH, build_payload
+
+logger = logging.getLogger(__name__)
+
+# 동시에 띄워 둘 브라우저 수 / 한 브라우저를 몇 번 쓰고 새로 띄울지
+POOL_SIZE = int(os.environ.get("BROWSER_POOL_SIZE", "1"))
+MAX_USES = int(os.environ.get("BROWSER_MAX_USES", "20"))
+# 목록이 뜰 때까지 기다리는 최대 시간(초)
+PAGE_TIMEOUT = float(os.environ.get("BROWSER_PAGE_TIMEOUT", "15"))
+LIST_SELECTOR = ".recruit_list"
+
+_driver_path = os.environ.get("CHROMEDRIVER_PATH")
+_driver_path_lock = threading.Lock()
+
+
+def resolve_driver_path():
+    """chromedriver 경로 (처음 한 번만 webdriver_manager 로 찾고 이후엔 재사용)"""
+    global _driver_path
+    with _driver_path_lock:
+        if _driver_path is None:
+            from webdriver_manager.chrome import ChromeDriverManager
+            with metrics.timer("browser.driver_install"):
+                _driver_path = ChromeDriverManager().install()
+        return _driver_path
+
+
+def setup_driver(headless=True):
+    from selenium import webdriver
+    from selenium.webdriver.chrome.options import Options
+    from selenium.webdriver.chrome.service import Service
+
+    chrome_options = Options()
+    # Streamlit에서 실행 시 브라우저 창이 뜨지 않도록 Headless 모드 사용 권장
+    if headless:
+        chrome_options.add_argument("--headless")
+    chrome_options.add_argument("--no-sandbox")
+    chrome_options.add_argument("--disable-dev-shm-usage")
+
+    driver_path = resolve_driver_path()
+    with metrics.timer("browser.launch"):
+        driver = webdriver.Chrome(service=Service(driver_path), options=chrome_options)
+    return driver
+
+
+def get_data_with_post(driver, page_index=500, curr_page=1, timeout=PAGE_TIMEOUT):
+    """목록 페이지에 조회 조건을 POST 로 제출하고 새 목록이 뜰 때까지 기다린다
+
+    고정 시간만큼 자는 대신 목록 컨테이너가 나타나는 즉시 돌아온다.
+    timeout 안에 뜨지 않으면 selenium 의 TimeoutException 이 난다.
+    """
+    from selenium.webdriver.common.by import By
+    from selenium.webdriver.support import expected_conditions as EC
+    from selenium.webdriver.support.ui import WebDriverWait
+
+    url = BASE_URL + LIST_PATH
+    payload = build_payload(curr_page, page_index)
+
+    with metrics.timer("browser.page_load"):
+        # get 은 페이지 load 이벤트까지 기다린다
+        driver.get(url)
+        old_page = driver.find_element(By.TAG_NAME, "body")
+
+    js_script = """
+    var form = document.createElement("form");
+    form.method = "POST";
+    form.action = arguments[0];
+    var params = arguments[1];
+
+    for (var key in params) {
+        if (params.hasOwnProperty(key)) {
+            var hiddenField = document.createElement("input");
+            hiddenField.type = "hidden";
+            hiddenField.name = key;
+            hiddenField.value = params[key];
+            form.appendChild(hiddenField);
+        }
+    }
+    document.body.appendChild(form);
+    form.submit();
+    """
+    with metrics.timer("browser.submit"):
+        driver.execute_script(js_script, url, payload)
+        wait = WebDriverWait(driver, timeout)
+        # 제출 전 페이지에도 목록이 있으므로 그 문서가 사라진 뒤의 목록을 기다린다
+        wait.until(EC.staleness_of(old_page))
+        wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, LIST_SELECTOR)))
+
+
+def _quit(driver, reason):
+    metrics.incr("recruit_browser_recycled_total", reason=reason)
+    with metrics.timer("browser.quit"):
+        try:
+            driver.quit()
+        except Exception:
+            logger.warning("브라우저 종료 중 에러 (무시)", exc_info=True)
+
+
+def is_alive(driver):
+    """브라우저/드라이버 프로세스가 아직 명령을 받는지"""
+    try:
+        driver.execute_script("return 1")
+        return True
+    except Exception:
+        return False
+
+
+class DriverPool:
+    """띄워 둔 headless 브라우저를 빌려 주는 풀 (스레드 안전)
+
+    최대 size 개까지 띄우고, 모두 빌려 갔으면 반납될 때까지 기다린다.
+    """
+
+    def __init__(self, size=POOL_SIZE, max_uses=MAX_USES, headless=True):
+        self.size = size
+        self.max_uses = max_uses
+        self.headless = headless
+        self.idle = []        # [(driver, 사용 횟수)]
+        self.lock = threading.Lock()
+        self.slots = threading.BoundedSemaphore(size)
+        self.closed = False
+
+    def _launch(self):
+        metrics.incr("recruit_browser_launches_total")
+        return setup_driver(headless=self.headless)
+
+    def warm(self, count=None):
+        """브라우저를 미리 띄워 둔다 (첫 크롤링의 시작 비용을 없앤다)"""
+        count = min(self.size, count or self.size)
+        with self.lock:
+            missing = count - len(self.idle)
+        for _ in range(max(0, missing)):
+            with self.slots:
+                driver = self._launch()
+                with self.lock:
+                    self.idle.append((driver, 0))
+
+    def _checkout(self):
+        while True:
+            with self.lock:
+                if not self.idle:
+                    break
+                driver, uses = self.idle.pop()
+            if is_alive(driver):
+                return driver, uses
+            _quit(driver, "dead")
+        return self._launch(), 0
+
+    @contextmanager
+    def lease(self):
+        """브라우저 하나를 빌려 준다. 블록에서 에러가 나면 그 브라우저는 버린다"""
+        if self.closed:
+            raise RuntimeError("이미 닫힌 DriverPool 입니다.")
+        with metrics.timer("browser.lease_wait"):
+            self.slots.acquire()
+        try:
+            driver, uses = self._checkout()
+            try:
+                yield driver
+            except BaseException:
+                _quit(driver, "error")
+                raise
+            uses += 1
+            if uses >= self.max_uses or self.closed:
+                _quit(driver, "max_uses" if uses >= self.max_uses else "closed")
+            else:
+                with self.lock:
+                    self.idle.append((driver, uses))
+        finally:
+            self.slots.release()
+
+    def close(self):
+        self.closed = True
+        with self.lock:
+            idle, self.idle = self.idle, []
+        for driver, _ in idle:
+            _quit(driver, "closed")
+
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def get_pool():
+    """프로세스에서 함께 쓰는 DriverPool (처음 부를 때 만든다)"""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = DriverPool()
+            atexit.register(_pool.close)
+        return _pool
+
+
+def fetch_list_html_with_browser(page_index=500, curr_page=1):
+    """풀에서 빌린 브라우저로 목록을 조회하고 page_source 를 반환"""
+    with get_pool().lease() as driver:
+        get_data_with_post(driver, page_index=page_index, curr_page=curr_page)
+        html = driver.page_source
+    metrics.incr("recruit_bytes_fetched_total", len(html.encode("utf-8")), backend="browser")
+    return html
@@ -0,0 +1,85 @@
+"""크롤러 명령행 진입점
+
+    python -m crawler                 # 증분 수집 (예전 python tr.py)
+    python -m crawler crawl --full    # 게시판 전체 다시 수집
+    python -m crawler schedule        # 백그라운드 스케줄러 (주기 실행 + 새로고침 요청 처리)
+    python -m crawler export-json     # 저장소를 예전 형식(recruit_list.json)으로 내보내기
+
+하위 명령을 빼면 crawl 로 본다. 무거운 수집 모듈은 명령을 실행할 때 불러온다.
+"""
+import argparse
+import logging
+import sys
+
+from crawler.store import DATA_FILE, DB_FILE, open_store
+
+COMMANDS = ("crawl", "schedule", "export-json")
+
+
+def cmd_crawl(args):
+    from crawler.scheduler import run_crawl
+
+    # 항목 파싱 에러를 화면에 출력
+    logging.basicConfig(level=logging.WARNING, format="%(message)s")
+
+    store = open_store(args.db)
+    # --full 이면 게시판 전체, 아니면 이미 저장된 공고를 만날 때까지 최신 페이지만 수집
+    run = run_crawl(store, full=args.full, trigger="cli", wait_enrich=True)
+    if run is None:
+        raise SystemExit("다른 크롤링이 진행 중입니다. 잠시 후 다시 실행해 주세요.")
+    if run["status"] != "ok":
+        raise SystemExit(f"크롤링 중 에러가 발생했습니다: {run['error']}")
+
+    print(f"총 {run['total']}개의 데이터를 수집했습니다. (새 공고 {run['new_count']}건)")
+    print(f"결과가 '{args.db}' 저장소에 반영되었습니다. (데이터 버전 {run['dataset_version']})")
+    if args.export_json:
+        store.export_json(args.export_json)
+        print(f"'{args.export_json}' 파일로도 내보냈습니다.")
+
+
+def cmd_schedule(args):
+    from crawler.scheduler import DEFAULT_INTERVAL, FULL_INTERVAL, serve
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+    serve(open_store(args.db), interval=args.interval or DEFAULT_INTERVAL,
+          full_interval=args.full_interval or FULL_INTERVAL)
+
+
+def cmd_export_json(args):
+    store = open_store(args.db)
+    store.export_json(args.path)
+    print(f"{store.count()}건을 '{args.path}' 파일로 내보냈습니다.")
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="python -m crawler", description="경기도교육청 채용 공고 수집")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    crawl = sub.add_parser("crawl", help="공고 수집 (기본)")
+    crawl.add_argument("--full", action="store_true", help="저장된 목록을 무시하고 게시판 전체를 다시 수집")
+    crawl.add_argument("--db", default=DB_FILE, help="공고 저장소(SQLite) 경로")
+    crawl.add_argument("--export-json", nargs="?", const=DATA_FILE, metavar="PATH",
+                       help="수집 후 예전 형식(recruit_list.json)으로도 내보내기")
+    crawl.set_defaults(func=cmd_crawl)
+
+    schedule = sub.add_parser("schedule", help="주기 수집 스케줄러 실행")
+    schedule.add_argument("--db", default=DB_FILE, help="공고 저장소(SQLite) 경로")
+    schedule.add_argument("--interval", type=int, default=None, help="자동 크롤링 주기(초, 기본 CRAWL_INTERVAL 또는 1800)")
+    schedule.add_argument("--full-interval", type=int, default=None,
+                          help="내려간 공고까지 맞추는 전체 수집 주기(초, 기본 CRAWL_FULL_INTERVAL 또는 86400)")
+    schedule.set_defaults(func=cmd_schedule)
+
+    export = sub.add_parser("export-json", help="저장소를 예전 JSON 형식으로 내보내기")
+    export.add_argument("path", nargs="?", default=DATA_FILE)
+    export.add_argument("--db", default=DB_FILE, help="공고 저장소(SQLite) 경로")
+    export.set_defaults(func=cmd_export_json)
+    return parser
+
+
+def main(argv=None):
+    argv = list(sys.argv[1:] if argv is None else argv)
+    # 하위 명령 없이 옵션만 주면 crawl (예전 tr.py 사용법)
+    if not argv or (argv[0] not in COMMANDS and argv[0] not in ("-h", "--help")):
+        argv.insert(0, "crawl")
+    args = build_parser().parse_args(argv)
+    args.func(args)
@@ -0,0 +1,59 @@
+"""접수/채용 기간과 등록일 문자열을 날짜로 해석
+
+사이트는 기간을 "2026/01/03 ~ 2026/01/08", "2026/03/09 ~", "~" 같은 자유 형식
+문자열로 준다. 수집 시점에 한 번 해석해 ISO 날짜(YYYY-MM-DD)로 저장해 두면
+화면에서는 문자열을 다시 훑지 않고 날짜로 정렬/검색할 수 있다.
+"""
+import datetime
+import re
+
+_DATE_RE = re.compile(r"^\s*(\d{4})[./-](\d{1,2})[./-](\d{1,2})\.?\s*$")
+
+# 저장소에 추가로 두는 날짜 열 (모두 ISO 문자열 또는 None)
+DATE_FIELDS = ["apply_start", "apply_end", "work_start", "work_end", "reg_on"]
+
+
+def parse_date(text):
+    """"2026/01/03" → "2026-01-03". 비어 있으면 None, 형식이 틀리면 ValueError"""
+    if text is None or not str(text).strip():
+        return None
+    match = _DATE_RE.match(str(text))
+    if not match:
+        raise ValueError(f"날짜 형식이 아닙니다: {text!r}")
+    return datetime.date(*(int(g) for g in match.groups())).isoformat()
+
+
+def parse_period(text):
+    """"시작 ~ 끝" → (시작, 끝). 한쪽이 비어 있으면 그쪽은 None (열린 기간)
+
+    "~" 나 빈 문자열은 (None, None). 해석할 수 없으면 ValueError.
+    """
+    if text is None or not str(text).strip():
+        return None, None
+    text = str(text)
+    if "~" not in text:
+        # 기간이 아니라 날짜 하나만 있으면 그날 하루로 본다
+        day = parse_date(text)
+        return day, day
+    start, end = text.split("~", 1)
+    return parse_date(start), parse_date(end)
+
+
+def date_fields(record):
+    """레코드의 기간/등록일 문자열을 DATE_FIELDS 값으로 해석
+
+    해석하지 못한 값은 None 으로 두고, 실패한 원본 필드 이름을 함께 돌려준다.
+    """
+    values = dict.fromkeys(DATE_FIELDS)
+    failed = []
+    for field, (start_key, end_key) in (("apply_period", ("apply_start", "apply_end")),
+                                        ("work_period", ("work_start", "work_end"))):
+        try:
+            values[start_key], values[end_key] = parse_period(record.get(field))
+        except ValueError:
+            failed.append(field)
+    try:
+        values["reg_on"] = parse_date(record.get("reg_date"))
+    except ValueError:
+        failed.append("reg_date")
+    return values, failed
@@ -0,0 +1,157 @@
+"""공고 상세 페이지(hnfpPbancInfoView.do) 보강 수집
+
+목록에는 요약만 있어서 응시자격, 제출서류, 첨부파일, 본문은 상세 페이지에만
+있다. 새로 올라왔거나 목록 내용이 바뀐 공고만 골라 상세 페이지를 제한된
+스레드 풀로 동시에 받고(호스트별 요청 속도 제한은 목록 수집과 공유),
+파싱 결과를 공고번호 + 내용 해시(content_hash)로 캐시한다. 내용이 그대로인
+공고는 다시 받지 않는다.
+
+상세 페이지는 "라벨(th/dt) → 값(td/dd)" 표, 본문(.view_cont), 첨부파일 목록
+(.file_list 또는 fileDown 링크)으로 되어 있다고 보고, 라벨 글자로 필드를
+찾는다. 표 모양이 조금 달라도 라벨만 같으면 읽힌다.
+"""
+import logging
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urljoin
+
+import requests
+from lxml.cssselect import CSSSelector
+
+from crawler import http_fetch, metrics
+from crawler.pages import DEFAULT_RATE, get_host_limiter
+from crawler.parser import ItemParseError, element_text, parse_html_document
+from crawler.store import DETAIL_FIELDS, content_hash
+
+logger = logging.getLogger(__name__)
+
+# DETAIL_ENRICH=0 이면 상세 보강을 하지 않는다
+ENABLED = os.environ.get("DETAIL_ENRICH", "1") != "0"
+DETAIL_WORKERS = 4
+# 한 번의 크롤링에서 받을 상세 페이지 수 상한 (나머지는 다음 크롤링 때)
+DETAIL_MAX_PER_RUN = int(os.environ.get("DETAIL_MAX_PER_RUN", "100"))
+
+# 라벨에 들어 있는 글자 → 필드 (먼저 맞는 것)
+LABEL_FIELDS = [
+    ("자격", "qualifications"),
+    ("제출서류", "documents"),
+    ("서류", "documents"),
+    ("접수방법", "apply_method"),
+    ("접수 방법", "apply_method"),
+]
+
+SEL_LABEL_CELLS = CSSSelector("th, dt")
+SEL_BODY = CSSSelector(".view_cont, .board_view .cont, .view_content")
+SEL_FILE_LINKS = CSSSelector(".file_list a, .file a, a[href*='fileDown'], a[href*='download']")
+SEL_VIEW = CSSSelector(".board_view, .view_table, .view_cont")
+
+
+def _value_cell(label):
+    """th → 같은 줄의 td, dt → 바로 다음 dd"""
+    sibling = label.getnext()
+    while sibling is not None and sibling.tag not in ("td", "dd"):
+        sibling = sibling.getnext()
+    return sibling
+
+
+def parse_detail_html(html, base_url=None):
+    """상세 페이지 HTML → DETAIL_FIELDS dict. 상세 영역이 없으면 ItemParseError"""
+    doc = parse_html_document(html)
+    if not SEL_VIEW(doc):
+        raise ItemParseError("상세 영역(.board_view) 없음")
+
+    details = dict.fromkeys(DETAIL_FIELDS, "")
+    for label in SEL_LABEL_CELLS(doc):
+        text = element_text(label).replace(" ", "")
+        cell = _value_cell(label)
+        if cell is None:
+            continue
+        for keyword, field in LABEL_FIELDS:
+            if keyword.replace(" ", "") in text:
+                if not details[field]:
+                    details[field] = element_text(cell)
+                break
+
+    body = SEL_BODY(doc)
+    details["description"] = element_text(body[0]) if body else ""
+
+    attachments = []
+    seen = set()
+    for link in SEL_FILE_LINKS(doc):
+        href = link.get("href") or ""
+        if not href or href.startswith("#") or href in seen:
+            continue
+        seen.add(href)
+        attachments.append({"name": element_text(link) or href, "url": urljoin(base_url or http_fetch.BASE_URL, href)})
+    details["attachments"] = attachments
+    return details
+
+
+def fetch_detail(session, pbanc_sn, limiter, base_url=None):
+    """상세 페이지 하나를 받아 파싱"""
+    limiter.acquire()
+    html = http_fetch.fetch_detail_html(session=session, pbanc_sn=pbanc_sn, base_url=base_url)
+    with metrics.timer("detail.parse"):
+        return parse_detail_html(html, base_url=base_url)
+
+
+def pending_details(store, records):
+    """상세 캐시가 없거나 내용 해시가 달라진 (공고번호, 해시) 목록 (목록 순서)"""
+    cached = store.detail_hashes()
+    pending = []
+    for record in records:
+        sn = str(record.get("pbancSn") or "")
+        if not sn:
+            continue
+        digest = content_hash(record)
+        if cached.get(sn) != digest:
+            pending.append((sn, digest))
+    return pending
+
+
+def enrich_details(store, records, workers=DETAIL_WORKERS, rate=DEFAULT_RATE, session=None,
+                   base_url=None, max_items=DETAIL_MAX_PER_RUN):
+    """새로 올라왔거나 바뀐 공고의 상세 페이지를 받아 캐시에 반영
+
+    (받은 수, 캐시로 건너뛴 수, 실패 수) 를 반환한다. 네트워크 실패는 캐시하지
+    않아 다음 크롤링 때 다시 시도하고, 파싱 실패는 같은 내용이면 또 실패하므로
+    에러로 캐시한다.
+    """
+    pending = pending_details(store, records)
+    skipped = len(records) - len(pending)
+    metrics.incr("recruit_details_cached_total", skipped)
+    pending = pending[:max_items]
+    if not pending:
+        return 0, skipped, 0
+
+    own_session = session is None
+    if own_session:
+        session = http_fetch.create_session(pool_size=max(workers, 1))
+    limiter = get_host_limiter((base_url or http_fetch.BASE_URL), rate)
+
+    def work(item):
+        sn, digest = item
+        try:
+            details, error = fetch_detail(session, sn, limiter, base_url), None
+        except ItemParseError as e:
+            details, error = dict.fromkeys(DETAIL_FIELDS, ""), e.reason
+        except requests.RequestException as e:
+            metrics.incr("recruit_details_failed_total", reason=type(e).__name__)
+            logger.warning("상세 페이지 조회 실패 (%s): %s", sn, e)
+            return None
+        if error:
+            metrics.incr("recruit_details_failed_total", reason=error)
+        return {"pbancSn": sn, "content_hash": digest, "fetched_at": time.time(), "error": error, **details}
+
+    try:
+        with metrics.timer("crawl.enrich"), ThreadPoolExecutor(max_workers=workers) as pool:
+            rows = [row for row in pool.map(work, pending) if row is not None]
+    finally:
+        if own_session:
+            session.close()
+
+    store.save_details(rows)
+    fetched = sum(1 for r in rows if not r["error"])
+    metrics.incr("recruit_details_fetched_total", fetched)
+    return fetched, skipped, len(pending) - fetched
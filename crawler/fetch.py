@@ -0,0 +1,35 @@
+"""목록 HTML 조회 진입점 (HTTP 우선, 실패 시 Selenium 으로 대체)"""
+import os
+
+import requests
+
+from crawler.http_fetch import fetch_list_html, looks_like_list_page
+
+# "auto" : HTTP 로 먼저 시도하고 실패하면 브라우저 사용
+# "http" : HTTP 만 사용 / "browser" : 기존 Selenium 방식만 사용
+DEFAULT_BACKEND = os.environ.get("CRAWL_BACKEND", "auto")
+
+
+class FetchError(Exception):
+    """목록 페이지를 어떤 백엔드로도 가져오지 못했을 때"""
+
+
+def fetch_listing(curr_page=1, page_index=500, session=None, backend=None, base_url=None):
+    """목록 페이지 HTML 하나. backend 가 auto 면 HTTP 가 실패할 때만 브라우저로 받는다"""
+    backend = backend or DEFAULT_BACKEND
+    http_error = None
+
+    if backend in ("auto", "http"):
+        try:
+            html = fetch_list_html(session=session, curr_page=curr_page, page_index=page_index, base_url=base_url)
+            if looks_like_list_page(html):
+                return html
+            http_error = FetchError("응답에 공고 목록이 없습니다.")
+        except requests.RequestException as e:
+            http_error = e
+        if backend == "http":
+            raise FetchError(f"HTTP 조회 실패: {http_error}")
+
+    # Selenium 은 대체 수단일 때만 불러온다
+    from crawler.browser import fetch_list_html_with_browser
+    return fetch_list_html_with_browser(page_index=page_index, curr_page=curr_page)
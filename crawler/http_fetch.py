@@ -0,0 +1,114 @@
+"""브라우저 없이 채용 공고 목록을 가져오는 HTTP 백엔드
+
+hnfpPbancList.do 는 고정 payload 를 받는 평범한 form POST 이므로
+Chrome 을 띄우지 않고 requests 세션으로 바로 요청한다.
+"""
+import os
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from crawler import metrics
+
+# 로컬 대역 서버(crawler.stub_server)로 돌릴 때는 GOE_BASE_URL 로 주소를 바꾼다
+BASE_URL = os.environ.get("GOE_BASE_URL", "https://www.goe.go.kr")
+LIST_PATH = "/recruit/ad/func/pb/hnfpPbancList.do"
+DETAIL_PATH = "/recruit/ad/func/pb/hnfpPbancInfoView.do"
+
+# (연결, 응답) 타임아웃 초
+DEFAULT_TIMEOUT = (5, 30)
+
+USER_AGENT = (
+    "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 "
+    "(KHTML, like Gecko) Chrome/120.0 Safari/537.36"
+)
+
+
+def build_payload(curr_page=1, page_index=500):
+    """목록 조회 form 에 실어 보내는 값 (기간제/사립교원, 등록순)"""
+    return {
+        "mi": "10502",
+        "currPage": str(curr_page),
+        "srchEcptDl": "Y",
+        "srchTodayPb": "N",
+        "srchOcptNm": "기간제/사립교원",
+        "srchOcptCd": "A",
+        "pageIndex": str(page_index),  # 한 페이지에 가져올 게시물 수
+        "orderbyType": "reg",
+        "searchType": "sj",
+    }
+
+
+def create_session(retries=3, backoff=0.5, pool_size=8):
+    """재시도/커넥션 풀이 설정된 requests 세션 생성"""
+    retry = Retry(
+        total=retries,
+        connect=retries,
+        read=retries,
+        status=retries,
+        backoff_factor=backoff,
+        status_forcelist=(429, 500, 502, 503, 504),
+        # form POST 지만 조회 전용이라 재시도해도 안전하다
+        allowed_methods=frozenset(["GET", "POST"]),
+        respect_retry_after_header=True,
+    )
+    adapter = HTTPAdapter(max_retries=retry, pool_connections=pool_size, pool_maxsize=pool_size)
+
+    session = requests.Session()
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    session.headers.update({"User-Agent": USER_AGENT, "Accept-Language": "ko-KR,ko;q=0.9"})
+    return session
+
+
+def fetch_list_html(session=None, curr_page=1, page_index=500, base_url=None, timeout=DEFAULT_TIMEOUT,
+                    form=None, path=None):
+    """목록 페이지를 POST 로 요청하고 HTML 문자열을 반환
+
+    form 은 기본 payload 에 덮어쓸 값 (다른 직종/게시판), path 는 목록 경로.
+    """
+    own_session = session is None
+    if own_session:
+        session = create_session()
+    url = (base_url or BASE_URL) + (path or LIST_PATH)
+    payload = build_payload(curr_page, page_index)
+    payload.update(form or {})
+    try:
+        with metrics.timer("fetch.http"):
+            resp = session.post(
+                url,
+                data=payload,
+                headers={"Referer": url},
+                timeout=timeout,
+            )
+        # 어댑터(urllib3)가 조용히 재시도한 횟수
+        retries = getattr(resp.raw, "retries", None)
+        if retries is not None and retries.history:
+            metrics.incr("recruit_http_retries_total", len(retries.history))
+        metrics.incr("recruit_bytes_fetched_total", len(resp.content), backend="http")
+        resp.raise_for_status()
+        # 서버가 charset 을 빼먹는 경우가 있어 본문 기준으로 인코딩을 잡는다
+        if not resp.encoding or resp.encoding.lower() == "iso-8859-1":
+            resp.encoding = resp.apparent_encoding or "utf-8"
+        return resp.text
+    finally:
+        if own_session:
+            session.close()
+
+
+def fetch_detail_html(session, pbanc_sn, base_url=None, timeout=DEFAULT_TIMEOUT):
+    """공고 상세 페이지(GET ?pbancSn=...) HTML 문자열"""
+    url = (base_url or BASE_URL) + DETAIL_PATH
+    with metrics.timer("detail.fetch"):
+        resp = session.get(url, params={"pbancSn": pbanc_sn}, timeout=timeout)
+    metrics.incr("recruit_bytes_fetched_total", len(resp.content), backend="detail")
+    resp.raise_for_status()
+    if not resp.encoding or resp.encoding.lower() == "iso-8859-1":
+        resp.encoding = resp.apparent_encoding or "utf-8"
+    return resp.text
+
+
+def looks_like_list_page(html):
+    """응답이 실제 목록 페이지인지 (차단/오류 페이지가 아닌지) 간단히 확인"""
+    return bool(html) and "recruit_list" in html
@@ -0,0 +1,130 @@
+"""이미 알고 있는 pbancSn 에서 멈추는 증분 수집
+
+목록은 등록순(orderbyType=reg)이라 새 공고는 항상 앞 페이지에 나온다.
+앞에서부터 한 페이지씩 받다가 페이지 전체가 이미 아는 공고면 멈추고,
+새 공고만 기존 목록에 합친 뒤 나머지 진행 중 공고의 뱃지만 날짜로 다시 계산한다.
+"""
+import datetime
+
+from crawler import http_fetch, metrics
+from crawler.dates import parse_period
+from crawler.fetch import DEFAULT_BACKEND, FetchError
+from crawler.pages import DEFAULT_RATE, crawl_listing, fetch_page, get_host_limiter
+from crawler.sources import GOE
+
+# 평소 새로고침은 새 공고 몇 건이면 충분하므로 작은 페이지로 받는다
+INCREMENTAL_PAGE_SIZE = 20
+MAX_INCREMENTAL_PAGES = 50
+
+# 사이트 기준: 마감일이 오늘이면 "오늘마감", 1~5일 남으면 "마감임박"
+CLOSING_SOON_DAYS = 5
+
+def apply_end_date(apply_period):
+    """"2026/01/03 ~ 2026/01/08" 의 마감일. 마감일이 없거나 해석할 수 없으면 None"""
+    try:
+        _, end = parse_period(apply_period)
+    except ValueError:
+        return None
+    return datetime.date.fromisoformat(end) if end else None
+
+
+def badge_for(record, today):
+    """마감일로 계산한 뱃지. 이미 마감된 공고는 None"""
+    end = apply_end_date(record.get("apply_period"))
+    if end is None:
+        return record.get("badge", "")
+    days_left = (end - today).days
+    if days_left < 0:
+        return None
+    if days_left == 0:
+        return "오늘마감"
+    if days_left <= CLOSING_SOON_DAYS:
+        return "마감임박"
+    return ""
+
+
+def crawl_new_pages(known_sns, page_size=INCREMENTAL_PAGE_SIZE, session=None, base_url=None,
+                    rate=DEFAULT_RATE, max_pages=MAX_INCREMENTAL_PAGES, source=GOE):
+    """최신 페이지부터 받아 이미 아는 공고로만 채워진 페이지에서 멈춘다
+
+    받은 레코드 전체(새 공고 + 같은 페이지에 있던 기존 공고)를 반환한다.
+    """
+    own_session = session is None
+    if own_session:
+        session = http_fetch.create_session(pool_size=1)
+    limiter = get_host_limiter((base_url or source.base_url), rate)
+
+    fetched = []
+    try:
+        for curr_page in range(1, max_pages + 1):
+            records = fetch_page(session, curr_page, page_size, limiter, base_url, source=source)
+            fetched.extend(records)
+            if len(records) < page_size:
+                break
+            if all(r.get("pbancSn") in known_sns for r in records):
+                break
+    finally:
+        if own_session:
+            session.close()
+    return fetched
+
+
+def merge_incremental(existing, fetched, today=None):
+    """새로 받은 레코드를 기존 목록에 합치고 진행 중 공고의 뱃지를 갱신
+
+    (합친 목록, 새 공고 목록) 을 반환한다. 이번에 받은 레코드는 사이트 값을
+    그대로 쓰고, 받지 않은 기존 공고는 마감일로 뱃지를 다시 매기며 마감이
+    지난 공고는 목록에서 뺀다 (전체 수집도 마감 공고는 받지 않는다).
+    파싱 실패 항목은 마감일을 모르므로 이번에 다시 받은 것만 남긴다.
+    """
+    today = today or datetime.date.today()
+    known = {r.get("pbancSn") for r in existing}
+
+    fresh = {}
+    new_records = []
+    for record in fetched:
+        sn = record.get("pbancSn")
+        if sn in fresh:
+            continue
+        fresh[sn] = record
+        if sn not in known:
+            new_records.append(record)
+
+    merged = list(new_records)
+    for record in existing:
+        sn = record.get("pbancSn")
+        if sn in fresh:
+            merged.append(fresh[sn])
+            continue
+        if record.get("parse_error"):
+            continue
+        badge = badge_for(record, today)
+        if badge is None:
+            continue
+        if badge != record.get("badge"):
+            record = dict(record, badge=badge)
+        merged.append(record)
+    return merged, new_records
+
+
+def update_incremental(existing, backend=None, today=None, source=GOE, rate=DEFAULT_RATE, **kwargs):
+    """기존 목록에 증분 수집 결과를 반영해 (합친 목록, 새 공고 목록) 반환
+
+    저장된 목록이 없거나 HTTP 수집이 안 되면 전체 수집으로 대신한다.
+    """
+    backend = backend or DEFAULT_BACKEND
+    if not existing or backend == "browser":
+        records = crawl_listing(backend=backend, source=source, rate=rate)
+        return records, records
+
+    try:
+        with metrics.timer("crawl.incremental_pages"):
+            fetched = crawl_new_pages({r.get("pbancSn") for r in existing}, source=source, rate=rate, **kwargs)
+    except FetchError:
+        if backend == "http":
+            raise
+        records = crawl_listing(backend=backend, source=source, rate=rate)
+        known = {r.get("pbancSn") for r in existing}
+        return records, [r for r in records if r.get("pbancSn") not in known]
+    with metrics.timer("crawl.merge"):
+        return merge_incremental(existing, fetched, today=today)
@@ -0,0 +1,220 @@
+"""크롤링 단계별 시간/카운터 수집
+
+크롤러 곳곳에서 timer("parse"), incr("recruit_items_parsed_total", n) 처럼
+부르면 프로세스 누적값(CRAWLER)과 지금 돌고 있는 크롤링 한 번의 값에 함께
+쌓인다. 크롤링이 끝나면 실행 기록(crawl_runs.metrics)과 구조화 로그
+(JSON 한 줄), Prometheus 텍스트 파일(node_exporter textfile collector 형식)로
+내보낸다. 대시보드 쪽 로드/필터 시간은 DASHBOARD 에 따로 쌓는다.
+
+카운터 이름은 Prometheus 이름 그대로 쓴다.
+
+- recruit_items_parsed_total            파싱한 공고 수
+- recruit_items_skipped_total{reason}   파싱에 실패한 <li> 수 (사유별, 원문 일부와 함께 저장)
+- recruit_bytes_fetched_total{backend}  받은 목록 HTML 크기
+- recruit_http_retries_total            urllib3 재시도 횟수
+- recruit_page_retries_total            페이지 단위 재시도 횟수
+- recruit_changes_total{kind}          이전 반영과 비교한 변경 수 (new/changed/closed)
+- recruit_source_errors_total{source}   수집에 실패한 게시판
+"""
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+
+logger = logging.getLogger(__name__)
+
+
+def _series(name, labels):
+    if not labels:
+        return name
+    inner = ",".join(f'{k}="{_escape(v)}"' for k, v in sorted(labels.items()))
+    return f"{name}{{{inner}}}"
+
+
+def _escape(value):
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+class Metrics:
+    """단계별 소요 시간과 카운터 (스레드 안전)"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.timings = {}    # 단계 → [횟수, 합계, 최대, 마지막]
+        self.counters = {}   # (이름, ((라벨, 값), ...)) → 값
+
+    def observe(self, stage, seconds):
+        with self.lock:
+            timing = self.timings.setdefault(stage, [0, 0.0, 0.0, 0.0])
+            timing[0] += 1
+            timing[1] += seconds
+            timing[2] = max(timing[2], seconds)
+            timing[3] = seconds
+
+    @contextmanager
+    def timer(self, stage):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(stage, time.perf_counter() - started)
+
+    def incr(self, name, value=1, **labels):
+        key = (name, tuple(sorted(labels.items())))
+        with self.lock:
+            self.counters[key] = self.counters.get(key, 0) + value
+
+    def state(self):
+        """다른 프로세스로 넘겨 merge() 할 수 있는 값 (pickle 가능)"""
+        with self.lock:
+            return {k: list(v) for k, v in self.timings.items()}, dict(self.counters)
+
+    def merge(self, state):
+        """다른 프로세스에서 쌓은 state() 를 더한다"""
+        timings, counters = state
+        with self.lock:
+            for stage, (count, total, peak, last) in timings.items():
+                timing = self.timings.setdefault(stage, [0, 0.0, 0.0, 0.0])
+                timing[0] += count
+                timing[1] += total
+                timing[2] = max(timing[2], peak)
+                timing[3] = last
+            for key, value in counters.items():
+                self.counters[key] = self.counters.get(key, 0) + value
+
+    def summary(self):
+        """JSON 으로 남길 수 있는 dict"""
+        with self.lock:
+            return {
+                "timings": {
+                    stage: {"count": c, "total_s": round(t, 6), "max_s": round(m, 6), "last_s": round(last, 6)}
+                    for stage, (c, t, m, last) in sorted(self.timings.items())
+                },
+                "counters": {_series(name, dict(labels)): v for (name, labels), v in sorted(self.counters.items())},
+            }
+
+    def prometheus_text(self, gauges=None):
+        """Prometheus 텍스트 노출 형식"""
+        with self.lock:
+            timings = sorted(self.timings.items())
+            counters = sorted(self.counters.items())
+        lines = [
+            "# HELP recruit_stage_seconds 단계별 소요 시간(초)",
+            "# TYPE recruit_stage_seconds summary",
+        ]
+        for stage, (count, total, _, _) in timings:
+            lines.append(f'recruit_stage_seconds_sum{{stage="{_escape(stage)}"}} {total:.6f}')
+            lines.append(f'recruit_stage_seconds_count{{stage="{_escape(stage)}"}} {count}')
+        typed = set()
+        for (name, labels), value in counters:
+            if name not in typed:
+                typed.add(name)
+                lines.append(f"# TYPE {name} counter")
+            lines.append(f"{_series(name, dict(labels))} {value}")
+        for name, value in sorted((gauges or {}).items()):
+            lines.append(f"# TYPE {name} gauge")
+            lines.append(f"{name} {value}")
+        return "\n".join(lines) + "\n"
+
+
+# 크롤러 프로세스 누적값 / 대시보드 누적값
+CRAWLER = Metrics()
+DASHBOARD = Metrics()
+
+# 지금 돌고 있는 크롤링 한 번의 값 (크롤링은 single-flight 라 하나뿐)
+_run = None
+
+
+def start_run():
+    global _run
+    _run = Metrics()
+    return _run
+
+
+def end_run():
+    global _run
+    run, _run = _run, None
+    return run
+
+
+def observe(stage, seconds):
+    CRAWLER.observe(stage, seconds)
+    run = _run
+    if run is not None:
+        run.observe(stage, seconds)
+
+
+@contextmanager
+def timer(stage):
+    """크롤러 단계 소요 시간 (누적값과 현재 실행 값에 함께 기록)"""
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        observe(stage, time.perf_counter() - started)
+
+
+def incr(name, value=1, **labels):
+    CRAWLER.incr(name, value, **labels)
+    run = _run
+    if run is not None:
+        run.incr(name, value, **labels)
+
+
+def merge(state):
+    """게시판별 수집 프로세스의 값을 누적값과 현재 실행 값에 더한다"""
+    CRAWLER.merge(state)
+    run = _run
+    if run is not None:
+        run.merge(state)
+
+
+# --- 내보내기 ---
+def metrics_paths(db_path):
+    """저장소 경로 기준 (구조화 로그, 크롤러 .prom, 대시보드 .prom) 경로"""
+    base = os.path.splitext(db_path)[0]
+    return base + ".metrics.jsonl", base + ".prom", base + ".dashboard.prom"
+
+
+def log_event(path, event, **fields):
+    """구조화 로그: JSON 한 줄을 로거와 파일(path)에 남긴다"""
+    line = json.dumps({"ts": round(time.time(), 3), "event": event, **fields}, ensure_ascii=False)
+    logger.info(line)
+    if path:
+        try:
+            with open(path, "a", encoding="utf-8") as f:
+                f.write(line + "\n")
+        except OSError:
+            logger.exception("구조화 로그를 쓰지 못했습니다: %s", path)
+
+
+def write_prometheus(path, registry=CRAWLER, gauges=None):
+    """임시 파일에 쓴 뒤 교체 (수집기가 반쯤 쓰인 파일을 읽지 않게)"""
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(prefix=".recruit_", suffix=".prom", dir=directory)
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(registry.prometheus_text(gauges))
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+_last_written = {}
+
+
+def maybe_write_prometheus(path, registry, interval=30.0, gauges=None):
+    """interval 초에 한 번만 쓴다 (화면 갱신마다 파일을 쓰지 않도록)"""
+    now = time.monotonic()
+    if now - _last_written.get(path, float("-inf")) < interval:
+        return False
+    _last_written[path] = now
+    try:
+        write_prometheus(path, registry, gauges)
+    except OSError:
+        logger.exception("메트릭 파일을 쓰지 못했습니다: %s", path)
+    return True
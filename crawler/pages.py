@@ -0,0 +1,169 @@
+"""currPage 를 넘기며 전체 목록을 병렬로 수집하는 크롤러
+
+pageIndex=500 한 페이지로 받으면 500건 이후 공고가 빠지고 서버도 큰 페이지를
+한 번에 그려야 한다. 여기서는 적당한 크기의 페이지를 제한된 워커 풀로 동시에
+요청하고(호스트별 요청 속도 제한, 재시도/백오프 포함) pbancSn 기준으로 합친다.
+어느 게시판을 어떻게 받고 파싱할지는 source(crawler.sources.Source)가 정한다.
+"""
+import random
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from urllib.parse import urlsplit
+
+import requests
+
+from crawler import http_fetch, metrics
+from crawler.fetch import DEFAULT_BACKEND, FetchError, fetch_listing
+from crawler.sources import GOE
+
+DEFAULT_PAGE_SIZE = 100
+DEFAULT_WORKERS = 4
+# 호스트 하나에 보내는 초당 요청 수 상한
+DEFAULT_RATE = 4.0
+# 게시판이 비정상적으로 끝나지 않을 때를 대비한 안전장치
+MAX_PAGES = 1000
+
+
+class RateLimiter:
+    """토큰 버킷 방식의 요청 속도 제한 (스레드 안전)"""
+
+    def __init__(self, rate, burst=None):
+        self.rate = float(rate)
+        self.capacity = float(burst if burst is not None else max(1.0, rate))
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait_for = (1 - self.tokens) / self.rate
+            time.sleep(wait_for)
+
+
+_host_limiters = {}
+_host_limiters_lock = threading.Lock()
+
+
+def get_host_limiter(url, rate=DEFAULT_RATE):
+    """같은 호스트로 가는 요청은 프로세스 안에서 하나의 제한기를 공유한다
+
+    제한기는 호스트별로 처음 만들 때의 rate 를 계속 쓴다.
+    """
+    host = urlsplit(url).netloc
+    with _host_limiters_lock:
+        limiter = _host_limiters.get(host)
+        if limiter is None:
+            limiter = _host_limiters[host] = RateLimiter(rate)
+        return limiter
+
+
+def fetch_page(session, curr_page, page_size, limiter, base_url=None, retries=3, backoff=0.5, source=GOE):
+    """한 페이지를 받아 파싱. 네트워크 오류는 지수 백오프로 재시도한다"""
+    for attempt in range(retries + 1):
+        limiter.acquire()
+        try:
+            html = source.fetch_list_html(session, curr_page, page_size, base_url=base_url)
+            if not source.looks_like_list_page(html):
+                raise FetchError(f"{curr_page} 페이지 응답에 공고 목록이 없습니다.")
+            return source.parse(html)
+        except (requests.RequestException, FetchError) as e:
+            if attempt == retries:
+                raise FetchError(f"{curr_page} 페이지 조회 실패: {e}") from e
+            metrics.incr("recruit_page_retries_total")
+            time.sleep(backoff * (2 ** attempt) + random.uniform(0, backoff))
+
+
+def merge_pages(pages):
+    """페이지 순서대로 이어 붙이고 pbancSn 중복을 제거 (먼저 나온 쪽 유지)
+
+    수집 도중 새 공고가 올라오면 뒤 페이지로 밀린 공고가 두 번 보일 수 있다.
+    """
+    seen = set()
+    merged = []
+    for page_no in sorted(pages):
+        for record in pages[page_no]:
+            sn = record.get("pbancSn")
+            if sn:
+                if sn in seen:
+                    continue
+                seen.add(sn)
+            merged.append(record)
+    return merged
+
+
+def crawl_all_pages(page_size=DEFAULT_PAGE_SIZE, workers=DEFAULT_WORKERS, rate=DEFAULT_RATE,
+                    session=None, base_url=None, max_pages=MAX_PAGES, source=GOE):
+    """게시판 끝까지 모든 페이지를 수집해 중복 없는 공고 목록을 반환
+
+    워커 수만큼 페이지를 미리 띄워 두고, 꽉 찬 페이지가 돌아올 때마다 다음
+    페이지를 이어서 요청한다. page_size 보다 적게 돌아온 페이지가 마지막이다.
+    """
+    own_session = session is None
+    if own_session:
+        session = http_fetch.create_session(pool_size=max(workers, 1))
+    limiter = get_host_limiter((base_url or source.base_url), rate)
+
+    pages = {}
+    last_page = None
+    next_page = 1
+    try:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            running = {}
+
+            def submit(page_no):
+                future = pool.submit(fetch_page, session, page_no, page_size, limiter, base_url, source=source)
+                running[future] = page_no
+
+            while next_page <= min(workers, max_pages):
+                submit(next_page)
+                next_page += 1
+
+            while running:
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    page_no = running.pop(future)
+                    records = future.result()
+                    if last_page is not None and page_no > last_page:
+                        continue
+                    pages[page_no] = records
+                    if len(records) < page_size:
+                        last_page = page_no if last_page is None else min(last_page, page_no)
+
+                # 마지막 페이지를 아직 못 봤으면 빈 워커 수만큼 다음 페이지 요청
+                while last_page is None and next_page <= max_pages and len(running) < workers:
+                    submit(next_page)
+                    next_page += 1
+    finally:
+        if own_session:
+            session.close()
+
+    if last_page is not None:
+        pages = {no: recs for no, recs in pages.items() if no <= last_page}
+    return merge_pages(pages)
+
+
+def crawl_listing(backend=None, source=GOE, **kwargs):
+    """설정된 백엔드로 전체 목록을 수집
+
+    HTTP 로는 페이지 단위 병렬 수집을 하고, 브라우저만 쓰도록 설정했거나
+    (auto 일 때) HTTP 가 실패하면 기존처럼 한 페이지(500건)를 Selenium 으로 받는다.
+    브라우저 대체 수집은 그것을 지원하는 게시판(source.browser)만 한다.
+    """
+    backend = backend or DEFAULT_BACKEND
+    if backend != "browser" or not source.browser:
+        try:
+            with metrics.timer("crawl.pages"):
+                return crawl_all_pages(source=source, **kwargs)
+        except FetchError:
+            if backend == "http" or not source.browser:
+                raise
+    with metrics.timer("crawl.browser"):
+        return source.parse(fetch_listing(page_index=500, backend="browser"))
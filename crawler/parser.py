@@ -0,0 +1,234 @@
+"""목록 페이지 HTML 을 한 번에 파싱해 공고 레코드로 변환
+
+예전에는 <li> 하나마다 WebDriver 호출(find_element, .text, get_attribute)을
+15번 가량 보냈다. 여기서는 page_source 를 한 번 받아 lxml 로 파싱하고,
+미리 컴파일한 셀렉터로 필드를 뽑는다. 결과는 기존 Selenium 파서와 같다.
+"""
+import hashlib
+import logging
+import re
+
+import lxml.html
+from lxml.cssselect import CSSSelector
+
+from crawler import metrics
+from crawler.quality import INVALID_SN_PREFIX
+
+logger = logging.getLogger(__name__)
+
+# 셀렉터는 모듈 로드 시 한 번만 XPath 로 컴파일해 둔다
+SEL_ITEMS = CSSSelector(".recruit_list > ul > li")
+SEL_TOP_SPANS = CSSSelector(".cont_top > span")
+SEL_TITLE = CSSSelector(".cont_tit")
+SEL_BADGE = CSSSelector(".krds-badge")
+SEL_BTM_GROUPS = CSSSelector(".cont_btm > div")
+SEL_JOB_FIELD = CSSSelector(".cont_btm > p")
+
+PBANC_SN_RE = re.compile(r"goView\('(\d+)'\)")
+VIEW_COUNT_RE = re.compile(r"조회수\s*:?\s*[\d,]+")
+
+# 파싱에 실패한 항목도 버리지 않고 원문 일부와 함께 남긴다
+SNIPPET_CHARS = 2000
+
+# Selenium 의 .text 처럼 줄바꿈으로 취급할 태그
+_BLOCK_TAGS = frozenset([
+    "address", "article", "aside", "blockquote", "dd", "div", "dl", "dt",
+    "fieldset", "figcaption", "figure", "footer", "form", "h1", "h2", "h3",
+    "h4", "h5", "h6", "header", "hr", "li", "main", "nav", "ol", "p", "pre",
+    "section", "table", "tbody", "td", "tfoot", "th", "thead", "tr", "ul",
+])
+_SKIP_TAGS = frozenset(["script", "style", "noscript", "template"])
+
+
+class ItemParseError(ValueError):
+    """<li> 하나를 레코드로 만들지 못했을 때 (reason 에 실패 사유)"""
+
+    def __init__(self, reason):
+        super().__init__(reason)
+        self.reason = reason
+
+
+def _collect_text(el, parts):
+    tag = el.tag
+    if not isinstance(tag, str):
+        # 주석/처리 지시자는 본문이 아니다 (tail 은 부모가 붙인다)
+        return
+    if tag in _SKIP_TAGS:
+        return
+    block = tag in _BLOCK_TAGS
+    if block or tag == "br":
+        parts.append("\n")
+    if el.text:
+        parts.append(el.text)
+    for child in el:
+        _collect_text(child, parts)
+        if child.tail:
+            parts.append(child.tail)
+    if block:
+        parts.append("\n")
+
+
+def element_text(el):
+    """Selenium WebElement.text 와 같은 규칙으로 보이는 텍스트를 만든다
+
+    줄 안의 연속 공백은 하나로 합치고, 블록 태그와 <br> 은 줄바꿈으로,
+    빈 줄은 버린다.
+    """
+    parts = []
+    _collect_text(el, parts)
+    lines = (" ".join(line.split()) for line in "".join(parts).split("\n"))
+    return "\n".join(line for line in lines if line)
+
+
+def _first(el, selector, what):
+    found = selector(el)
+    if not found:
+        raise ItemParseError(f"{what} 없음")
+    return found[0]
+
+
+def _find_tag(el, tag, what):
+    found = el.find(f".//{tag}")
+    if found is None:
+        raise ItemParseError(f"{what} 없음")
+    return found
+
+
+def parse_item(item):
+    """<li> 요소 하나를 공고 레코드(dict)로 변환"""
+    # 1. pbancSn 추출
+    href_value = _find_tag(item, "a", "링크(a)").get("href")
+    if href_value is None:
+        raise ItemParseError("링크 href 없음")
+    pbanc_sn_match = PBANC_SN_RE.search(href_value)
+    pbanc_sn = pbanc_sn_match.group(1) if pbanc_sn_match else ""
+
+    # 2. 상단 정보 추출 (첫 span 은 학교명, 나머지는 내용으로 구분)
+    top_info = SEL_TOP_SPANS(item)
+    school = ""
+    phone = ""
+    reg_date = ""
+
+    if top_info:
+        school = element_text(top_info[0]).strip()
+        for span in top_info[1:]:
+            text = element_text(span).strip()
+            if "등록일" in text:
+                reg_date = text.replace("등록일", "").replace(":", "").strip()
+            elif "조회수" in text:
+                continue
+            else:
+                phone = text
+
+    # 3. 제목 및 뱃지
+    title_area = _first(item, SEL_TITLE, "제목(.cont_tit)")
+    badge_text = ""
+    badges = SEL_BADGE(title_area)
+    if badges:
+        badge_text = element_text(badges[0]).strip()
+
+    full_title = element_text(title_area).strip()
+    pure_title = full_title.replace(badge_text, "").strip()
+
+    # 4. 상세 정보
+    btm_groups = SEL_BTM_GROUPS(item)
+    if len(btm_groups) < 2:
+        raise ItemParseError("상세 정보(.cont_btm > div) 부족")
+    group1_ps = btm_groups[0].findall(".//p")
+    group2_ps = btm_groups[1].findall(".//p")
+    if len(group1_ps) < 2 or len(group2_ps) < 2:
+        raise ItemParseError("상세 정보 항목(p) 부족")
+
+    recruit_info = element_text(_find_tag(group1_ps[0], "span", "채용 정보(span)")).strip()
+    recruit_count = element_text(group1_ps[1]).replace("채용인원", "").strip()
+
+    apply_period = element_text(group2_ps[0]).replace("접수기간", "").strip()
+    work_period = element_text(group2_ps[1]).replace("채용기간", "").strip()
+
+    job_field = element_text(_first(item, SEL_JOB_FIELD, "직무분야(.cont_btm > p)")).replace("직무분야", "").strip()
+
+    return {
+        "pbancSn": pbanc_sn,
+        "school": school,
+        "title": pure_title,
+        "badge": badge_text,
+        "job_field": job_field if job_field else "내용없음",
+        "recruit_info": recruit_info,
+        "recruit_count": recruit_count,
+        "apply_period": apply_period,
+        "work_period": work_period,
+        "phone": phone,  # 없는 경우 빈 문자열("")로 들어감
+        "reg_date": reg_date,
+    }
+
+
+def _stable_key(item):
+    """크롤링마다 바뀌는 조회수를 뺀 항목 텍스트 (임시 번호가 바뀌지 않도록)"""
+    return VIEW_COUNT_RE.sub("", element_text(item))
+
+
+def failed_item(item, reason):
+    """파싱에 실패한 <li> → 찾을 수 있는 값만 채운 레코드 (parse_error, raw_snippet 포함)"""
+    raw = lxml.html.tostring(item, encoding="unicode")
+    match = PBANC_SN_RE.search(raw)
+    if match:
+        pbanc_sn = match.group(1)
+    else:
+        digest = hashlib.sha1(_stable_key(item).encode("utf-8")).hexdigest()[:12]
+        pbanc_sn = INVALID_SN_PREFIX + digest
+    titles = SEL_TITLE(item)
+    spans = SEL_TOP_SPANS(item)
+    return {
+        "pbancSn": pbanc_sn,
+        "school": element_text(spans[0]).strip() if spans else "",
+        "title": element_text(titles[0]).strip() if titles else "",
+        "badge": "",
+        "job_field": "내용없음",
+        "recruit_info": "",
+        "recruit_count": "",
+        "apply_period": "",
+        "work_period": "",
+        "phone": "",
+        "reg_date": "",
+        "parse_error": reason,
+        "raw_snippet": raw[:SNIPPET_CHARS],
+    }
+
+
+_UTF8_PARSER = lxml.html.HTMLParser(encoding="utf-8")
+
+
+def parse_html_document(html):
+    if isinstance(html, bytes):
+        return lxml.html.document_fromstring(html)
+    # 인코딩 선언이 있는 str 은 lxml 이 거부하므로 UTF-8 bytes 로 넘긴다
+    return lxml.html.document_fromstring(html.encode("utf-8"), parser=_UTF8_PARSER)
+
+
+def parse_recruit_html(html):
+    """목록 페이지 HTML(또는 driver.page_source)에서 공고 목록을 추출
+
+    파싱하지 못한 항목은 failed_item 으로 원문 일부와 함께 남기고(품질 검사에서
+    "파싱 실패"로 표시), 사유별로 recruit_items_skipped_total 에 센다.
+    """
+    with metrics.timer("parse"):
+        doc = parse_html_document(html)
+        results = []
+        failed = 0
+
+        for item in SEL_ITEMS(doc):
+            try:
+                results.append(parse_item(item))
+            except Exception as e:
+                reason = e.reason if isinstance(e, ItemParseError) else type(e).__name__
+                logger.warning("항목 파싱 에러 발생: %s", getattr(e, "reason", e))
+                metrics.incr("recruit_items_skipped_total", reason=reason)
+                results.append(failed_item(item, reason))
+                failed += 1
+    metrics.incr("recruit_items_parsed_total", len(results) - failed)
+    return results
+
+
+def parse_recruit_list(driver):
+    """Selenium 드라이버가 띄운 목록 페이지를 파싱 (page_source 한 번만 읽는다)"""
+    return parse_recruit_html(driver.page_source)
@@ -0,0 +1,49 @@
+"""수집 시 레코드 품질 검사
+
+저장 직전(normalize_record)에 규칙마다 비트 하나를 세워 postings.quality 에
+정수로 남긴다. 화면의 "정보 누락" 목록은 매번 전체를 훑지 않고 이 값으로
+고르며, 공고마다 어느 규칙에 걸렸는지 보여 준다.
+"""
+
+FLAG_MISSING_REGION = 1 << 0
+FLAG_MISSING_SUBJECT = 1 << 1
+FLAG_BAD_DATES = 1 << 2
+FLAG_NO_PHONE = 1 << 3
+FLAG_PARSE_FAILED = 1 << 4
+
+# 공고번호조차 못 찾은 파싱 실패 항목의 임시 번호 접두어 (crawler.parser.failed_item)
+INVALID_SN_PREFIX = "invalid:"
+
+# (비트, 화면 표시 이름) — 표시 순서
+RULES = [
+    (FLAG_PARSE_FAILED, "파싱 실패"),
+    (FLAG_MISSING_REGION, "지역 누락"),
+    (FLAG_MISSING_SUBJECT, "직무 누락"),
+    (FLAG_BAD_DATES, "날짜 해석 불가"),
+    (FLAG_NO_PHONE, "연락처 없음"),
+]
+LABELS = dict(RULES)
+
+# 점검 목록에 기본으로 넣는 규칙 (연락처는 원래 비어 있는 공고가 많다)
+DEFAULT_CHECKS = FLAG_PARSE_FAILED | FLAG_MISSING_REGION | FLAG_MISSING_SUBJECT | FLAG_BAD_DATES
+
+
+def quality_flags(row, failed_dates=()):
+    """정리된 행(normalize_record) 과 해석하지 못한 날짜 필드 → 비트 플래그"""
+    flags = 0
+    if row.get("parse_error"):
+        flags |= FLAG_PARSE_FAILED
+    if row.get("region") == "지역미기재":
+        flags |= FLAG_MISSING_REGION
+    if row.get("job_field") == "내용없음":
+        flags |= FLAG_MISSING_SUBJECT
+    if failed_dates:
+        flags |= FLAG_BAD_DATES
+    if not row.get("phone"):
+        flags |= FLAG_NO_PHONE
+    return flags
+
+
+def describe(flags):
+    """비트 플래그 → 걸린 규칙 이름 목록"""
+    return [label for flag, label in RULES if flags & flag]
@@ -0,0 +1,275 @@
+"""Streamlit 요청 스레드와 분리된 백그라운드 크롤링 스케줄러
+
+정해진 주기마다, 또는 누군가 새로고침을 요청하면 크롤링을 돌린다.
+크롤링은 파일 잠금으로 프로세스를 통틀어 한 번에 하나만 실행되고(single-flight),
+결과는 데이터셋 버전을 올리며 한 트랜잭션으로 반영된다. 화면은 마지막으로
+끝난 버전만 읽는다.
+
+평소에는 증분 수집이라 마감 전에 내려간 공고를 알 수 없으므로, 주기 실행 중
+CRAWL_FULL_INTERVAL(기본 하루)마다 한 번은 게시판 전체를 다시 받아 맞춘다.
+
+    python -m crawler schedule --interval 1800
+"""
+import fcntl
+import json
+import logging
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+
+from crawler import detail, metrics
+from crawler.fetch import DEFAULT_BACKEND
+from crawler.snapshot import write_snapshot
+from crawler.sources import DEFAULT_SOURCE, crawl_sources, enabled_sources
+
+logger = logging.getLogger(__name__)
+
+# 자동 크롤링 주기(초)
+DEFAULT_INTERVAL = int(os.environ.get("CRAWL_INTERVAL", "1800"))
+# 전체 수집으로 내려간 공고까지 맞추는 주기(초)
+FULL_INTERVAL = int(os.environ.get("CRAWL_FULL_INTERVAL", "86400"))
+# 새로고침 요청을 확인하는 주기(초)
+POLL_SECONDS = 2.0
+
+# 잠금 이름 → 같은 프로세스 안의 스레드끼리 쓰는 잠금 (프로세스끼리는 파일 잠금)
+_process_locks = {"crawl": threading.Lock(), "enrich": threading.Lock()}
+
+
+@contextmanager
+def crawl_lock(db_path, blocking=False, name="crawl"):
+    """크롤링(또는 상세 보강, name="enrich") single-flight 잠금. 잡았으면 True, 이미 누가 돌고 있으면 False"""
+    process_lock = _process_locks[name]
+    if not process_lock.acquire(blocking=blocking):
+        yield False
+        return
+    try:
+        with open(f"{db_path}.{name}.lock", "a") as f:
+            flags = fcntl.LOCK_EX if blocking else fcntl.LOCK_EX | fcntl.LOCK_NB
+            try:
+                fcntl.flock(f, flags)
+            except BlockingIOError:
+                yield False
+                return
+            try:
+                yield True
+            finally:
+                fcntl.flock(f, fcntl.LOCK_UN)
+    finally:
+        process_lock.release()
+
+
+def _export_metrics(store, run):
+    """실행 기록 한 건을 구조화 로그와 Prometheus 파일로 내보낸다"""
+    log_path, prom_path, _ = metrics.metrics_paths(store.path)
+    summary = run["metrics"] or {}
+    metrics.log_event(
+        log_path, "crawl_run",
+        run_id=run["id"], trigger=run["trigger"], status=run["status"],
+        duration_s=round(run["finished_at"] - run["started_at"], 3),
+        total=run["total"], new_count=run["new_count"], dataset_version=run["dataset_version"],
+        error=run["error"], **summary,
+    )
+    try:
+        metrics.write_prometheus(prom_path, gauges={
+            "recruit_last_run_timestamp_seconds": round(run["finished_at"], 3),
+            "recruit_last_run_duration_seconds": round(run["finished_at"] - run["started_at"], 3),
+            "recruit_last_run_success": int(run["status"] == "ok"),
+            "recruit_postings": store.count(),
+            "recruit_dataset_version": store.dataset_version(),
+        })
+    except OSError:
+        logger.exception("메트릭 파일 쓰기 실패")
+
+
+def _enrich(store, records):
+    """새로 올라왔거나 바뀐 공고의 상세 페이지 보강 (HTTP 로만, 기본 게시판만 받는다)
+
+    크롤링 잠금 밖에서 따로 잠금(enrich)을 잡고 돈다. 이미 보강 중이면 건너뛰고,
+    남은 공고는 다음 크롤링 뒤 보강 때 받는다. 결과는 구조화 로그 detail_enrich 로 남긴다.
+    """
+    # 파싱에 실패해 임시 번호(invalid:...)를 받은 공고는 상세 페이지가 없다
+    records = [r for r in records
+               if r.get("source", DEFAULT_SOURCE) == DEFAULT_SOURCE and str(r.get("pbancSn", "")).isdigit()]
+    with crawl_lock(store.path, name="enrich") as acquired:
+        if not acquired:
+            logger.info("이미 상세 보강이 진행 중이라 건너뜁니다.")
+            return
+        started = time.perf_counter()
+        try:
+            fetched, cached, failed = detail.enrich_details(store, records)
+        except Exception:
+            logger.exception("상세 페이지 보강 실패")
+            return
+    log_path, _, _ = metrics.metrics_paths(store.path)
+    metrics.log_event(log_path, "detail_enrich", fetched=fetched, cached=cached, failed=failed,
+                      duration_s=round(time.perf_counter() - started, 3))
+
+
+def start_enrich(store, records):
+    """상세 보강을 백그라운드 스레드로 시작해 스레드를 반환 (보강을 안 하면 None)"""
+    if not detail.ENABLED or DEFAULT_BACKEND == "browser":
+        return None
+    thread = threading.Thread(target=_enrich, args=(store, records), name="detail-enrich", daemon=True)
+    thread.start()
+    return thread
+
+
+def collect(store, full=False, sources=None):
+    """켜 둔 게시판을 모두 수집해 (합친 전체 목록, 새 공고 목록, 실패 {게시판: 에러})
+
+    실패한 게시판은 저장된 공고를 그대로 둔다 (사라진 공고로 처리하지 않는다).
+    CRAWL_SOURCES 에서 뺀 게시판의 공고는 빠진다. 모든 게시판이 실패하면 RuntimeError.
+    """
+    sources = sources or enabled_sources()
+    stored = {}
+    for record in store.load_records():
+        stored.setdefault(record["source"], []).append(record)
+    results, errors = crawl_sources(sources, stored, full=full)
+    if not results:
+        raise RuntimeError("; ".join(f"{name}: {error}" for name, error in errors.items()))
+
+    final_data, new_records = [], []
+    for source in sources:
+        if source.name in results:
+            records, new = results[source.name]
+            final_data.extend(records)
+            # 전체 수집은 받은 공고를 모두 돌려주므로 저장돼 있던 공고는 새 공고에서 뺀다.
+            # 파싱 실패 항목도 새 공고로 세지 않는다
+            known = {r["pbancSn"] for r in stored.get(source.name, [])}
+            new_records.extend(r for r in new if r.get("pbancSn") not in known and not r.get("parse_error"))
+        else:
+            final_data.extend(stored.get(source.name, []))
+    return final_data, new_records, errors
+
+
+def run_crawl(store, full=False, trigger="schedule", wait_enrich=False):
+    """크롤링 한 번을 실행하고 결과를 새 데이터셋 버전으로 반영
+
+    다른 크롤링이 이미 돌고 있으면 None, 아니면 실행 기록(dict)을 반환한다.
+    단계별 시간/카운터는 실행 기록의 metrics 에 남는다. 일부 게시판만 실패하면
+    나머지는 반영하고 실패 내용을 error 에 남긴다.
+
+    상세 보강은 실행 기록을 끝내고 크롤링 잠금을 푼 뒤 백그라운드로 돈다
+    (실행 시간에 들어가지 않고, 새로고침 요청을 막지 않는다). wait_enrich 면
+    보강이 끝날 때까지 기다린다 (명령행 수집).
+    """
+    with crawl_lock(store.path) as acquired:
+        if not acquired:
+            logger.info("이미 크롤링이 진행 중이라 건너뜁니다.")
+            return None
+
+        store.abandon_running_runs()
+        run_id = store.start_run(trigger)
+        run_metrics = metrics.start_run()
+        try:
+            with metrics.timer("crawl.total"):
+                sources = enabled_sources()
+                final_data, new_records, errors = collect(store, full=full, sources=sources)
+                version = store.publish(final_data)
+                if full:
+                    store.set_meta("last_full_crawl_at", time.time())
+                store.set_meta("source_labels", json.dumps({s.name: s.label for s in sources}, ensure_ascii=False))
+                try:
+                    # 대시보드가 바로 memory-map 으로 열 수 있게 미리 써 둔다 (실패해도 화면이 직접 만든다)
+                    write_snapshot(store)
+                except Exception:
+                    logger.exception("스냅샷 쓰기 실패")
+        except Exception as e:
+            logger.exception("크롤링 실패")
+            metrics.end_run()
+            store.finish_run(run_id, "error", error=str(e), metrics=run_metrics.summary())
+        else:
+            metrics.end_run()
+            store.finish_run(run_id, "ok", total=len(final_data), new_count=len(new_records),
+                             dataset_version=version, metrics=run_metrics.summary(),
+                             error="; ".join(f"{name}: {error}" for name, error in errors.items()) or None)
+            logger.info("크롤링 완료: 총 %d건, 새 공고 %d건 (버전 %d)", len(final_data), len(new_records), version)
+
+        run = store.recent_runs(1)[0]
+        _export_metrics(store, run)
+
+    # 목록은 이미 반영됐으므로 상세 보강이 늦거나 실패해도 화면에는 영향이 없다
+    if run["status"] == "ok":
+        thread = start_enrich(store, final_data)
+        if thread is not None and wait_enrich:
+            thread.join()
+    return run
+
+
+class CrawlScheduler(threading.Thread):
+    """주기 실행 + 새로고침 요청 처리를 맡는 데몬 스레드"""
+
+    def __init__(self, store, interval=DEFAULT_INTERVAL, poll=POLL_SECONDS, full_interval=FULL_INTERVAL):
+        super().__init__(name="crawl-scheduler", daemon=True)
+        self.store = store
+        self.interval = interval
+        self.full_interval = full_interval
+        self.poll = poll
+        self.wakeup = threading.Event()
+        self.stopped = threading.Event()
+
+    def request_refresh(self):
+        """다음 확인 때까지 기다리지 않고 바로 크롤링하도록 깨운다"""
+        self.store.request_refresh()
+        self.wakeup.set()
+
+    def stop(self):
+        self.stopped.set()
+        self.wakeup.set()
+
+    def _last_started_at(self):
+        runs = self.store.recent_runs(1)
+        return runs[0]["started_at"] if runs else 0.0
+
+    def _full_due(self):
+        """마지막 전체 수집 뒤 full_interval 이 지났는지"""
+        return time.time() - float(self.store.get_meta("last_full_crawl_at", 0)) >= self.full_interval
+
+    def _warm_browser(self):
+        """브라우저만 쓰도록 설정했으면 첫 크롤링 전에 브라우저를 미리 띄운다"""
+        try:
+            from crawler.browser import get_pool
+            get_pool().warm()
+        except Exception:
+            logger.exception("브라우저 미리 띄우기 실패 (크롤링 때 다시 시도)")
+
+    def run(self):
+        if DEFAULT_BACKEND == "browser":
+            self._warm_browser()
+        while not self.stopped.is_set():
+            try:
+                last_started = self._last_started_at()
+                if self.store.refresh_requested_at() > last_started:
+                    run_crawl(self.store, trigger="manual")
+                elif time.time() - last_started >= self.interval:
+                    if self._full_due():
+                        run_crawl(self.store, full=True, trigger="full")
+                    else:
+                        run_crawl(self.store, trigger="schedule")
+            except Exception:
+                logger.exception("스케줄러 반복 중 에러")
+            self.wakeup.wait(self.poll)
+            self.wakeup.clear()
+
+
+def serve(store, interval=DEFAULT_INTERVAL, full_interval=FULL_INTERVAL):
+    """스케줄러를 띄우고 Ctrl+C 까지 기다린다"""
+    scheduler = CrawlScheduler(store, interval=interval, full_interval=full_interval)
+    scheduler.start()
+    try:
+        while scheduler.is_alive():
+            scheduler.join(1)
+    except KeyboardInterrupt:
+        scheduler.stop()
+
+
+def main():
+    """예전 실행 방법(python -m crawler.scheduler) 호환"""
+    from crawler.cli import main as cli_main
+    cli_main(["schedule", *sys.argv[1:]])
+
+
+if __name__ == "__main__":
+    main()
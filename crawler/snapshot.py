@@ -0,0 +1,128 @@
+"""대시보드용 열 기반(Arrow IPC) 스냅샷
+
+크롤링 결과가 반영될 때마다 화면에 필요한 열을 미리 계산해(원본링크, 지역,
+날짜) Arrow 파일 하나로 써 둔다. 반복 값이 많은 열은 사전(dictionary) 인코딩이라
+pandas 에서 바로 categorical 이 된다. 대시보드는 이 파일을 memory-map 으로
+열기 때문에 캐시가 비워져도 SQLite 조회와 DataFrame 재구성 없이 곧바로 뜬다.
+
+파일은 임시 파일에 쓴 뒤 교체하므로, 이미 열어 둔 매핑은 예전 파일을 그대로
+본다. 스냅샷의 데이터셋 버전은 스키마 메타데이터에 들어 있다.
+"""
+import os
+import tempfile
+
+import pyarrow as pa
+import pyarrow.ipc as ipc
+
+from crawler import metrics
+from crawler.dates import DATE_FIELDS
+from crawler.store import ORDER_BY, RECORD_FIELDS
+
+LINK_FIELD = "원본링크"
+# 사전 인코딩(→ pandas categorical) 하는 열
+DICTIONARY_FIELDS = ["region", "badge", "school", "job_field", "source"]
+# 화면 DataFrame 의 열 순서
+SNAPSHOT_FIELDS = RECORD_FIELDS + [LINK_FIELD, "region", "source"] + DATE_FIELDS + ["quality"]
+
+_VERSION_KEY = b"dataset_version"
+
+
+def snapshot_path(db_path):
+    """recruit.db → recruit.arrow"""
+    return os.path.splitext(db_path)[0] + ".arrow"
+
+
+def _read_columns(store):
+    """(데이터셋 버전, 열 이름 → 값 목록) — 한 읽기 트랜잭션 안에서 함께 읽는다"""
+    columns = RECORD_FIELDS + ["region", "source", "link"] + DATE_FIELDS + ["quality"]
+    with store.connect() as conn:
+        conn.execute("BEGIN")
+        try:
+            version = store._dataset_version(conn)
+            rows = conn.execute(f"SELECT {', '.join(columns)} FROM postings ORDER BY {ORDER_BY}").fetchall()
+        finally:
+            conn.execute("COMMIT")
+    values = list(zip(*rows)) if rows else [()] * len(columns)
+    return version, dict(zip(columns, values))
+
+
+def build_table(columns, version):
+    arrays = []
+    for field in SNAPSHOT_FIELDS:
+        if field == LINK_FIELD:
+            array = pa.array(columns["link"], type=pa.string())
+        elif field in DATE_FIELDS:
+            array = pa.array(columns[field], type=pa.string()).cast(pa.date32())
+        elif field == "quality":
+            # 품질 검사 비트 플래그 (crawler.quality)
+            array = pa.array(columns[field], type=pa.uint8())
+        else:
+            array = pa.array(columns[field], type=pa.string())
+            if field in DICTIONARY_FIELDS:
+                array = array.dictionary_encode()
+        arrays.append(array)
+    return pa.Table.from_arrays(arrays, names=SNAPSHOT_FIELDS,
+                                metadata={_VERSION_KEY: str(version).encode()})
+
+
+def write_snapshot(store, path=None):
+    """저장소의 현재 버전을 스냅샷 파일로 쓴다. 쓴 버전 반환"""
+    path = path or snapshot_path(store.path)
+    with metrics.timer("snapshot.build"):
+        version, columns = _read_columns(store)
+        table = build_table(columns, version)
+
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(prefix=".recruit_", suffix=".arrow", dir=directory)
+    try:
+        # 압축하지 않아야 memory-map 으로 복사 없이 읽을 수 있다
+        with metrics.timer("snapshot.write"), os.fdopen(fd, "wb") as f, ipc.new_file(f, table.schema) as writer:
+            writer.write_table(table)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+    return version
+
+
+def snapshot_version(path):
+    """스냅샷 파일의 데이터셋 버전 (파일이 없거나 읽을 수 없거나 열 구성이 예전이면 None)"""
+    try:
+        with pa.memory_map(path) as source:
+            schema = ipc.open_file(source).schema
+    except (OSError, pa.ArrowInvalid):
+        return None
+    metadata = schema.metadata or {}
+    if schema.names != SNAPSHOT_FIELDS or _VERSION_KEY not in metadata:
+        return None
+    return int(metadata[_VERSION_KEY])
+
+
+def read_snapshot(path):
+    """스냅샷을 memory-map 으로 연 Arrow Table (버퍼는 파일을 그대로 가리킨다)"""
+    source = pa.memory_map(path)
+    return ipc.open_file(source).read_all()
+
+
+def ensure_snapshot(store, version=None):
+    """version(기본: 현재 버전) 이상의 스냅샷이 없으면 새로 쓰고 (파일 경로, 스냅샷 버전) 을 돌려준다
+
+    그사이 수집이 끝났으면 스냅샷은 version 보다 새 버전일 수 있다. 호출하는 쪽은
+    돌려받은 버전을 캐시 키로 써야 파일 내용과 키가 어긋나지 않는다.
+    """
+    path = snapshot_path(store.path)
+    if version is None:
+        version = store.dataset_version()
+    current = snapshot_version(path)
+    if current is None or current < version:
+        current = write_snapshot(store, path)
+    return path, current
+
+
+def to_dataframe(table):
+    """Arrow Table → 화면용 DataFrame
+
+    문자열 열은 Arrow 버퍼를 그대로 쓰고, 사전 인코딩 열은 categorical,
+    날짜 열은 datetime64(없으면 NaT) 가 된다.
+    """
+    return table.to_pandas(date_as_object=False, split_blocks=True)
@@ -0,0 +1,227 @@
+"""수집 대상 게시판(source) 플러그인과 병렬 수집
+
+게시판 하나가 Source 하나다. 목록을 받는 방법(주소, form 값)과 파서를 정하고,
+결과를 기존 레코드 형식(RECORD_FIELDS)에 source/link 를 더해 돌려준다.
+공고번호는 게시판끼리 겹칠 수 있어 namespace 를 앞에 붙여("seoul:1234")
+저장한다. 경기도교육청 게시판은 예전 데이터와 같도록 붙이지 않는다.
+
+수집할 게시판은 CRAWL_SOURCES(쉼표 구분, 기본 goe)로 고르고, 다른 게시판
+플러그인은 CRAWL_SOURCE_MODULES 에 적은 모듈에서 register() 로 등록한다.
+게시판이 둘 이상이면 게시판마다 별도 프로세스에서 수집하고(호스트별 동시 실행
+수 제한), 결과를 한 저장소에 합친다. 전체 시간은 가장 느린 게시판에 가깝다.
+
+이 모듈은 화면 쪽에서도 불러오므로 수집 모듈(requests/lxml)은 쓸 때 불러온다.
+"""
+import importlib
+import logging
+import multiprocessing
+import os
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from urllib.parse import urlsplit
+
+from crawler import metrics
+from crawler.store import DEFAULT_SOURCE, DETAIL_URL, has_real_sn
+
+logger = logging.getLogger(__name__)
+
+ENABLED = [s.strip() for s in os.environ.get("CRAWL_SOURCES", DEFAULT_SOURCE).split(",") if s.strip()]
+PLUGIN_MODULES = [m.strip() for m in os.environ.get("CRAWL_SOURCE_MODULES", "").split(",") if m.strip()]
+# 같은 호스트에서 동시에 수집하는 게시판 수 (호스트 요청 속도 제한은 이 수로 나눠 쓴다)
+HOST_CONCURRENCY = int(os.environ.get("SOURCE_HOST_CONCURRENCY", "2"))
+MAX_PROCESSES = int(os.environ.get("SOURCE_PROCESSES", "4"))
+
+
+class Source:
+    """목록을 form POST 로 받는 게시판
+
+    목록 HTML 모양이 경기도교육청과 다르면 parse_html 을, 받는 방법이 다르면
+    fetch_list_html 을 바꾼 하위 클래스를 만든다.
+    """
+
+    def __init__(self, name, label, base_url=None, form=None, list_path=None, detail_url=None,
+                 namespace=None, browser=False, marker="recruit_list"):
+        self.name = name
+        self.label = label
+        self._base_url = base_url
+        self.form = dict(form or {})
+        self.list_path = list_path
+        # 공고번호({sn})로 원본 링크를 만드는 틀
+        self.detail_url = detail_url
+        self.namespace = name if namespace is None else namespace
+        # Selenium 대체 수집은 기본 게시판(기본 form)만 지원한다
+        self.browser = browser
+        self.marker = marker
+
+    @property
+    def base_url(self):
+        if self._base_url:
+            return self._base_url
+        from crawler import http_fetch
+        return http_fetch.BASE_URL
+
+    @property
+    def host(self):
+        return urlsplit(self.base_url).netloc
+
+    def fetch_list_html(self, session, curr_page, page_size, base_url=None):
+        from crawler import http_fetch
+        return http_fetch.fetch_list_html(session=session, curr_page=curr_page, page_index=page_size,
+                                          base_url=base_url or self.base_url, form=self.form,
+                                          path=self.list_path)
+
+    def looks_like_list_page(self, html):
+        """차단/오류 페이지가 아닌 실제 목록인지"""
+        return bool(html) and self.marker in html
+
+    def parse_html(self, html):
+        """목록 HTML → 게시판 원래 공고번호의 레코드 목록"""
+        from crawler.parser import parse_recruit_html
+        return parse_recruit_html(html)
+
+    def parse(self, html):
+        """목록 HTML → 저장할 레코드 목록 (source, link, namespace 붙은 공고번호)"""
+        return [self.to_record(record) for record in self.parse_html(html)]
+
+    def to_record(self, record):
+        sn = str(record.get("pbancSn") or "")
+        link = self.detail_url.format(sn=sn) if self.detail_url and has_real_sn(sn) else ""
+        if sn and self.namespace:
+            sn = f"{self.namespace}:{sn}"
+        return {**record, "pbancSn": sn, "source": self.name, "link": link}
+
+    def crawl(self, existing, full=False, rate=None):
+        """(전체 목록, 새 공고 목록). existing 은 이 게시판의 저장된 레코드"""
+        from crawler.incremental import update_incremental
+        from crawler.pages import DEFAULT_RATE, crawl_listing
+
+        rate = rate or DEFAULT_RATE
+        backend = None if self.browser else "http"
+        if full:
+            records = crawl_listing(backend=backend, source=self, rate=rate)
+            return records, records
+        return update_incremental(existing, backend=backend, source=self, rate=rate)
+
+
+_registry = {}
+
+
+def register(source):
+    _registry[source.name] = source
+    return source
+
+
+def get_source(name):
+    if name not in _registry:
+        raise KeyError(f"등록되지 않은 게시판: {name}")
+    return _registry[name]
+
+
+def registered():
+    return dict(_registry)
+
+
+def load_plugins(modules=PLUGIN_MODULES):
+    for module in modules:
+        importlib.import_module(module)
+
+
+def enabled_sources(names=None):
+    load_plugins()
+    return [get_source(name) for name in (names or ENABLED)]
+
+
+def labels():
+    """게시판 이름 → 표시 이름 (화면 선택지용)"""
+    return {name: source.label for name, source in _registry.items()}
+
+
+# 경기도교육청 채용 게시판 — 기간제/사립교원 (form 은 http_fetch.build_payload 기본값)
+GOE = register(Source(
+    DEFAULT_SOURCE, "경기도교육청 기간제/사립교원",
+    detail_url=DETAIL_URL + "{sn}",
+    namespace="", browser=True,
+))
+
+
+# --- 병렬 수집 ---
+def _crawl_in_process(name, existing, full, rate):
+    """프로세스 풀 작업: 게시판 하나 수집. (전체, 새 공고, 메트릭 상태)"""
+    load_plugins()
+    run = metrics.start_run()
+    try:
+        final, new = get_source(name).crawl(existing, full=full, rate=rate)
+    finally:
+        metrics.end_run()
+    return final, new, run.state()
+
+
+def _source_rates(sources):
+    """같은 호스트 게시판끼리 호스트 요청 속도를 나눠 쓴다"""
+    from crawler.pages import DEFAULT_RATE
+    per_host = {}
+    for source in sources:
+        per_host[source.host] = per_host.get(source.host, 0) + 1
+    return {s.name: DEFAULT_RATE / min(HOST_CONCURRENCY, per_host[s.host]) for s in sources}
+
+
+def crawl_sources(sources, existing, full=False):
+    """게시판별 결과 {이름: (전체, 새 공고)} 와 실패 {이름: 에러}
+
+    existing 은 {게시판 이름: 저장된 레코드}. 게시판이 하나면 이 프로세스에서
+    바로 수집하고, 여럿이면 프로세스 풀에서 호스트별로 HOST_CONCURRENCY 개씩
+    돌린다. 실패한 게시판은 어느 경우든 결과에서 빠지고 errors 에 남는다.
+    """
+    results, errors = {}, {}
+
+    def failed(source, error):
+        logger.error("게시판 수집 실패: %s", source.name, exc_info=error)
+        metrics.incr("recruit_source_errors_total", source=source.name)
+        errors[source.name] = str(error)
+
+    if len(sources) == 1:
+        source = sources[0]
+        try:
+            with metrics.timer(f"source.{source.name}"):
+                results[source.name] = source.crawl(existing.get(source.name, []), full=full)
+        except Exception as e:
+            failed(source, e)
+        return results, errors
+
+    rates = _source_rates(sources)
+    queues = {}
+    for source in sources:
+        queues.setdefault(source.host, deque()).append(source)
+    active = dict.fromkeys(queues, 0)
+
+    # 스케줄러 스레드가 있는 프로세스에서 fork 하지 않도록 spawn 으로 띄운다
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=min(len(sources), MAX_PROCESSES), mp_context=context) as pool:
+        running = {}
+
+        def submit_ready():
+            for host, queue in queues.items():
+                while queue and active[host] < HOST_CONCURRENCY:
+                    source = queue.popleft()
+                    future = pool.submit(_crawl_in_process, source.name, existing.get(source.name, []),
+                                         full, rates[source.name])
+                    running[future] = (source, time.perf_counter())
+                    active[host] += 1
+
+        submit_ready()
+        while running:
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                source, started = running.pop(future)
+                active[source.host] -= 1
+                metrics.observe(f"source.{source.name}", time.perf_counter() - started)
+                try:
+                    final, new, state = future.result()
+                except Exception as e:
+                    failed(source, e)
+                    continue
+                metrics.merge(state)
+                results[source.name] = (final, new)
+            submit_ready()
+    return results, errors
@@ -0,0 +1,687 @@
+"""SQLite 기반 공고 저장소
+
+예전에는 크롤링마다 recruit_list.json 전체를 다시 쓰고, 대시보드는 매번 파일
+전체를 읽어 파싱했다. 쓰는 도중의 파일을 읽으면 JSONDecodeError 로 빈 화면이
+되기도 했다. 여기서는 WAL 모드 SQLite 에 트랜잭션으로 upsert 하므로 읽는 쪽은
+막히지 않고 항상 마지막으로 커밋된 데이터만 본다.
+
+크롤링 결과를 반영(publish)할 때 이전 상태와 공고번호별로 비교해 새 공고,
+바뀐 공고(뱃지/마감일/내용), 사라진 공고를 변경 기록(changes)에 남긴다.
+"새 공고 알림"과 구독 확인은 전체 데이터 대신 이 기록만 읽는다.
+"""
+import hashlib
+import json
+import os
+import sqlite3
+import tempfile
+import time
+from contextlib import contextmanager
+
+from crawler import metrics
+from crawler.dates import DATE_FIELDS, date_fields
+from crawler.quality import INVALID_SN_PREFIX, quality_flags
+
+DB_FILE = os.environ.get("RECRUIT_DB", "recruit.db")
+# 예전 저장 형식. 처음 한 번 가져오기(import)와 호환용 내보내기에만 쓴다
+DATA_FILE = "recruit_list.json"
+
+RECORD_FIELDS = [
+    "pbancSn", "school", "title", "badge", "job_field", "recruit_info",
+    "recruit_count", "apply_period", "work_period", "phone", "reg_date",
+]
+
+# 인덱스 순서(등록일, 공고번호 역순)가 사이트의 등록순 목록과 같다
+ORDER_BY = "reg_date DESC, CAST(pbancSn AS INTEGER) DESC"
+
+# 수집 시 원본 필드에서 계산해 함께 저장하는 열
+DERIVED_FIELDS = ["region"] + DATE_FIELDS
+
+# 어느 게시판(crawler.sources)의 공고인지와 원본 링크
+SOURCE_FIELDS = ["source", "link"]
+DEFAULT_SOURCE = "goe"
+# source/link 가 없는 예전 레코드(기본 게시판)의 원본 링크
+DETAIL_URL = "https://www.goe.go.kr/recruit/ad/func/pb/hnfpPbancInfoView.do?pbancSn="
+
+# 파싱에 실패한 항목의 사유와 원문 일부 (crawler.parser.failed_item)
+PARSE_FAILURE_FIELDS = ["parse_error", "raw_snippet"]
+
+# 내용 해시에 넣는 필드 (매일 바뀌는 마감 뱃지는 뺀다)
+CONTENT_FIELDS = [f for f in RECORD_FIELDS if f != "badge"]
+
+# 상세 페이지에서 얻는 필드 (attachments 는 JSON 목록)
+DETAIL_FIELDS = ["qualifications", "documents", "apply_method", "description", "attachments"]
+
+# 변경 기록에 함께 남기는 필드 (사라진 공고도 구독 조건과 맞춰 보고 보여 줄 수 있게)
+CHANGE_INFO_FIELDS = ["school", "title", "region", "job_field", "source"]
+CHANGE_FIELDS = ["id", "dataset_version", "detected_at", "pbancSn", "kind", "fields"] + CHANGE_INFO_FIELDS
+# 변경 기록 보관 기간(일)
+CHANGE_RETENTION_DAYS = 30
+
+
+def _backfill_dates(conn):
+    rows = conn.execute("SELECT pbancSn, apply_period, work_period, reg_date FROM postings").fetchall()
+    updates = []
+    for sn, apply_period, work_period, reg_date in rows:
+        values, _ = date_fields({"apply_period": apply_period, "work_period": work_period, "reg_date": reg_date})
+        updates.append([values[f] for f in DATE_FIELDS] + [sn])
+    assignments = ", ".join(f"{f} = ?" for f in DATE_FIELDS)
+    conn.executemany(f"UPDATE postings SET {assignments} WHERE pbancSn = ?", updates)
+
+
+def _backfill_hashes(conn):
+    columns = ", ".join(CONTENT_FIELDS)
+    rows = conn.execute(f"SELECT {columns} FROM postings").fetchall()
+    updates = [(content_hash(dict(zip(CONTENT_FIELDS, row))), row[0]) for row in rows]
+    conn.executemany("UPDATE postings SET content_hash = ? WHERE pbancSn = ?", updates)
+
+
+def _backfill_links(conn):
+    conn.execute("UPDATE postings SET link = ? || pbancSn WHERE source = ?", (DETAIL_URL, DEFAULT_SOURCE))
+
+
+def _backfill_quality(conn):
+    columns = ["pbancSn", "region", "job_field", "phone", "apply_period", "work_period", "reg_date"]
+    rows = conn.execute(f"SELECT {', '.join(columns)} FROM postings").fetchall()
+    updates = []
+    for values in rows:
+        row = dict(zip(columns, values))
+        updates.append((quality_flags(row, date_fields(row)[1]), row["pbancSn"]))
+    conn.executemany("UPDATE postings SET quality = ? WHERE pbancSn = ?", updates)
+
+
+# 순서대로 한 번씩 적용되는 스키마 변경 (PRAGMA user_version 에 적용 개수 기록)
+# 문자열은 SQL 문 묶음, 함수는 같은 트랜잭션에서 실행할 데이터 보정
+MIGRATIONS = [
+    """
+    CREATE TABLE postings (
+        pbancSn TEXT PRIMARY KEY,
+        school TEXT NOT NULL DEFAULT '',
+        title TEXT NOT NULL DEFAULT '',
+        badge TEXT NOT NULL DEFAULT '',
+        job_field TEXT NOT NULL DEFAULT '내용없음',
+        recruit_info TEXT NOT NULL DEFAULT '',
+        recruit_count TEXT NOT NULL DEFAULT '',
+        apply_period TEXT NOT NULL DEFAULT '',
+        work_period TEXT NOT NULL DEFAULT '',
+        phone TEXT NOT NULL DEFAULT '',
+        reg_date TEXT NOT NULL DEFAULT '',
+        region TEXT NOT NULL DEFAULT '지역미기재',
+        updated_at REAL NOT NULL
+    );
+    CREATE INDEX idx_postings_region ON postings(region);
+    CREATE INDEX idx_postings_badge ON postings(badge);
+    CREATE INDEX idx_postings_reg_date ON postings(reg_date);
+    CREATE TABLE meta (
+        key TEXT PRIMARY KEY,
+        value TEXT NOT NULL
+    )
+    """,
+    """
+    CREATE TABLE crawl_runs (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        trigger TEXT NOT NULL,
+        status TEXT NOT NULL,
+        started_at REAL NOT NULL,
+        finished_at REAL,
+        total INTEGER,
+        new_count INTEGER,
+        dataset_version INTEGER,
+        error TEXT
+    );
+    CREATE INDEX idx_crawl_runs_started_at ON crawl_runs(started_at)
+    """,
+    """
+    ALTER TABLE postings ADD COLUMN apply_start TEXT;
+    ALTER TABLE postings ADD COLUMN apply_end TEXT;
+    ALTER TABLE postings ADD COLUMN work_start TEXT;
+    ALTER TABLE postings ADD COLUMN work_end TEXT;
+    ALTER TABLE postings ADD COLUMN reg_on TEXT;
+    CREATE INDEX idx_postings_apply_end ON postings(apply_end);
+    CREATE INDEX idx_postings_work_start ON postings(work_start);
+    CREATE INDEX idx_postings_reg_on ON postings(reg_on)
+    """,
+    # 위에서 추가한 날짜 열을 기존 행에 채운다
+    _backfill_dates,
+    # 단계별 시간/카운터 요약 (JSON)
+    "ALTER TABLE crawl_runs ADD COLUMN metrics TEXT",
+    # 상세 페이지 캐시 (목록 내용 해시가 같으면 다시 받지 않는다)
+    """
+    CREATE TABLE posting_details (
+        pbancSn TEXT PRIMARY KEY,
+        content_hash TEXT NOT NULL,
+        fetched_at REAL NOT NULL,
+        qualifications TEXT NOT NULL DEFAULT '',
+        documents TEXT NOT NULL DEFAULT '',
+        apply_method TEXT NOT NULL DEFAULT '',
+        description TEXT NOT NULL DEFAULT '',
+        attachments TEXT NOT NULL DEFAULT '[]',
+        error TEXT
+    )
+    """,
+    # 크롤링 사이 변경 기록과 구독 (regions/subjects 는 JSON 목록)
+    """
+    ALTER TABLE postings ADD COLUMN content_hash TEXT;
+    CREATE TABLE changes (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        dataset_version INTEGER NOT NULL,
+        detected_at REAL NOT NULL,
+        pbancSn TEXT NOT NULL,
+        kind TEXT NOT NULL,
+        fields TEXT NOT NULL DEFAULT '',
+        school TEXT NOT NULL DEFAULT '',
+        title TEXT NOT NULL DEFAULT '',
+        region TEXT NOT NULL DEFAULT '',
+        job_field TEXT NOT NULL DEFAULT ''
+    );
+    CREATE INDEX idx_changes_version ON changes(dataset_version);
+    CREATE TABLE subscriptions (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        name TEXT NOT NULL,
+        regions TEXT NOT NULL DEFAULT '[]',
+        subjects TEXT NOT NULL DEFAULT '[]',
+        seen_version INTEGER NOT NULL DEFAULT 0,
+        created_at REAL NOT NULL
+    )
+    """,
+    # 위에서 추가한 내용 해시를 기존 행에 채운다
+    _backfill_hashes,
+    # 여러 게시판 수집: 기존 행은 모두 기본 게시판
+    f"""
+    ALTER TABLE postings ADD COLUMN source TEXT NOT NULL DEFAULT '{DEFAULT_SOURCE}';
+    ALTER TABLE postings ADD COLUMN link TEXT NOT NULL DEFAULT '';
+    CREATE INDEX idx_postings_source ON postings(source);
+    ALTER TABLE changes ADD COLUMN source TEXT NOT NULL DEFAULT '{DEFAULT_SOURCE}'
+    """,
+    _backfill_links,
+    # 수집 시 품질 검사 결과 (crawler.quality 비트 플래그)
+    """
+    ALTER TABLE postings ADD COLUMN quality INTEGER NOT NULL DEFAULT 0;
+    ALTER TABLE postings ADD COLUMN parse_error TEXT;
+    ALTER TABLE postings ADD COLUMN raw_snippet TEXT;
+    CREATE INDEX idx_postings_quality ON postings(quality)
+    """,
+    _backfill_quality,
+    # 임시 번호(파싱 실패) 공고의 잘못된 원본 링크와 변경 기록 정리
+    f"""
+    UPDATE postings SET link = '' WHERE INSTR(pbancSn, '{INVALID_SN_PREFIX}') > 0;
+    DELETE FROM changes WHERE INSTR(pbancSn, '{INVALID_SN_PREFIX}') > 0
+    """,
+    # 구독은 방문자(주소의 ?me= 토큰)별로 나눈다. 예전 구독은 owner 가 빈 문자열
+    """
+    ALTER TABLE subscriptions ADD COLUMN owner TEXT NOT NULL DEFAULT '';
+    CREATE INDEX idx_subscriptions_owner ON subscriptions(owner)
+    """,
+    # 방문자(?me= 토큰)별로 마지막으로 본 데이터 버전. owner 가 빈 문자열인 예전 구독은
+    # 어느 방문자의 것인지 알 수 없어(모두가 함께 보던 구독) 지운다
+    """
+    DELETE FROM subscriptions WHERE owner = '';
+    CREATE TABLE visitors (
+        token TEXT PRIMARY KEY,
+        seen_version INTEGER NOT NULL DEFAULT 0,
+        seen_at REAL NOT NULL
+    )
+    """,
+]
+
+SUBSCRIPTION_FIELDS = ["id", "owner", "name", "regions", "subjects", "seen_version", "created_at"]
+
+RUN_FIELDS = [
+    "id", "trigger", "status", "started_at", "finished_at",
+    "total", "new_count", "dataset_version", "error", "metrics",
+]
+
+
+def get_region(info_text):
+    """"시급 경력무관 | 안산시" → "안산시" """
+    if "|" in str(info_text):
+        return str(info_text).split("|")[-1].strip()
+    return "지역미기재"
+
+
+def content_hash(record):
+    """목록 레코드의 내용 해시 — 같으면 공고 내용(과 상세 페이지)이 그대로라고 본다"""
+    values = [str(record.get(f) or "") for f in CONTENT_FIELDS]
+    return hashlib.sha1("\x1f".join(values).encode("utf-8")).hexdigest()
+
+
+def has_real_sn(sn):
+    """게시판의 실제 공고번호인지 (파싱 실패 항목의 임시 번호가 아닌지)"""
+    return bool(sn) and INVALID_SN_PREFIX not in sn
+
+
+def normalize_record(record):
+    """저장 전에 빈 값/누락 필드를 정리한 사본을 만든다"""
+    row = {field: record.get(field) or "" for field in RECORD_FIELDS}
+    row["pbancSn"] = str(row["pbancSn"])
+    if not row["job_field"]:
+        row["job_field"] = "내용없음"
+    row["region"] = get_region(row["recruit_info"])
+    dates, failed_dates = date_fields(row)
+    row.update(dates)
+    row["source"] = record.get("source") or DEFAULT_SOURCE
+    row["link"] = record.get("link") or ""
+    if not row["link"] and row["source"] == DEFAULT_SOURCE and has_real_sn(row["pbancSn"]):
+        row["link"] = DETAIL_URL + row["pbancSn"]
+    for field in PARSE_FAILURE_FIELDS:
+        row[field] = record.get(field) or None
+    row["quality"] = quality_flags(row, failed_dates)
+    row["content_hash"] = content_hash(row)
+    return row
+
+
+def diff_postings(previous, rows):
+    """이전 상태 {공고번호: 행} 과 새 행 목록 → 변경 dict 목록
+
+    kind 는 new / changed / closed. changed 의 fields 에는 badge(상태),
+    apply_end(마감일), content(그 밖의 내용) 중 바뀐 것을 쉼표로 잇는다.
+    파싱에 실패한 행은 내용을 믿을 수 없으므로 변경으로 남기지 않고, 고쳐져서
+    처음 제대로 읽힌 공고는 new 로 본다.
+    """
+    changes = []
+    current = set()
+    for row in rows:
+        sn = row["pbancSn"]
+        current.add(sn)
+        if row.get("parse_error"):
+            continue
+        old = previous.get(sn)
+        if old is None or old.get("parse_error"):
+            changes.append({"pbancSn": sn, "kind": "new", "fields": "", **_change_info(row)})
+            continue
+        fields = []
+        if old["badge"] != row["badge"]:
+            fields.append("badge")
+        if old["apply_end"] != row["apply_end"]:
+            fields.append("apply_end")
+        elif old["content_hash"] != row["content_hash"]:
+            fields.append("content")
+        if fields:
+            changes.append({"pbancSn": sn, "kind": "changed", "fields": ",".join(fields), **_change_info(row)})
+    for sn, old in previous.items():
+        if sn not in current and not old.get("parse_error"):
+            changes.append({"pbancSn": sn, "kind": "closed", "fields": "", **_change_info(old)})
+    return changes
+
+
+def _change_info(row):
+    return {f: row[f] or "" for f in CHANGE_INFO_FIELDS}
+
+
+class PostingStore:
+    def __init__(self, path=DB_FILE):
+        self.path = path
+        with self.connect() as conn:
+            self._migrate(conn)
+
+    @contextmanager
+    def connect(self):
+        """자동 커밋 모드 연결. 쓰기는 transaction() 으로 묶는다"""
+        conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+        try:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA busy_timeout=30000")
+            yield conn
+        finally:
+            conn.close()
+
+    @contextmanager
+    def transaction(self):
+        """BEGIN IMMEDIATE 로 쓰기 잠금을 먼저 잡고, 실패하면 전부 되돌린다"""
+        with self.connect() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield conn
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+
+    def _migrate(self, conn):
+        if conn.execute("PRAGMA user_version").fetchone()[0] >= len(MIGRATIONS):
+            return
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            # 다른 프로세스가 먼저 적용했을 수 있으니 잠금을 잡은 뒤 다시 확인
+            version = conn.execute("PRAGMA user_version").fetchone()[0]
+            for number, script in enumerate(MIGRATIONS[version:], start=version + 1):
+                if callable(script):
+                    script(conn)
+                else:
+                    for statement in script.split(";"):
+                        if statement.strip():
+                            conn.execute(statement)
+                conn.execute(f"PRAGMA user_version = {number}")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+
+    # --- 읽기 ---
+    def count(self):
+        with self.connect() as conn:
+            return conn.execute("SELECT COUNT(*) FROM postings").fetchone()[0]
+
+    def known_sns(self):
+        with self.connect() as conn:
+            return {row[0] for row in conn.execute("SELECT pbancSn FROM postings")}
+
+    def load_records(self, source=None):
+        """저장된 공고를 사이트 목록 순서(최신순)의 dict 목록으로 반환 (source/link, 파싱 실패 정보 포함)
+
+        source 를 주면 그 게시판의 공고만.
+        """
+        fields = RECORD_FIELDS + SOURCE_FIELDS + PARSE_FAILURE_FIELDS
+        where, params = ("WHERE source = ?", (source,)) if source else ("", ())
+        with self.connect() as conn:
+            rows = conn.execute(f"SELECT {', '.join(fields)} FROM postings {where} ORDER BY {ORDER_BY}", params).fetchall()
+        return [dict(zip(fields, row)) for row in rows]
+
+    def sources(self):
+        """저장된 공고의 게시판 이름 목록"""
+        with self.connect() as conn:
+            return [row[0] for row in conn.execute("SELECT DISTINCT source FROM postings ORDER BY source")]
+
+    def _dataset_version(self, conn):
+        row = conn.execute("SELECT value FROM meta WHERE key = 'dataset_version'").fetchone()
+        return int(row[0]) if row else 0
+
+    def dataset_version(self):
+        """크롤링 결과가 반영될 때마다 1씩 오르는 번호 (캐시 키로 쓴다)"""
+        with self.connect() as conn:
+            return self._dataset_version(conn)
+
+    def get_meta(self, key, default=None):
+        with self.connect() as conn:
+            row = conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else default
+
+    # --- 쓰기 ---
+    def _upsert(self, conn, records, now):
+        self._upsert_rows(conn, [normalize_record(r) for r in records], now)
+
+    def _upsert_rows(self, conn, rows, now):
+        columns = RECORD_FIELDS + DERIVED_FIELDS + SOURCE_FIELDS + PARSE_FAILURE_FIELDS + ["quality", "content_hash"]
+        placeholders = ", ".join("?" for _ in columns) + ", ?"
+        updates = ", ".join(f"{c} = excluded.{c}" for c in columns[1:])
+        # 값이 실제로 바뀐 행만 다시 쓴다
+        changed = " OR ".join(f"postings.{c} IS NOT excluded.{c}" for c in columns[1:])
+        sql = (
+            f"INSERT INTO postings ({', '.join(columns)}, updated_at) VALUES ({placeholders}) "
+            f"ON CONFLICT(pbancSn) DO UPDATE SET {updates}, updated_at = excluded.updated_at "
+            f"WHERE {changed}"
+        )
+        conn.executemany(sql, [[row[c] for c in columns] + [now] for row in rows])
+
+    def upsert(self, records):
+        """공고를 추가하거나 바뀐 값만 갱신"""
+        with self.transaction() as conn:
+            self._upsert(conn, records, time.time())
+
+    def _replace_all(self, conn, records, now):
+        """정리한 행 목록을 반환"""
+        rows = [normalize_record(r) for r in records]
+        self._upsert_rows(conn, rows, now)
+        conn.execute("CREATE TEMP TABLE IF NOT EXISTS keep_sns (pbancSn TEXT PRIMARY KEY)")
+        conn.execute("DELETE FROM keep_sns")
+        conn.executemany("INSERT OR IGNORE INTO keep_sns VALUES (?)", [(row["pbancSn"],) for row in rows])
+        conn.execute("DELETE FROM postings WHERE pbancSn NOT IN (SELECT pbancSn FROM keep_sns)")
+        conn.execute("DROP TABLE keep_sns")
+        return rows
+
+    def replace_all(self, records):
+        """주어진 목록을 현재 게시판 상태로 반영 (없는 공고는 삭제) — 한 트랜잭션"""
+        with self.transaction() as conn:
+            self._replace_all(conn, records, time.time())
+
+    def publish(self, records):
+        """replace_all 과 같지만 같은 트랜잭션에서 데이터셋 버전을 올리고 변경 기록을 남긴다. 새 버전 반환"""
+        now = time.time()
+        with metrics.timer("store.publish"), self.transaction() as conn:
+            previous = self._change_state(conn)
+            rows = self._replace_all(conn, records, now)
+            version = self._dataset_version(conn) + 1
+            self.set_meta("dataset_version", version, conn=conn)
+            # 처음 반영하는 데이터는 비교 기준이 없으므로 변경으로 남기지 않는다
+            if previous:
+                self._log_changes(conn, diff_postings(previous, rows), version, now)
+        return version
+
+    def _change_state(self, conn):
+        columns = ["pbancSn", "content_hash", "badge", "apply_end", "parse_error"] + CHANGE_INFO_FIELDS
+        return {
+            row[0]: dict(zip(columns, row))
+            for row in conn.execute(f"SELECT {', '.join(columns)} FROM postings")
+        }
+
+    def _log_changes(self, conn, changes, version, now):
+        columns = CHANGE_FIELDS[1:]
+        conn.executemany(
+            f"INSERT INTO changes ({', '.join(columns)}) VALUES ({', '.join('?' for _ in columns)})",
+            [[version, now] + [c[f] for f in columns[2:]] for c in changes],
+        )
+        conn.execute("DELETE FROM changes WHERE detected_at < ?", (now - CHANGE_RETENTION_DAYS * 86400,))
+        for kind in ("new", "changed", "closed"):
+            count = sum(1 for c in changes if c["kind"] == kind)
+            if count:
+                metrics.incr("recruit_changes_total", count, kind=kind)
+
+    def set_meta(self, key, value, conn=None):
+        sql = "INSERT INTO meta (key, value) VALUES (?, ?) ON CONFLICT(key) DO UPDATE SET value = excluded.value"
+        if conn is not None:
+            conn.execute(sql, (key, str(value)))
+            return
+        with self.transaction() as conn:
+            conn.execute(sql, (key, str(value)))
+
+    def load_parse_failures(self, sns):
+        """공고번호 목록 → {공고번호: (실패 사유, 원문 일부)} (파싱에 실패했던 공고만)"""
+        sns = [str(sn) for sn in sns]
+        if not sns:
+            return {}
+        placeholders = ", ".join("?" for _ in sns)
+        with self.connect() as conn:
+            rows = conn.execute(
+                f"SELECT pbancSn, parse_error, raw_snippet FROM postings "
+                f"WHERE parse_error IS NOT NULL AND pbancSn IN ({placeholders})",
+                sns,
+            ).fetchall()
+        return {sn: (error, snippet) for sn, error, snippet in rows}
+
+    # --- 상세 페이지 캐시 ---
+    def detail_hashes(self):
+        """공고번호 → 캐시된 상세의 내용 해시"""
+        with self.connect() as conn:
+            return dict(conn.execute("SELECT pbancSn, content_hash FROM posting_details"))
+
+    def save_details(self, rows):
+        """상세 캐시 upsert 후, 목록에서 사라진 공고의 캐시는 지운다"""
+        columns = ["pbancSn", "content_hash", "fetched_at", "error"] + DETAIL_FIELDS
+        placeholders = ", ".join("?" for _ in columns)
+        updates = ", ".join(f"{c} = excluded.{c}" for c in columns[1:])
+        values = [
+            [json.dumps(r[c], ensure_ascii=False) if c == "attachments" else r[c] for c in columns]
+            for r in rows
+        ]
+        with self.transaction() as conn:
+            conn.executemany(
+                f"INSERT INTO posting_details ({', '.join(columns)}) VALUES ({placeholders}) "
+                f"ON CONFLICT(pbancSn) DO UPDATE SET {updates}",
+                values,
+            )
+            conn.execute("DELETE FROM posting_details WHERE pbancSn NOT IN (SELECT pbancSn FROM postings)")
+
+    def load_details(self, sns):
+        """공고번호 목록 → {공고번호: 상세 dict} (캐시가 있고 에러가 아닌 것만)"""
+        sns = [str(sn) for sn in sns]
+        if not sns:
+            return {}
+        placeholders = ", ".join("?" for _ in sns)
+        with self.connect() as conn:
+            rows = conn.execute(
+                f"SELECT pbancSn, {', '.join(DETAIL_FIELDS)} FROM posting_details "
+                f"WHERE error IS NULL AND pbancSn IN ({placeholders})",
+                sns,
+            ).fetchall()
+        details = {}
+        for sn, *values in rows:
+            row = dict(zip(DETAIL_FIELDS, values))
+            row["attachments"] = json.loads(row["attachments"] or "[]")
+            details[sn] = row
+        return details
+
+    # --- 변경 기록 / 구독 ---
+    def changes_since(self, version):
+        """dataset_version 이 version 보다 큰 변경 기록 (오래된 것부터 dict 목록)"""
+        with self.connect() as conn:
+            rows = conn.execute(
+                f"SELECT {', '.join(CHANGE_FIELDS)} FROM changes WHERE dataset_version > ? ORDER BY id",
+                (version,),
+            ).fetchall()
+        return [dict(zip(CHANGE_FIELDS, row)) for row in rows]
+
+    def add_subscription(self, owner, name, regions=(), subjects=()):
+        """owner(방문자 토큰)의 구독을 추가. 지금 버전 이후의 변경부터 확인한다. id 반환"""
+        with self.transaction() as conn:
+            cur = conn.execute(
+                "INSERT INTO subscriptions (owner, name, regions, subjects, seen_version, created_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (owner, name, json.dumps(list(regions), ensure_ascii=False),
+                 json.dumps(list(subjects), ensure_ascii=False), self._dataset_version(conn), time.time()),
+            )
+            return cur.lastrowid
+
+    def subscriptions(self, owner):
+        with self.connect() as conn:
+            rows = conn.execute(
+                f"SELECT {', '.join(SUBSCRIPTION_FIELDS)} FROM subscriptions WHERE owner = ? ORDER BY id", (owner,)
+            ).fetchall()
+        subscriptions = [dict(zip(SUBSCRIPTION_FIELDS, row)) for row in rows]
+        for sub in subscriptions:
+            sub["regions"] = json.loads(sub["regions"])
+            sub["subjects"] = json.loads(sub["subjects"])
+        return subscriptions
+
+    def mark_subscription_seen(self, owner, subscription_id, version):
+        with self.transaction() as conn:
+            conn.execute("UPDATE subscriptions SET seen_version = ? WHERE id = ? AND owner = ?",
+                         (version, subscription_id, owner))
+
+    def delete_subscription(self, owner, subscription_id):
+        with self.transaction() as conn:
+            conn.execute("DELETE FROM subscriptions WHERE id = ? AND owner = ?", (subscription_id, owner))
+
+    def visitor_seen_version(self, token):
+        """방문자가 지난번에 본 데이터 버전 (처음 온 방문자면 None)"""
+        with self.connect() as conn:
+            row = conn.execute("SELECT seen_version FROM visitors WHERE token = ?", (token,)).fetchone()
+        return row[0] if row else None
+
+    def mark_visitor_seen(self, token, version):
+        """방문자가 version 까지 봤다고 기록 (창 여러 개 중 예전 버전 쪽이 되돌리지 않는다)"""
+        with self.transaction() as conn:
+            conn.execute(
+                "INSERT INTO visitors (token, seen_version, seen_at) VALUES (?, ?, ?) "
+                "ON CONFLICT(token) DO UPDATE SET seen_version = MAX(seen_version, excluded.seen_version), "
+                "seen_at = excluded.seen_at",
+                (token, version, time.time()),
+            )
+
+    # --- 크롤링 실행 기록 ---
+    def start_run(self, trigger):
+        with self.transaction() as conn:
+            cur = conn.execute(
+                "INSERT INTO crawl_runs (trigger, status, started_at) VALUES (?, 'running', ?)",
+                (trigger, time.time()),
+            )
+            return cur.lastrowid
+
+    def finish_run(self, run_id, status, total=None, new_count=None, dataset_version=None, error=None,
+                   metrics=None):
+        with self.transaction() as conn:
+            conn.execute(
+                "UPDATE crawl_runs SET status = ?, finished_at = ?, total = ?, new_count = ?, "
+                "dataset_version = ?, error = ?, metrics = ? WHERE id = ?",
+                (status, time.time(), total, new_count, dataset_version, error,
+                 json.dumps(metrics, ensure_ascii=False) if metrics is not None else None, run_id),
+            )
+
+    def abandon_running_runs(self):
+        """프로세스가 죽어 'running' 으로 남은 기록을 정리 (크롤 잠금을 잡은 쪽에서만 호출)"""
+        with self.transaction() as conn:
+            conn.execute(
+                "UPDATE crawl_runs SET status = 'error', finished_at = ?, error = '중단됨' "
+                "WHERE status = 'running'",
+                (time.time(),),
+            )
+
+    def recent_runs(self, limit=5):
+        """최근 크롤링 기록 (최신순 dict 목록, metrics 는 dict 또는 None)"""
+        with self.connect() as conn:
+            rows = conn.execute(
+                f"SELECT {', '.join(RUN_FIELDS)} FROM crawl_runs ORDER BY id DESC LIMIT ?", (limit,)
+            ).fetchall()
+        runs = [dict(zip(RUN_FIELDS, row)) for row in rows]
+        for run in runs:
+            run["metrics"] = json.loads(run["metrics"]) if run["metrics"] else None
+        return runs
+
+    def request_refresh(self):
+        """수동 새로고침 요청을 남긴다 (스케줄러가 가져가 처리)"""
+        self.set_meta("refresh_requested_at", time.time())
+
+    def refresh_requested_at(self):
+        return float(self.get_meta("refresh_requested_at", 0))
+
+    # --- recruit_list.json 가져오기/내보내기 ---
+    def import_json(self, path=DATA_FILE):
+        """비어 있는 저장소에 기존 recruit_list.json 을 한 번만 가져온다. 가져온 건수 반환"""
+        if self.get_meta("json_imported") or not os.path.exists(path):
+            return 0
+        records = load_json_records(path)
+        with self.transaction() as conn:
+            # 동시에 다른 프로세스가 가져왔는지 잠금 안에서 다시 확인
+            if conn.execute("SELECT 1 FROM meta WHERE key = 'json_imported'").fetchone():
+                return 0
+            self.set_meta("json_imported", path, conn=conn)
+            # 이미 크롤링한 데이터가 있으면 오래된 파일로 덮지 않는다
+            if conn.execute("SELECT 1 FROM postings LIMIT 1").fetchone():
+                return 0
+            self._upsert(conn, records, time.time())
+        return len(records)
+
+    def export_json(self, path=DATA_FILE):
+        """예전 형식(recruit_list.json)으로 내보내기"""
+        with metrics.timer("store.export_json"):
+            save_json_records([{f: r[f] for f in RECORD_FIELDS} for r in self.load_records()], path)
+
+
+def open_store(path=DB_FILE, legacy_json=DATA_FILE):
+    """저장소를 열고, 비어 있으면 예전 JSON 파일을 한 번 가져온다"""
+    store = PostingStore(path)
+    store.import_json(legacy_json)
+    return store
+
+
+def load_json_records(path=DATA_FILE):
+    """JSON 파일의 공고 목록을 읽는다 (파일이 없거나 깨졌으면 빈 목록)"""
+    if not os.path.exists(path):
+        return []
+    with open(path, "r", encoding="utf-8") as f:
+        try:
+            return json.load(f)
+        except json.JSONDecodeError:
+            return []
+
+
+def save_json_records(records, path=DATA_FILE):
+    """임시 파일에 쓴 뒤 교체해서 읽는 쪽이 반쯤 쓰인 파일을 보지 않게 한다"""
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(prefix=".recruit_", suffix=".json", dir=directory)
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(records, f, ensure_ascii=False, indent=4)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
@@ -0,0 +1,217 @@
+"""저장해 둔 목록 HTML 을 돌려주는 로컬 대역 서버
+
+실제 사이트 대신 이 서버를 띄우고 GOE_BASE_URL 을 바꾸면
+네트워크 없이 HTTP 백엔드를 확인할 수 있다.
+
+    python -m crawler.stub_server --port 8765
+    python -m crawler.stub_server --records recruit_list.json --delay 0.2
+    GOE_BASE_URL=http://127.0.0.1:8765 python tr.py
+
+--records 를 주면 레코드를 currPage/pageIndex 에 맞게 잘라 목록 HTML 로
+그려 주므로 페이지 단위 수집도 확인할 수 있다. 상세 페이지(hnfpPbancInfoView.do
+?pbancSn=...)도 같은 레코드로 그려 준다.
+"""
+import argparse
+import html
+import json
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs
+
+from crawler.http_fetch import DETAIL_PATH, LIST_PATH
+
+DEFAULT_FIXTURE = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "fixtures", "hnfpPbancList.html")
+
+
+def render_item_html(record, views=0):
+    """레코드 하나를 실제 목록과 같은 구조의 <li> 로 그린다"""
+    e = html.escape
+    tops = [f'<span class="school">{e(record["school"])}</span>']
+    if record.get("phone"):
+        tops.append(f'<span class="tel">{e(record["phone"])}</span>')
+    tops.append(f'<span class="date">등록일 : {e(record["reg_date"])}</span>')
+    tops.append(f'<span class="hit">조회수 : {views}</span>')
+
+    badge = ""
+    if record.get("badge"):
+        cls = "bg-danger" if record["badge"] == "오늘마감" else "bg-warning"
+        badge = f'<span class="krds-badge {cls}">{e(record["badge"])}</span> '
+    job_field = "" if record.get("job_field") == "내용없음" else record.get("job_field", "")
+
+    return (
+        f'<li><a href="javascript:goView(\'{e(record["pbancSn"])}\');" title="상세보기">'
+        f'<div class="cont_top">{"".join(tops)}</div>'
+        f'<p class="cont_tit">{badge}{e(record["title"])}</p>'
+        '<div class="cont_btm">'
+        f'<div class="info_group"><p><span>{e(record["recruit_info"])}</span></p>'
+        f'<p><strong>채용인원</strong> {e(record["recruit_count"])}</p></div>'
+        f'<div class="date_group"><p><strong>접수기간</strong> {e(record["apply_period"])}</p>'
+        f'<p><strong>채용기간</strong> {e(record["work_period"])}</p></div>'
+        f'<p class="field"><strong>직무분야</strong> {e(job_field)}</p>'
+        "</div></a></li>"
+    )
+
+
+def render_detail_html(record):
+    """레코드 하나로 상세 페이지(hnfpPbancInfoView.do) 모양의 HTML 을 그린다"""
+    e = html.escape
+    subjects = "" if record.get("job_field") == "내용없음" else record.get("job_field", "")
+    rows = [
+        ("학교명", e(record["school"])),
+        ("응시자격", f"{e(subjects) or '해당 과목'} 교원자격증 소지자<br>교육공무원법 제10조의4 결격사유 없는 자"),
+        ("제출서류", "응시원서 1부<br>자기소개서 1부<br>교원자격증 사본 1부"),
+        ("접수방법", "방문 또는 이메일 접수"),
+        ("접수기간", e(record["apply_period"])),
+        ("문의처", e(record.get("phone") or "")),
+    ]
+    table = "".join(f"<tr><th scope=\"row\">{label}</th><td>{value}</td></tr>" for label, value in rows)
+    sn = e(record["pbancSn"])
+    return (
+        '<!DOCTYPE html>\n<html lang="ko">\n<head>\n<meta charset="UTF-8">\n'
+        "<title>채용공고 상세 | 경기도교육청</title>\n</head>\n<body>\n"
+        '<div class="board_view">\n'
+        f'<div class="view_head"><h3 class="view_tit">{e(record["title"])}</h3></div>\n'
+        f'<table class="view_table"><tbody>{table}</tbody></table>\n'
+        f'<div class="view_cont"><p>{e(record["school"])}에서 {e(record["title"])}을(를) 다음과 같이 공고합니다.</p>'
+        f'<p>채용기간: {e(record["work_period"])}</p><p>{e(record["recruit_info"])}</p></div>\n'
+        '<div class="file_list"><ul>'
+        f'<li><a href="/common/fileDown.do?atchFileId={sn}&amp;fileSn=1">채용공고문.hwp</a></li>'
+        f'<li><a href="/common/fileDown.do?atchFileId={sn}&amp;fileSn=2">응시원서.hwp</a></li>'
+        "</ul></div>\n</div>\n</body>\n</html>\n"
+    )
+
+
+def detail_responder(records):
+    """pbancSn → 상세 페이지 HTML bytes (없는 공고면 None)"""
+    by_sn = {str(r["pbancSn"]): r for r in records}
+
+    def respond(form):
+        record = by_sn.get(form.get("pbancSn", [""])[0])
+        return render_detail_html(record).encode("utf-8") if record else None
+    return respond
+
+
+def render_listing_html(records, total=None):
+    """레코드 목록을 목록 페이지 HTML 로 그린다"""
+    items = "\n".join(render_item_html(r, views=i) for i, r in enumerate(records))
+    return (
+        '<!DOCTYPE html>\n<html lang="ko">\n<head>\n<meta charset="UTF-8">\n'
+        "<title>채용공고 | 경기도교육청</title>\n</head>\n<body>\n"
+        f'<div class="board_total"><p>총 <strong>{len(records) if total is None else total}</strong>건</p></div>\n'
+        f'<div class="recruit_list">\n<ul>\n{items}\n</ul>\n</div>\n</body>\n</html>\n'
+    )
+
+
+def fixed_responder(html_bytes):
+    return lambda form: html_bytes
+
+
+def paged_responder(records):
+    """form 의 currPage/pageIndex 에 맞는 구간만 그려서 돌려준다"""
+    def respond(form):
+        curr_page = max(int(form.get("currPage", ["1"])[0] or 1), 1)
+        page_index = max(int(form.get("pageIndex", ["10"])[0] or 10), 1)
+        start = (curr_page - 1) * page_index
+        page = records[start:start + page_index]
+        return render_listing_html(page, total=len(records)).encode("utf-8")
+    return respond
+
+
+def make_handler(responder, delay=0.0, details=None):
+    class ListingHandler(BaseHTTPRequestHandler):
+        def _send_listing(self, form):
+            path = self.path.split("?")[0]
+            if path == LIST_PATH:
+                handler = responder
+            elif path == DETAIL_PATH and details is not None:
+                handler = details
+            else:
+                self.send_error(404)
+                return
+            if delay:
+                # 실제 서버의 응답 지연 흉내
+                time.sleep(delay)
+            body = handler(form)
+            if body is None:
+                self.send_error(404)
+                return
+            self.send_response(200)
+            self.send_header("Content-Type", "text/html; charset=UTF-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_GET(self):
+            query = self.path.split("?", 1)[1] if "?" in self.path else ""
+            self._send_listing(parse_qs(query))
+
+        def do_POST(self):
+            length = int(self.headers.get("Content-Length") or 0)
+            raw = self.rfile.read(length).decode("utf-8") if length else ""
+            self._send_listing(parse_qs(raw))
+
+        def log_message(self, format, *args):
+            pass
+
+    ListingHandler.protocol_version = "HTTP/1.1"
+    # 헤더와 본문이 따로 나가며 생기는 Nagle 지연(~40ms)을 막는다
+    ListingHandler.disable_nagle_algorithm = True
+    return ListingHandler
+
+
+def build_responder(html_path=DEFAULT_FIXTURE, records=None):
+    if records is not None:
+        return paged_responder(records)
+    with open(html_path, "rb") as f:
+        return fixed_responder(f.read())
+
+
+def build_detail_responder(html_path=DEFAULT_FIXTURE, records=None):
+    """상세 페이지는 레코드(없으면 목록 HTML 을 파싱한 결과)로 그린다"""
+    if records is None:
+        from crawler.parser import parse_recruit_html
+        with open(html_path, "rb") as f:
+            records = parse_recruit_html(f.read())
+    return detail_responder(records)
+
+
+def start_server(html_path=DEFAULT_FIXTURE, host="127.0.0.1", port=0, records=None, delay=0.0):
+    """백그라운드 스레드로 서버를 띄우고 (server, base_url) 반환"""
+    handler = make_handler(build_responder(html_path, records), delay,
+                           build_detail_responder(html_path, records))
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://{host}:{server.server_address[1]}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="채용 공고 목록 대역 서버")
+    parser.add_argument("--html", default=DEFAULT_FIXTURE, help="응답으로 돌려줄 목록 HTML 파일")
+    parser.add_argument("--records", help="페이지로 잘라 보여줄 레코드 JSON (recruit_list.json 형식)")
+    parser.add_argument("--delay", type=float, default=0.0, help="응답마다 넣을 지연(초)")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args()
+
+    records = None
+    if args.records:
+        with open(args.records, "r", encoding="utf-8") as f:
+            records = json.load(f)
+    handler = make_handler(build_responder(args.html, records), args.delay,
+                           build_detail_responder(args.html, records))
+    server = ThreadingHTTPServer((args.host, args.port), handler)
+    server.daemon_threads = True
+    print(f"대역 서버 실행 중: http://{args.host}:{args.port}{LIST_PATH}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1 @@
+"""대시보드(app.py) 화면에서 쓰는 색인과 필터"""
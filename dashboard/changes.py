@@ -0,0 +1,138 @@
+"""변경 피드: 지난 방문 이후 새 공고/바뀐 공고/사라진 공고와 구독 알림
+
+크롤링마다 저장소가 남기는 변경 기록(changes)만 읽는다. 방문자가 지난번에 본
+데이터 버전은 저장소에 방문자별로 남겨 두어 다시 열면 그 이후 변경만 보여 주고,
+구독(지역/과목 조건)도 마지막으로 확인한 버전 이후의 변경만 맞춰 본다.
+전체 공고가 아니라 변경 건수에 비례하는 비용이다.
+
+방문자는 주소의 ?me= 토큰으로 구분한다. 처음 방문하면 토큰을 만들어 주소에
+붙이고, 그 주소(북마크)로 다시 열어야 같은 구독과 지난 방문 기록이 보인다.
+로그인이 없으므로 토큰을 아는 사람은 그 구독을 볼 수 있다.
+"""
+import secrets
+
+import pandas as pd
+import streamlit as st
+
+from dashboard.subjects import get_clean_tokens
+
+KIND_LABELS = {"new": "🆕 새 공고", "changed": "✏️ 변경", "closed": "📪 내려감"}
+FIELD_LABELS = {"badge": "상태", "apply_end": "마감일", "content": "내용"}
+
+# 구독 알림에 넣는 변경 (내려간 공고는 알리지 않는다)
+ALERT_KINDS = {"new", "changed"}
+
+
+def collapse(changes):
+    """공고번호별 변경 하나로 합친다 (최근 것 우선, 기간 안에 새로 올라왔으면 new)"""
+    merged = {}
+    for change in changes:
+        sn = change["pbancSn"]
+        old = merged.get(sn)
+        if old is not None and old["kind"] == "new" and change["kind"] == "changed":
+            continue
+        if old is not None and old["kind"] == "changed" and change["kind"] == "changed":
+            fields = old["fields"].split(",") + [f for f in change["fields"].split(",") if f not in old["fields"]]
+            change = {**change, "fields": ",".join(fields)}
+        merged[sn] = change
+    return list(merged.values())
+
+
+def matches(change, regions, subjects):
+    """지역/과목 조건 (비어 있으면 조건 없음). 과목은 대표 과목으로 시작하는 토큰이 있으면 해당"""
+    if regions and change["region"] not in regions:
+        return False
+    if subjects:
+        tokens = get_clean_tokens(change["job_field"])
+        return any(token.startswith(subject) for token in tokens for subject in subjects)
+    return True
+
+
+def subscription_matches(subscription, changes):
+    """구독의 마지막 확인 버전 이후 변경 중 조건에 맞는 것"""
+    found = [
+        c for c in changes
+        if c["dataset_version"] > subscription["seen_version"] and c["kind"] in ALERT_KINDS
+        and matches(c, subscription["regions"], subscription["subjects"])
+    ]
+    return collapse(found)
+
+
+def changes_frame(changes):
+    return pd.DataFrame(
+        [{
+            "구분": KIND_LABELS[c["kind"]],
+            "바뀐 항목": ", ".join(FIELD_LABELS.get(f, f) for f in c["fields"].split(",") if f),
+            "지역": c["region"],
+            "학교명": c["school"],
+            "공고 제목": c["title"],
+            "직무(과목)": c["job_field"],
+        } for c in changes],
+        columns=["구분", "바뀐 항목", "지역", "학교명", "공고 제목", "직무(과목)"],
+    )
+
+
+def subscriber():
+    """이 방문자의 토큰: 주소의 ?me= (없으면 새로 만들어 주소에 남긴다)"""
+    if "subscriber" not in st.session_state:
+        st.session_state.subscriber = st.query_params.get("me") or secrets.token_urlsafe(12)
+    st.query_params["me"] = st.session_state.subscriber
+    return st.session_state.subscriber
+
+
+def seen_version(store, version):
+    """이 세션의 기준 버전: 이 방문자가 지난번에 본 버전 (처음 온 방문자면 지금 버전)"""
+    if "seen_version" not in st.session_state:
+        seen = store.visitor_seen_version(subscriber())
+        st.session_state.seen_version = version if seen is None else seen
+    return st.session_state.seen_version
+
+
+def mark_seen(store, version):
+    """화면을 그린 뒤 이 방문자가 version 까지 봤다고 저장 (버전이 바뀔 때만 쓴다)"""
+    if st.session_state.get("marked_version") != version:
+        store.mark_visitor_seen(subscriber(), version)
+        st.session_state.marked_version = version
+
+
+def render_changes_since(store, since, version):
+    """지난 방문 이후 변경 요약 (변경이 없으면 아무것도 그리지 않는다)"""
+    if since >= version:
+        return
+    changes = collapse(store.changes_since(since))
+    if not changes:
+        return
+    counts = {kind: sum(1 for c in changes if c["kind"] == kind) for kind in KIND_LABELS}
+    title = " · ".join(f"{label} {counts[kind]}건" for kind, label in KIND_LABELS.items() if counts[kind])
+    with st.expander(f"🔔 지난 방문 이후: {title}", expanded=counts["new"] > 0):
+        st.dataframe(changes_frame(changes), use_container_width=True, hide_index=True)
+
+
+def render_subscriptions(store, version, regions, subjects):
+    """사이드바 구독 목록 (이 방문자의 것만). 지금 고른 지역/과목 조건을 구독으로 저장할 수 있다"""
+    owner = subscriber()
+    subscriptions = store.subscriptions(owner)
+    if regions or subjects:
+        name = " / ".join(filter(None, [", ".join(regions), ", ".join(subjects)]))
+        if st.button("➕ 현재 조건 구독하기", help=name):
+            store.add_subscription(owner, name, regions, subjects)
+            st.rerun()
+    if not subscriptions:
+        st.caption("지역/과목을 고른 뒤 구독하면 새 공고가 올라올 때 여기에 표시됩니다. "
+                   "구독은 이 주소(?me=)에 묶이므로 북마크해 두세요.")
+        return
+
+    # 구독마다 따로 읽지 않고 가장 오래된 확인 버전 이후 변경을 한 번만 읽는다
+    changes = store.changes_since(min(sub["seen_version"] for sub in subscriptions))
+    for sub in subscriptions:
+        found = subscription_matches(sub, changes)
+        st.markdown(f"**{sub['name']}** · 새 알림 {len(found)}건")
+        if found:
+            st.dataframe(changes_frame(found), hide_index=True)
+        read_col, delete_col = st.columns(2)
+        if found and read_col.button("확인", key=f"sub_read_{sub['id']}"):
+            store.mark_subscription_seen(owner, sub["id"], version)
+            st.rerun()
+        if delete_col.button("삭제", key=f"sub_delete_{sub['id']}"):
+            store.delete_subscription(owner, sub["id"])
+            st.rerun()
@@ -0,0 +1,42 @@
+"""날짜 열 정렬 색인
+
+마감일/근무 시작일/등록일을 한 번 정렬해 두고, "N일 안에 마감", "X일 이후
+시작", "이번 주 등록" 같은 범위 질의를 이진 탐색(searchsorted)으로 처리한다.
+날짜가 없는 행(열린 기간)은 어떤 범위에도 들지 않고 정렬 시 맨 뒤로 간다.
+"""
+import numpy as np
+
+
+def to_day(value):
+    return np.datetime64(value, "D")
+
+
+class DateIndex:
+    def __init__(self, values):
+        days = np.asarray(values, dtype="datetime64[ns]").astype("datetime64[D]")
+        self.size = len(days)
+        valid = np.flatnonzero(~np.isnat(days))
+        self.order = valid[np.argsort(days[valid], kind="stable")]
+        self.sorted = days[self.order]
+        # 행 위치 → 정렬 순위 (같은 날짜는 같은 순위, 날짜가 없으면 맨 뒤)
+        self.rank = np.full(self.size, self.size, dtype=np.int64)
+        self.rank[self.order] = np.searchsorted(self.sorted, self.sorted, side="left")
+
+    def rows_between(self, start=None, end=None):
+        """start <= 날짜 <= end 인 행 위치 (날짜순). 한쪽이 None 이면 열린 범위"""
+        lo = 0 if start is None else np.searchsorted(self.sorted, to_day(start), side="left")
+        hi = len(self.sorted) if end is None else np.searchsorted(self.sorted, to_day(end), side="right")
+        return self.order[lo:hi]
+
+    def mask_between(self, start=None, end=None):
+        mask = np.zeros(self.size, dtype=bool)
+        mask[self.rows_between(start, end)] = True
+        return mask
+
+    def sort(self, rows, descending=False):
+        """행 위치를 날짜순으로 (같은 날짜는 기존 순서, 날짜 없는 행은 맨 뒤)"""
+        ranks = self.rank[rows]
+        if descending:
+            ranks = np.where(ranks == self.size, -1, ranks)
+            return rows[np.argsort(-ranks, kind="stable")]
+        return rows[np.argsort(ranks, kind="stable")]
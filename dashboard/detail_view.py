@@ -0,0 +1,114 @@
+"""상세 공고 리스트를 페이지 단위로 그리는 화면 조각
+
+검색 결과 전체를 iterrows 로 돌며 공고마다 위젯 10여 개를 만들던 것을 대신한다.
+현재 페이지에 보이는 행만 열 단위로 꺼내 카드를 그리므로, 그리는 시간은
+결과 건수가 아니라 페이지 크기에 비례한다. 페이지 위치는 session_state 에
+남아 rerun 사이에도 유지된다.
+"""
+import math
+
+import streamlit as st
+
+PAGE_SIZES = [10, 20, 50]
+
+# 정렬 이름 → (열, 내림차순 여부). None 이면 필터 결과 순서(검색 시 관련도 순) 그대로
+SORT_OPTIONS = {
+    "기본 순서": None,
+    "등록일 최신순": ("reg_date", True),
+    "등록일 오래된순": ("reg_date", False),
+    "학교명 가나다순": ("school", False),
+    "마감일 빠른순": ("apply_end", False),
+}
+
+CARD_COLUMNS = ["pbancSn", "region", "school", "title", "badge", "recruit_info", "job_field", "apply_period", "work_period", "원본링크"]
+
+
+def sort_rows(engine, rows, filter_key, sort_name):
+    """필터 결과 행 위치를 선택한 기준으로 정렬 (같은 값은 기존 순서 유지)
+
+    열별 순위는 필터 엔진이 데이터 버전마다 한 번 계산해 두고, 정렬 결과도
+    (버전, 필터 조건, 정렬) 로 캐시하므로 rerun 마다 전체 결과를 다시 정렬하지 않는다.
+    """
+    spec = SORT_OPTIONS.get(sort_name)
+    if spec is None or len(rows) < 2:
+        return rows
+    column, descending = spec
+    return engine.sorted_rows(rows, filter_key, column, descending)
+
+
+def page_slice(total, page, page_size):
+    """(시작, 끝, 전체 페이지 수) — page 는 1부터, 범위를 벗어나면 끝으로 맞춘다"""
+    pages = max(1, math.ceil(total / page_size))
+    page = min(max(1, page), pages)
+    start = (page - 1) * page_size
+    return start, min(start + page_size, total), pages
+
+
+def _card_values(df, rows):
+    """보이는 행만 열 단위로 꺼내 dict 목록으로 (iterrows 없이)"""
+    columns = {c: df[c].take(rows).tolist() for c in CARD_COLUMNS}
+    return [dict(zip(columns, values)) for values in zip(*columns.values())]
+
+
+def render_details(detail):
+    """상세 페이지에서 받아 둔 응시자격/제출서류/첨부파일"""
+    for field, label in (("qualifications", "응시자격"), ("documents", "제출서류"), ("apply_method", "접수방법")):
+        if detail.get(field):
+            st.markdown(f"**{label}**  \n" + detail[field].replace("\n", "  \n"))
+    if detail.get("attachments"):
+        st.markdown("**첨부파일** " + " · ".join(f"[{a['name']}]({a['url']})" for a in detail["attachments"]))
+
+
+def render_card(row, detail=None):
+    title_header = f"[{row['region']}] {row['school']} - {row['title']}"
+    if row['badge']: title_header += f" ({row['badge']})"
+
+    st.markdown(f"#### {title_header}")
+    c1, c2, c3 = st.columns([2, 2, 1])
+    with c1:
+        st.caption("상세정보")
+        st.write(f"{row['recruit_info']}")
+        st.write(f"**직무:** {row['job_field']}")
+    with c2:
+        st.caption("일정")
+        st.write(f"접수: {row['apply_period']}")
+        st.write(f"채용: {row['work_period']}")
+    with c3:
+        st.write("")
+        st.link_button("공고 바로가기", row['원본링크'])
+    if detail:
+        render_details(detail)
+    st.divider()
+
+
+def render_detail_list(df, engine, rows, filter_key, state_prefix="detail", details_loader=None):
+    """rows(필터 결과 행 위치) 중 현재 페이지만 그린다
+
+    filter_key 가 바뀌면(필터 조건 변경) 첫 페이지로 돌아간다. 정렬은 engine(FilterEngine) 이 맡는다.
+    details_loader(공고번호 목록) 를 주면 현재 페이지 공고의 상세 정보만 읽어 함께 그린다.
+    """
+    page_key = f"{state_prefix}_page"
+    filter_state_key = f"{state_prefix}_filter"
+    if st.session_state.get(filter_state_key) != filter_key:
+        st.session_state[filter_state_key] = filter_key
+        st.session_state[page_key] = 1
+
+    c1, c2 = st.columns(2)
+    with c1:
+        sort_name = st.selectbox("정렬", list(SORT_OPTIONS), key=f"{state_prefix}_sort")
+    with c2:
+        page_size = st.selectbox("페이지당 공고 수", PAGE_SIZES, index=1, key=f"{state_prefix}_page_size")
+
+    total = len(rows)
+    _, _, pages = page_slice(total, 1, page_size)
+    # 페이지 크기가 바뀌어 범위를 벗어나면 마지막 페이지로 맞춘다
+    st.session_state[page_key] = min(max(1, st.session_state.get(page_key, 1)), pages)
+    page = st.number_input(f"페이지 (전체 {pages}쪽)", min_value=1, max_value=pages, step=1, key=page_key)
+
+    start, end, _ = page_slice(total, page, page_size)
+    st.caption(f"{total}건 중 {start + 1}~{end}번째")
+
+    visible = sort_rows(engine, rows, filter_key, sort_name)[start:end]
+    details = details_loader(df['pbancSn'].take(visible).tolist()) if details_loader else {}
+    for row in _card_values(df, visible):
+        render_card(row, details.get(row['pbancSn']))
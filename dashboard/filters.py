@@ -0,0 +1,228 @@
+"""벡터화된 필터 엔진과 세션 공용 결과 캐시
+
+매 rerun 마다 df.copy() 후 마스크와 행 단위 apply 를 이어 붙이던 필터를
+대신한다. 지역/상태/학교/직무는 정수 코드(categorical)로 들고 있고, 값별
+불리언 마스크를 한 번 만들어 재사용한다. 결과(행 위치 배열)는
+(데이터셋 버전, 정규화한 필터 조건) 을 키로 하는 LRU 캐시에 넣어 모든
+세션이 함께 쓴다.
+"""
+import datetime
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+from dashboard.date_index import DateIndex
+from dashboard.search import SearchIndex
+from dashboard.subjects import SubjectIndex
+
+MISSING_REGION = "지역미기재"
+CATEGORY_COLUMNS = ["region", "badge", "school", "job_field", "source"]
+DATE_INDEX_COLUMNS = ["apply_end", "work_start", "reg_on"]
+
+
+class LRUCache:
+    """스레드 안전한 최근 사용 순 캐시"""
+
+    def __init__(self, maxsize=512):
+        self.maxsize = maxsize
+        self.data = OrderedDict()
+        self.lock = threading.Lock()
+
+    def get(self, key):
+        with self.lock:
+            value = self.data.get(key)
+            if value is not None:
+                self.data.move_to_end(key)
+            return value
+
+    def put(self, key, value):
+        with self.lock:
+            self.data[key] = value
+            self.data.move_to_end(key)
+            while len(self.data) > self.maxsize:
+                self.data.popitem(last=False)
+
+
+# 같은 프로세스의 모든 세션(과 API)이 함께 쓰는 결과 캐시
+RESULT_CACHE = LRUCache()
+
+
+def normalize_search(term):
+    return " ".join(term.casefold().split()) if term else ""
+
+
+class FilterEngine:
+    def __init__(self, df, version, cache=RESULT_CACHE):
+        self.version = version
+        self.size = len(df)
+        self.cache = cache
+        # 문자열 대신 정수 코드로 비교한다
+        self.categories = {c: pd.Categorical(df[c]) for c in CATEGORY_COLUMNS if c in df.columns}
+        self.subjects = SubjectIndex.build(df['job_field'].tolist())
+        self.search_index = SearchIndex.build({"school": df['school'].tolist(), "title": df['title'].tolist()})
+        self.dates = {c: DateIndex(df[c].to_numpy()) for c in DATE_INDEX_COLUMNS if c in df.columns}
+        # 수집 시 계산한 품질 검사 비트 플래그 (crawler.quality)
+        self.quality = df["quality"].to_numpy() if "quality" in df.columns else np.zeros(self.size, dtype=np.uint8)
+        # 정렬 순위(sort_rank)를 처음 쓸 때 계산하려고 원본을 들고 있는다
+        self._df = df
+        self._value_masks = {}
+        self._mask_lock = threading.Lock()
+
+    # --- 선택지 ---
+    def regions(self):
+        """지역 선택지 (가나다순, 지역미기재는 맨 뒤)"""
+        regions = sorted(self.categories["region"].categories.tolist())
+        if MISSING_REGION in regions:
+            regions.remove(MISSING_REGION)
+            regions.append(MISSING_REGION)
+        return regions
+
+    def badges(self):
+        return sorted(self.categories["badge"].categories.tolist())
+
+    def sources(self):
+        """데이터에 있는 게시판 이름 (예전 스냅샷처럼 열이 없으면 빈 목록)"""
+        if "source" not in self.categories:
+            return []
+        return sorted(self.categories["source"].categories.tolist())
+
+    # --- 마스크 ---
+    def value_mask(self, column, value):
+        """column == value 불리언 마스크 (값별로 한 번만 계산)"""
+        key = (column, value)
+        mask = self._value_masks.get(key)
+        if mask is None:
+            cat = self.categories[column]
+            code = cat.categories.get_indexer([value])[0]
+            mask = cat.codes == code if code >= 0 else np.zeros(self.size, dtype=bool)
+            mask.setflags(write=False)
+            with self._mask_lock:
+                self._value_masks[key] = mask
+        return mask
+
+    def flagged(self, flags):
+        """품질 검사 규칙(flags 비트) 중 하나라도 걸린 행 위치 (규칙 조합별로 한 번만 계산)"""
+        key = ("quality", flags)
+        rows = self._value_masks.get(key)
+        if rows is None:
+            rows = np.flatnonzero(self.quality & flags)
+            rows.setflags(write=False)
+            with self._mask_lock:
+                self._value_masks[key] = rows
+        return rows
+
+    # --- 정렬 ---
+    def sort_rank(self, column, descending=False):
+        """전체 행의 column 기준 순위 (같은 값은 같은 순위, 날짜가 없는 행은 방향과 상관없이 맨 뒤)
+
+        열과 방향마다 한 번만 계산하므로, 결과를 정렬할 때는 정수 순위만 비교하면 된다.
+        """
+        key = ("rank", column, descending)
+        ranks = self._value_masks.get(key)
+        if ranks is None:
+            values = self._df[column]
+            if values.dtype.kind == "M":
+                keys = values.to_numpy(dtype="datetime64[ns]").view(np.int64)
+                missing = values.isna().to_numpy()
+            else:
+                keys = values.astype(str).to_numpy()
+                missing = None
+            ranks = np.unique(keys, return_inverse=True)[1].astype(np.int64)
+            if descending:
+                ranks = ranks.max(initial=0) - ranks
+            if missing is not None:
+                ranks[missing] = ranks.max(initial=0) + 1
+            ranks.setflags(write=False)
+            with self._mask_lock:
+                self._value_masks[key] = ranks
+        return ranks
+
+    def sorted_rows(self, rows, filter_key, column, descending=False):
+        """필터 결과 rows 를 column 순으로 (같은 값은 기존 순서 유지). (버전, 조건, 정렬) 별로 캐시"""
+        key = (self.version, filter_key, "sort", column, descending)
+        result = self.cache.get(key)
+        if result is None:
+            result = rows[np.argsort(self.sort_rank(column, descending)[rows], kind="stable")]
+            result.setflags(write=False)
+            self.cache.put(key, result)
+        return result
+
+    def any_of(self, column, values):
+        masks = [self.value_mask(column, v) for v in values]
+        return masks[0] if len(masks) == 1 else np.logical_or.reduce(masks)
+
+    # --- 질의 ---
+    def normalize(self, search="", regions=(), subjects=(), sources=(), badge=None,
+                  closing_within=None, work_starts_after=None, registered_since=None, today=None):
+        """같은 조건이면 같은 캐시 키가 되도록 정리
+
+        badge 는 None 일 때만 조건 없음이다 (빈 문자열은 상태 배지가 없는 공고).
+        마감 기한 조건은 오늘 날짜에 따라 결과가 달라지므로 그때만 today 를 키에 넣는다.
+        """
+        if closing_within is not None:
+            today = today or datetime.date.today()
+        else:
+            today = None
+        return (
+            normalize_search(search),
+            tuple(sorted(set(regions))),
+            tuple(sorted(set(subjects))),
+            tuple(sorted(set(sources))),
+            badge,
+            closing_within,
+            work_starts_after,
+            registered_since,
+            today,
+        )
+
+    def query(self, **filters):
+        """조건에 맞는 행 위치 배열 (검색어가 있으면 관련도 순, 없으면 목록 순)
+
+        search, regions, subjects, sources(게시판), badge 외에 날짜 조건
+        closing_within(오늘부터 N일 안에 마감), work_starts_after(근무 시작일 >= 날짜),
+        registered_since(등록일 >= 날짜) 를 받는다.
+        """
+        key = (self.version,) + self.normalize(**filters)
+        rows = self.cache.get(key)
+        if rows is None:
+            rows = self._evaluate(*key[1:])
+            rows.setflags(write=False)
+            self.cache.put(key, rows)
+        return rows
+
+    def _and(self, mask, other):
+        return other if mask is None else mask & other
+
+    def _evaluate(self, search, regions, subjects, sources, badge,
+                  closing_within, work_starts_after, registered_since, today):
+        mask = None
+        if regions:
+            mask = self.any_of("region", regions)
+        if subjects:
+            mask = self._and(mask, self.subjects.mask(subjects))
+        if sources:
+            mask = self._and(mask, self.any_of("source", sources))
+        if badge is not None:
+            mask = self._and(mask, self.value_mask("badge", badge))
+        if closing_within is not None:
+            deadline = today + datetime.timedelta(days=closing_within)
+            mask = self._and(mask, self.dates["apply_end"].mask_between(today, deadline))
+        if work_starts_after is not None:
+            mask = self._and(mask, self.dates["work_start"].mask_between(work_starts_after, None))
+        if registered_since is not None:
+            mask = self._and(mask, self.dates["reg_on"].mask_between(registered_since, None))
+
+        if search:
+            rows = self.search_index.search(search)
+            return rows[mask[rows]] if mask is not None else rows
+        if mask is None:
+            return np.arange(self.size, dtype=np.int64)
+        return np.flatnonzero(mask)
+
+    def row_mask(self, rows):
+        """행 위치 배열을 전체 길이 불리언 마스크로"""
+        mask = np.zeros(self.size, dtype=bool)
+        mask[rows] = True
+        return mask
@@ -0,0 +1,78 @@
+"""사이드바 "크롤링 상태" 패널
+
+최근 크롤링 기록(crawl_runs.metrics)에서 소요 시간, 파싱/파싱 실패 공고 수,
+받은 용량, 재시도 횟수, 가장 오래 걸린 단계를 뽑아 표로 보여 주고,
+이 서버 프로세스의 화면 쪽 시간(데이터 로드, 필터)을 함께 보여 준다.
+"""
+import time
+
+import streamlit as st
+
+# 합계에서 뺄 상위 단계 (하위 단계 시간을 이미 포함한다)
+_OUTER_STAGES = {"crawl.total", "crawl.pages", "crawl.browser", "crawl.incremental_pages"}
+
+
+def _counter_total(counters, name):
+    """라벨과 상관없이 name 카운터의 합"""
+    return sum(v for key, v in counters.items() if key == name or key.startswith(name + "{"))
+
+
+def slowest_stage(timings):
+    stages = {k: v for k, v in timings.items() if k not in _OUTER_STAGES}
+    if not stages:
+        return ""
+    stage = max(stages, key=lambda k: stages[k]["total_s"])
+    return f"{stage} {stages[stage]['total_s']:.1f}s"
+
+
+def run_row(run):
+    """실행 기록 한 건 → 표 한 줄"""
+    summary = run.get("metrics") or {}
+    counters = summary.get("counters", {})
+    timings = summary.get("timings", {})
+    finished = run.get("finished_at")
+    return {
+        "시작": time.strftime("%m/%d %H:%M", time.localtime(run["started_at"])),
+        "종류": run["trigger"],
+        "상태": run["status"],
+        "소요(초)": round(finished - run["started_at"], 1) if finished else None,
+        "새 공고": run.get("new_count"),
+        "파싱": _counter_total(counters, "recruit_items_parsed_total"),
+        "파싱 실패": _counter_total(counters, "recruit_items_skipped_total"),
+        "받은 KB": round(_counter_total(counters, "recruit_bytes_fetched_total") / 1024),
+        "재시도": _counter_total(counters, "recruit_http_retries_total")
+                  + _counter_total(counters, "recruit_page_retries_total"),
+        "가장 느린 단계": slowest_stage(timings),
+    }
+
+
+def skip_reasons(runs):
+    """최근 실행들에서 파싱 실패 사유별 합계"""
+    reasons = {}
+    prefix = 'recruit_items_skipped_total{reason="'
+    for run in runs:
+        for key, value in ((run.get("metrics") or {}).get("counters") or {}).items():
+            if key.startswith(prefix):
+                reason = key[len(prefix):-2]
+                reasons[reason] = reasons.get(reason, 0) + value
+    return reasons
+
+
+def render_crawl_health(runs, dashboard_summary):
+    if runs:
+        st.dataframe([run_row(r) for r in runs], hide_index=True)
+        reasons = skip_reasons(runs)
+        if reasons:
+            st.caption("파싱 실패 사유: " + ", ".join(f"{r} {n}건" for r, n in reasons.items()))
+    else:
+        st.caption("아직 수집 기록이 없습니다.")
+
+    timings = dashboard_summary.get("timings", {})
+    parts = [
+        f"{label} {timings[stage]['last_s'] * 1000:.0f}ms"
+        for stage, label in (("dashboard.load_data", "데이터 로드"), ("dashboard.engine_build", "색인"),
+                             ("dashboard.filter", "필터"))
+        if stage in timings
+    ]
+    if parts:
+        st.caption("화면 (최근): " + " · ".join(parts))
@@ -0,0 +1,115 @@
+"""학교명/제목 검색용 글자 bigram 역색인
+
+매 입력마다 전체 행에 str.contains 정규식을 돌리던 검색을 대신한다.
+데이터셋 버전마다 한 번 색인을 만들고, 질의는 검색어의 bigram 목록을
+교집합한 후보 행만 실제 문자열로 확인하므로 전체 행 수가 아니라
+일치하는 행 수에 비례해 시간이 든다.
+
+- 공백으로 나눈 여러 단어는 AND 로 묶는다.
+- 정규식이 아니라 글자 그대로 비교한다 ("(", "." 등도 문자 그대로).
+- 영문 대소문자는 구분하지 않는다.
+- 결과는 관련도(단어가 맞은 필드의 가중치 합) 순으로 정렬된다.
+"""
+import numpy as np
+
+# 필드별 관련도 가중치 (학교명 > 제목 > 기타)
+DEFAULT_WEIGHTS = {"school": 3.0, "title": 2.0, "job_field": 1.0, "region": 1.0}
+
+_EMPTY = np.empty(0, dtype=np.int64)
+
+
+def _normalize(text):
+    return text.casefold() if isinstance(text, str) else ""
+
+
+def _grams(term):
+    """검색어를 찾을 때 반드시 들어 있어야 하는 bigram (한 글자면 그 글자)"""
+    if len(term) == 1:
+        return {term}
+    return {term[i:i + 2] for i in range(len(term) - 1)}
+
+
+class SearchIndex:
+    def __init__(self, fields, texts, postings, size):
+        self.fields = fields          # [(필드명, 가중치)]
+        self.texts = texts            # 필드명 → 정규화된 문자열 목록
+        self.postings = postings      # 필드명 → {gram → 정렬된 행 위치 배열}
+        self.size = size
+
+    @classmethod
+    def build(cls, columns, weights=None):
+        """columns: {필드명: 문자열 목록}. 가중치가 없는 필드는 1.0"""
+        weights = weights or DEFAULT_WEIGHTS
+        fields = [(name, weights.get(name, 1.0)) for name in columns]
+        texts = {name: [_normalize(v) for v in values] for name, values in columns.items()}
+        size = len(next(iter(texts.values()))) if texts else 0
+
+        postings = {}
+        for name, _ in fields:
+            field_postings = {}
+            for pos, text in enumerate(texts[name]):
+                grams = set(text)
+                grams.update(text[i:i + 2] for i in range(len(text) - 1))
+                for gram in grams:
+                    field_postings.setdefault(gram, []).append(pos)
+            postings[name] = {g: np.asarray(rows, dtype=np.int64) for g, rows in field_postings.items()}
+        return cls(fields, texts, postings, size)
+
+    def _field_rows(self, name, term, grams):
+        """한 필드에서 term 을 포함한 행 위치"""
+        lists = []
+        for gram in grams:
+            found = self.postings[name].get(gram)
+            if found is None:
+                return _EMPTY
+            lists.append(found)
+        lists.sort(key=len)
+        rows = lists[0]
+        for other in lists[1:]:
+            if not len(rows):
+                return _EMPTY
+            rows = np.intersect1d(rows, other, assume_unique=True)
+        if len(term) > 2 and len(rows):
+            # bigram 이 모두 있어도 연속으로 붙어 있는지는 실제 문자열로 확인
+            texts = self.texts[name]
+            rows = rows[np.fromiter((term in texts[p] for p in rows.tolist()), dtype=bool, count=len(rows))]
+        return rows
+
+    def _term_hits(self, term):
+        """(행 위치, 관련도) — 관련도는 term 이 들어 있는 필드 가중치의 합"""
+        grams = _grams(term)
+        rows, weights = [], []
+        for name, weight in self.fields:
+            found = self._field_rows(name, term, grams)
+            if len(found):
+                rows.append(found)
+                weights.append(np.full(len(found), weight))
+        if not rows:
+            return _EMPTY, np.empty(0)
+        unique_rows, inverse = np.unique(np.concatenate(rows), return_inverse=True)
+        return unique_rows, np.bincount(inverse, weights=np.concatenate(weights))
+
+    def search(self, query):
+        """모든 단어를 포함한 행 위치를 관련도 순으로 반환 (동점은 원래 순서)"""
+        terms = [t for t in dict.fromkeys(_normalize(query).split()) if t]
+        if not terms:
+            return np.arange(self.size, dtype=np.int64)
+
+        rows, scores = None, None
+        for term in terms:
+            term_rows, term_scores = self._term_hits(term)
+            if rows is None:
+                rows, scores = term_rows, term_scores
+            else:
+                rows, left, right = np.intersect1d(rows, term_rows, assume_unique=True, return_indices=True)
+                scores = scores[left] + term_scores[right]
+            if not len(rows):
+                return _EMPTY
+        # 관련도 내림차순, 같으면 행 위치(원래 목록 순서) 오름차순
+        return rows[np.lexsort((rows, -scores))]
+
+    def mask(self, query):
+        """search() 결과를 전체 행 길이의 불리언 마스크로"""
+        mask = np.zeros(self.size, dtype=bool)
+        mask[self.search(query)] = True
+        return mask
@@ -0,0 +1,97 @@
+"""직무(과목) 토큰 역색인
+
+job_field 문자열을 과목 토큰으로 정제하고, 다른 토큰의 접두어가 되는 가장 짧은
+토큰을 대표 과목(root)으로 묶는다. 데이터셋 버전마다 한 번만 만들어 두면
+과목 필터는 미리 계산한 행 집합을 합치는 것으로 끝난다.
+"""
+import re
+from bisect import bisect_right, insort
+
+import numpy as np
+
+_NOISE_RE = re.compile(r'\(.*?\)|[0-9]+|명')
+_NON_WORD_RE = re.compile(r'[^가-힣a-zA-Z]')
+
+
+def get_clean_tokens(text):
+    """"국어 1명(1년), 체육 1명" → ["국어", "체육"]"""
+    tokens = []
+    if not isinstance(text, str):
+        return tokens
+    for part in text.split(','):
+        clean = _NON_WORD_RE.sub('', _NOISE_RE.sub('', part))
+        if clean:
+            tokens.append(clean)
+    return tokens
+
+
+def covering_root(sorted_roots, token):
+    """token 의 접두어인 root 를 찾는다 (없으면 None)
+
+    root 끼리는 서로 접두어가 아니므로, 후보는 정렬 순서상 token 바로 앞에 오는
+    root 하나뿐이다.
+    """
+    pos = bisect_right(sorted_roots, token)
+    if pos and token.startswith(sorted_roots[pos - 1]):
+        return sorted_roots[pos - 1]
+    return None
+
+
+def derive_roots(tokens):
+    """짧은 토큰부터 보며 기존 root 로 시작하지 않는 토큰만 root 로 삼는다"""
+    roots = []
+    for token in sorted(set(tokens), key=len):
+        if covering_root(roots, token) is None:
+            insort(roots, token)
+    return roots
+
+
+class SubjectIndex:
+    """대표 과목 → 해당 과목이 들어 있는 행 위치(정렬된 배열)"""
+
+    def __init__(self, roots, rows_by_root, size):
+        self.roots = roots
+        self.rows_by_root = rows_by_root
+        self.size = size
+
+    @classmethod
+    def build(cls, job_fields):
+        # 같은 job_field 문자열이 많으므로 문자열별로 한 번만 정제한다
+        tokens_by_text = {}
+        row_tokens = []
+        for text in job_fields:
+            key = text if isinstance(text, str) else None
+            tokens = tokens_by_text.get(key)
+            if tokens is None:
+                tokens = tokens_by_text[key] = get_clean_tokens(text)
+            row_tokens.append(tokens)
+
+        roots = derive_roots(t for tokens in tokens_by_text.values() for t in tokens)
+        rows = {root: [] for root in roots}
+        for pos, tokens in enumerate(row_tokens):
+            seen = set()
+            for token in tokens:
+                root = covering_root(roots, token)
+                if root is not None and root not in seen:
+                    seen.add(root)
+                    rows[root].append(pos)
+        rows_by_root = {root: np.asarray(found, dtype=np.int64) for root, found in rows.items()}
+        return cls(roots, rows_by_root, len(row_tokens))
+
+    def rows(self, selected):
+        """선택한 과목 중 하나라도 포함한 행 위치 (합집합)"""
+        arrays = [self.rows_by_root[s] for s in selected if s in self.rows_by_root]
+        if not arrays:
+            return np.empty(0, dtype=np.int64)
+        if len(arrays) == 1:
+            return arrays[0]
+        return np.unique(np.concatenate(arrays))
+
+    def mask(self, selected):
+        """rows() 를 전체 행 길이의 불리언 마스크로"""
+        mask = np.zeros(self.size, dtype=bool)
+        for s in selected:
+            found = self.rows_by_root.get(s)
+            if found is not None:
+                mask[found] = True
+        return mask
@@ -9,9 +9,18 @@ source venv/bin/activate
 # 3. 기존 서버 끄기
 echo "기존 서버 종료 중..."
 pkill -f streamlit || true
+pkill -f "python api.py" || true
+pkill -f "python -m crawler schedule" || true
 
-# 4. 서버 실행 (로그 남기기 & 백그라운드 실행)
+# 4. 수집 스케줄러 실행 (주기 수집 + 새로고침 요청 처리, 한 프로세스만)
+nohup python -m crawler schedule > crawler.log 2>&1 &
+
+# 5. 서버 실행 (로그 남기기 & 백그라운드 실행)
+# 수집은 위 스케줄러가 맡으므로 Streamlit 안에서는 스케줄러 스레드를 띄우지 않는다
 echo "새 서버 실행 중..."
-nohup streamlit run app.py --server.headless true --browser.gatherUsageStats false > output.log 2>&1 &
+CRAWL_SCHEDULER=external nohup streamlit run app.py --server.headless true --browser.gatherUsageStats false > output.log 2>&1 &
+
+# 6. 조회 API 실행 (읽기 전용, 같은 recruit.db 를 읽는다)
+nohup python api.py --host 0.0.0.0 --port 8502 > api.log 2>&1 &
 
 echo "배포 완료!"
\ No newline at end of file
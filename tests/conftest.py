@@ -0,0 +1,56 @@
+"""테스트 공용 fixture — 저장해 둔 목록 결과와 대역 서버(crawler.stub_server)"""
+import json
+import os
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# pytest 를 어디서 실행하든 저장소 최상위의 crawler/dashboard 를 불러온다
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from crawler import stub_server  # noqa: E402
+
+
+@pytest.fixture(scope="session")
+def fixture_path():
+    return lambda name: os.path.join(ROOT, "fixtures", name)
+
+
+@pytest.fixture(scope="session")
+def expected(fixture_path):
+    """fixtures/hnfpPbancList.html 을 기존 Selenium 파서로 읽은 결과"""
+    with open(fixture_path("hnfpPbancList.expected.json"), encoding="utf-8") as f:
+        return json.load(f)
+
+
+@pytest.fixture(scope="session")
+def make_record():
+    """make_record(필드=값...) → 목록 레코드 하나 (나머지 필드는 기본값)"""
+    def make(**overrides):
+        record = {
+            "pbancSn": "100", "school": "가나고등학교", "title": "기간제교사 채용 공고", "badge": "",
+            "job_field": "국어", "recruit_info": "시급 경력무관 | 수원시", "recruit_count": "1",
+            "apply_period": "2026/01/03 ~ 2026/01/08", "work_period": "2026/03/01 ~ 2027/02/28",
+            "phone": "031-123-4567", "reg_date": "2026/01/03",
+        }
+        record.update(overrides)
+        return record
+    return make
+
+
+@pytest.fixture
+def stub():
+    """stub(records=..., delay=...) → 대역 서버 주소. 테스트가 끝나면 닫는다"""
+    servers = []
+
+    def start(**kwargs):
+        server, base_url = stub_server.start_server(**kwargs)
+        servers.append(server)
+        return base_url
+
+    yield start
+    for server in servers:
+        server.shutdown()
+        server.server_close()
@@ -0,0 +1,42 @@
+"""테스트용 게시판 플러그인 (CRAWL_SOURCE_MODULES=tests.plugin_sources)
+
+네트워크 대신 메모리의 레코드로 목록 HTML 을 그려 준다. spawn 으로 뜬 수집
+프로세스도 이 모듈을 다시 불러와 같은 게시판을 등록한다.
+"""
+from crawler.sources import Source, register
+from crawler.stub_server import render_listing_html
+
+
+def board(first_sn, count, school):
+    """공고번호 first_sn 부터 내림차순 count 건"""
+    return [{
+        "pbancSn": str(first_sn - i), "school": school, "title": f"기간제교사 채용 공고 {i}", "badge": "",
+        "job_field": "국어", "recruit_info": "시급 경력무관 | 수원시", "recruit_count": "1",
+        "apply_period": "2026/01/03 ~ 2026/01/08", "work_period": "2026/03/01 ~ 2027/02/28",
+        "phone": "", "reg_date": "2026/01/03",
+    } for i in range(count)]
+
+
+class MemorySource(Source):
+    """records 를 페이지로 나눠 목록 HTML 로 돌려주는 게시판"""
+
+    def __init__(self, name, records):
+        super().__init__(name, f"{name} 게시판", base_url=f"http://{name}.test",
+                         detail_url=f"http://{name}.test/view?sn={{sn}}")
+        self.records = records
+
+    def fetch_list_html(self, session, curr_page, page_size, base_url=None):
+        start = (curr_page - 1) * page_size
+        return render_listing_html(self.records[start:start + page_size], total=len(self.records))
+
+
+class BrokenSource(Source):
+    """수집할 때마다 실패하는 게시판"""
+
+    def crawl(self, existing, full=False, rate=None):
+        raise RuntimeError("게시판 점검 중")
+
+
+ALPHA = register(MemorySource("alpha", board(130, 30, "알파고등학교")))
+BETA = register(MemorySource("beta", board(130, 5, "베타중학교")))
+BROKEN = register(BrokenSource("broken", "점검 중인 게시판", base_url="http://broken.test"))
@@ -0,0 +1,72 @@
+"""조회 API — 필터 결과, ETag/304 와 새 데이터 반영"""
+import json
+import urllib.error
+import urllib.parse
+import urllib.request
+
+import pytest
+
+import api
+from crawler.store import PostingStore
+
+
+@pytest.fixture
+def store(tmp_path, expected):
+    store = PostingStore(str(tmp_path / "recruit.db"))
+    store.publish(expected)
+    return store
+
+
+@pytest.fixture
+def base_url(store, monkeypatch):
+    # 요청마다 데이터 버전을 다시 확인한다
+    monkeypatch.setattr(api, "VERSION_TTL", 0.0)
+    server, url = api.start_server(store)
+    yield url
+    server.shutdown()
+    server.server_close()
+
+
+def get(url, etag=None):
+    """(상태, ETag, 본문 JSON 또는 None)"""
+    request = urllib.request.Request(url, headers={"If-None-Match": etag} if etag else {})
+    try:
+        with urllib.request.urlopen(request, timeout=10) as response:
+            return response.status, response.headers["ETag"], json.loads(response.read())
+    except urllib.error.HTTPError as e:
+        body = e.read()
+        return e.code, e.headers["ETag"], json.loads(body) if body else None
+
+
+def test_postings_filters_and_pages(base_url, expected):
+    status, _, body = get(f"{base_url}/api/postings?per_page=5&fields=pbancSn,school")
+    assert status == 200
+    assert (body["total"], body["pages"]) == (len(expected), -(-len(expected) // 5))
+    assert [item["pbancSn"] for item in body["items"]] == [r["pbancSn"] for r in expected[:5]]
+    assert set(body["items"][0]) == {"pbancSn", "school"}
+
+    school = expected[0]["school"]
+    _, _, found = get(f"{base_url}/api/postings?search={urllib.parse.quote(school)}&fields=school")
+    assert found["total"] >= 1 and all(school in item["school"] for item in found["items"])
+
+
+def test_bad_parameter_is_400(base_url):
+    assert get(f"{base_url}/api/postings?page=0")[0] == 400
+    assert get(f"{base_url}/api/postings?fields=nope")[0] == 400
+    assert get(f"{base_url}/api/nowhere")[0] == 404
+
+
+def test_etag_is_304_until_publish(base_url, store, expected):
+    status, etag, body = get(f"{base_url}/api/postings")
+    assert status == 200 and etag == f'"{body["dataset_version"]}"'
+    assert get(f"{base_url}/api/postings", etag=etag)[:2] == (304, etag)
+
+    store.publish(expected[1:])
+    status, new_etag, body = get(f"{base_url}/api/postings", etag=etag)
+    assert status == 200 and new_etag != etag
+    # ETag 와 본문은 같은 버전에서 나온다
+    assert new_etag == f'"{body["dataset_version"]}"' == f'"{store.dataset_version()}"'
+    assert body["total"] == len(expected) - 1
+
+    _, _, changes = get(f"{base_url}/api/changes?since={body['dataset_version'] - 1}")
+    assert [(c["kind"], c["pbancSn"]) for c in changes["changes"]] == [("closed", expected[0]["pbancSn"])]
@@ -0,0 +1,109 @@
+"""브라우저 풀 — 가짜 드라이버로 재사용/교체/종료 확인 (Chrome 없이)"""
+import pytest
+
+from crawler import browser
+
+
+class FakeDriver:
+    launched = []
+
+    def __init__(self):
+        self.alive = True
+        self.quits = 0
+        FakeDriver.launched.append(self)
+
+    def execute_script(self, script, *args):
+        if not self.alive:
+            raise RuntimeError("chrome not reachable")
+        return 1
+
+    def quit(self):
+        self.quits += 1
+
+
+@pytest.fixture
+def launched(monkeypatch):
+    FakeDriver.launched = []
+    monkeypatch.setattr(browser, "setup_driver", lambda headless=True: FakeDriver())
+    return FakeDriver.launched
+
+
+def test_driver_is_reused_then_recycled_after_max_uses(launched):
+    pool = browser.DriverPool(size=1, max_uses=2)
+    with pool.lease() as first:
+        pass
+    with pool.lease() as second:
+        assert second is first
+    assert first.quits == 1
+    with pool.lease() as third:
+        assert third is not first
+    assert len(launched) == 2
+
+
+def test_failed_health_check_replaces_driver(launched):
+    pool = browser.DriverPool(size=1, max_uses=10)
+    pool.warm()
+    [dead] = launched
+    dead.alive = False
+    with pool.lease() as driver:
+        assert driver is not dead
+    assert dead.quits == 1
+    assert pool.idle == [(driver, 1)]
+
+
+def test_error_in_block_discards_driver(launched):
+    pool = browser.DriverPool(size=1, max_uses=10)
+    with pytest.raises(ValueError):
+        with pool.lease():
+            raise ValueError("page broke")
+    assert launched[0].quits == 1
+    assert pool.idle == []
+    # 에러가 나도 자리는 돌려준다
+    with pool.lease() as driver:
+        assert driver is not launched[0]
+
+
+def test_close_quits_idle_drivers_and_refuses_leases(launched):
+    pool = browser.DriverPool(size=2, max_uses=10)
+    pool.warm()
+    assert len(launched) == 2
+    pool.close()
+    assert [d.quits for d in launched] == [1, 1]
+    with pytest.raises(RuntimeError):
+        with pool.lease():
+            pass
+
+
+def test_post_waits_for_new_list_instead_of_sleeping():
+    pytest.importorskip("selenium")
+    from selenium.common.exceptions import NoSuchElementException, StaleElementReferenceException
+
+    class Element:
+        def __init__(self, driver, page):
+            self.driver, self.page = driver, page
+
+        def is_enabled(self):
+            if self.driver.page != self.page:
+                raise StaleElementReferenceException("old page")
+            return True
+
+    class PostDriver:
+        page = None
+        submitted = None
+
+        def get(self, url):
+            self.page = "blank"
+
+        def execute_script(self, script, url, payload):
+            self.submitted = payload
+            self.page = "list"
+
+        def find_element(self, by, value):
+            if value == browser.LIST_SELECTOR and self.page != "list":
+                raise NoSuchElementException(value)
+            return Element(self, self.page)
+
+    driver = PostDriver()
+    browser.get_data_with_post(driver, page_index=50, curr_page=2, timeout=1)
+    assert driver.page == "list"
+    assert driver.submitted["currPage"] == "2"
@@ -0,0 +1,80 @@
+"""변경 피드 — 방문자별 지난 방문 버전, 방문자별 구독과 알림"""
+import pytest
+
+from crawler import store as store_module
+from crawler.store import MIGRATIONS, PostingStore
+from dashboard.changes import collapse, subscription_matches
+
+
+@pytest.fixture
+def store(tmp_path):
+    return PostingStore(str(tmp_path / "recruit.db"))
+
+
+def test_visitor_seen_version_is_kept_per_token(store):
+    assert store.visitor_seen_version("me-a") is None
+    store.mark_visitor_seen("me-a", 3)
+    store.mark_visitor_seen("me-b", 1)
+    assert (store.visitor_seen_version("me-a"), store.visitor_seen_version("me-b")) == (3, 1)
+    # 예전 버전을 보던 다른 창이 기록을 되돌리지 않는다
+    store.mark_visitor_seen("me-a", 2)
+    assert store.visitor_seen_version("me-a") == 3
+    store.mark_visitor_seen("me-a", 5)
+    assert store.visitor_seen_version("me-a") == 5
+
+
+def test_subscriptions_are_scoped_to_owner(store):
+    mine = store.add_subscription("me-a", "수원 국어", ["수원시"], ["국어"])
+    store.add_subscription("me-b", "전체")
+    assert [s["name"] for s in store.subscriptions("me-a")] == ["수원 국어"]
+    assert store.subscriptions("me-a")[0]["regions"] == ["수원시"]
+
+    # 다른 방문자는 내 구독을 지우거나 읽음 처리하지 못한다
+    store.delete_subscription("me-b", mine)
+    store.mark_subscription_seen("me-b", mine, 9)
+    assert store.subscriptions("me-a")[0]["seen_version"] == 0
+    store.mark_subscription_seen("me-a", mine, 9)
+    assert store.subscriptions("me-a")[0]["seen_version"] == 9
+    store.delete_subscription("me-a", mine)
+    assert store.subscriptions("me-a") == []
+
+
+def test_migration_drops_subscriptions_without_owner(tmp_path, monkeypatch):
+    path = str(tmp_path / "recruit.db")
+    # 방문자 기록 직전 스키마에 주인 없는 예전 구독과 주인 있는 구독을 하나씩 넣는다
+    with monkeypatch.context() as m:
+        m.setattr(store_module, "MIGRATIONS", MIGRATIONS[:-1])
+        old = PostingStore(path)
+    with old.transaction() as conn:
+        conn.execute("INSERT INTO subscriptions (owner, name, created_at) VALUES ('', '예전 구독', 0)")
+        conn.execute("INSERT INTO subscriptions (owner, name, created_at) VALUES ('me-a', '내 구독', 0)")
+
+    store = PostingStore(path)
+    with store.connect() as conn:
+        assert conn.execute("SELECT owner, name FROM subscriptions").fetchall() == [("me-a", "내 구독")]
+    assert store.visitor_seen_version("me-a") is None
+
+
+def _change(version, sn, kind="new", fields="", region="수원시", job_field="국어"):
+    return {"dataset_version": version, "pbancSn": sn, "kind": kind, "fields": fields,
+            "region": region, "job_field": job_field, "school": "", "title": "", "source": "goe"}
+
+
+def test_subscription_alerts_only_after_seen_version():
+    subscription = {"seen_version": 2, "regions": ["수원시"], "subjects": ["국어"]}
+    changes = [
+        _change(2, "1"),
+        _change(3, "2"),
+        _change(3, "3", region="성남시"),
+        _change(3, "4", job_field="수학"),
+        _change(4, "2", kind="changed", fields="badge"),
+        _change(4, "5", kind="closed"),
+    ]
+    # 기간 안에 새로 올라온 공고의 이후 변경은 new 하나로 합친다
+    assert [(c["pbancSn"], c["kind"]) for c in subscription_matches(subscription, changes)] == [("2", "new")]
+
+
+def test_collapse_merges_changed_fields():
+    changes = [_change(2, "1", kind="changed", fields="badge"), _change(3, "1", kind="changed", fields="apply_end,badge")]
+    [merged] = collapse(changes)
+    assert merged["fields"] == "badge,apply_end" and merged["dataset_version"] == 3
@@ -0,0 +1,63 @@
+"""기간 문자열 해석과 날짜 범위 색인"""
+import datetime
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from crawler.dates import date_fields, parse_date, parse_period
+from dashboard.date_index import DateIndex
+
+
+@pytest.mark.parametrize("text, period", [
+    ("2026/01/03 ~ 2026/01/08", ("2026-01-03", "2026-01-08")),
+    ("2026.3.9 ~ 2026-12-31", ("2026-03-09", "2026-12-31")),
+    ("2026/03/09 ~", ("2026-03-09", None)),
+    ("~ 2027/02/28", (None, "2027-02-28")),
+    ("~", (None, None)),
+    ("", (None, None)),
+    (None, (None, None)),
+    ("2026/03/01", ("2026-03-01", "2026-03-01")),
+])
+def test_parse_period(text, period):
+    assert parse_period(text) == period
+
+
+@pytest.mark.parametrize("text", ["2026/13/01 ~ 2026/12/01", "내일 ~ 모레", "2026/01/03 ~ 미정", "2026-01"])
+def test_malformed_period_raises(text):
+    with pytest.raises(ValueError):
+        parse_period(text)
+
+
+def test_date_fields_reports_failed_fields(make_record):
+    values, failed = date_fields(make_record(work_period="협의 후 결정", reg_date="2026/01/03"))
+    assert failed == ["work_period"]
+    assert values["apply_end"] == "2026-01-08"
+    assert values["work_start"] is None and values["work_end"] is None
+    assert values["reg_on"] == parse_date("2026.01.03")
+
+
+@pytest.fixture
+def index():
+    days = pd.to_datetime(["2026-01-05", None, "2026-01-03", "2026-01-08", "2026-01-05", None])
+    return DateIndex(days.to_numpy())
+
+
+def test_bounds_are_inclusive(index):
+    assert index.rows_between("2026-01-03", "2026-01-05").tolist() == [2, 0, 4]
+    assert index.rows_between(datetime.date(2026, 1, 5), datetime.date(2026, 1, 5)).tolist() == [0, 4]
+    assert index.rows_between("2026-01-04", "2026-01-07").tolist() == [0, 4]
+    assert index.mask_between("2026-01-08", "2026-01-08").tolist() == [False, False, False, True, False, False]
+
+
+def test_open_ranges_skip_missing_dates(index):
+    assert index.rows_between("2026-01-05", None).tolist() == [0, 4, 3]
+    assert index.rows_between(None, "2026-01-04").tolist() == [2]
+    assert index.rows_between().tolist() == [2, 0, 4, 3]
+    assert not index.mask_between("2026-01-09", None).any()
+
+
+def test_sort_puts_missing_dates_last(index):
+    rows = np.arange(6)
+    assert index.sort(rows).tolist() == [2, 0, 4, 3, 1, 5]
+    assert index.sort(rows, descending=True).tolist() == [3, 0, 4, 2, 1, 5]
@@ -0,0 +1,66 @@
+"""공고 상세 페이지 파싱과 내용 해시 캐시로 하는 보강 수집"""
+import pytest
+
+from crawler.detail import enrich_details, parse_detail_html, pending_details
+from crawler.parser import ItemParseError
+from crawler.store import PostingStore
+from crawler.stub_server import render_detail_html
+
+# 테스트에서는 요청 속도 제한을 사실상 풀어 둔다
+RATE = 1000.0
+
+
+def test_parses_rendered_detail_page(make_record):
+    details = parse_detail_html(render_detail_html(make_record(pbancSn="7")), base_url="http://stub")
+    assert details["qualifications"].startswith("국어 교원자격증 소지자")
+    assert "자기소개서 1부" in details["documents"]
+    assert details["apply_method"] == "방문 또는 이메일 접수"
+    assert "채용기간: 2026/03/01 ~ 2027/02/28" in details["description"]
+    assert details["attachments"] == [
+        {"name": "채용공고문.hwp", "url": "http://stub/common/fileDown.do?atchFileId=7&fileSn=1"},
+        {"name": "응시원서.hwp", "url": "http://stub/common/fileDown.do?atchFileId=7&fileSn=2"},
+    ]
+
+
+def test_reads_definition_list_labels_and_skips_duplicate_links():
+    html = (
+        '<div class="board_view"><dl><dt>응시 자격</dt><dd>중등 교원자격증</dd>'
+        '<dt>접수 방법</dt><dd>이메일</dd></dl>'
+        '<a href="/fileDown.do?id=1">공고문</a><a href="/fileDown.do?id=1">공고문</a><a href="#">없음</a></div>'
+    )
+    details = parse_detail_html(html, base_url="http://stub")
+    assert (details["qualifications"], details["apply_method"], details["documents"]) == ("중등 교원자격증", "이메일", "")
+    assert details["attachments"] == [{"name": "공고문", "url": "http://stub/fileDown.do?id=1"}]
+
+
+def test_page_without_detail_area_is_parse_error():
+    with pytest.raises(ItemParseError):
+        parse_detail_html("<html><body><p>잘못된 접근입니다.</p></body></html>")
+
+
+def test_detail_enrichment_uses_content_hash_cache(stub, expected, tmp_path):
+    base_url = stub(records=expected)
+    store = PostingStore(str(tmp_path / "recruit.db"))
+    store.publish(expected)
+
+    fetched, skipped, failed = enrich_details(store, expected, rate=RATE, base_url=base_url)
+    assert (fetched, skipped, failed) == (len(expected), 0, 0)
+    details = store.load_details([expected[0]["pbancSn"]])[expected[0]["pbancSn"]]
+    assert "교원자격증" in details["qualifications"]
+    assert len(details["attachments"]) == 2
+
+    # 내용이 그대로면 다시 받지 않고, 바뀐 공고만 받는다
+    changed = [dict(expected[0], title=expected[0]["title"] + " (수정)")] + expected[1:]
+    assert enrich_details(store, expected, rate=RATE, base_url=base_url) == (0, len(expected), 0)
+    assert enrich_details(store, changed, rate=RATE, base_url=base_url) == (1, len(expected) - 1, 0)
+
+
+def test_enrichment_is_capped_per_run(stub, expected, tmp_path):
+    base_url = stub(records=expected)
+    store = PostingStore(str(tmp_path / "recruit.db"))
+    store.publish(expected)
+
+    assert enrich_details(store, expected, rate=RATE, base_url=base_url, max_items=5) == (5, 0, 0)
+    # 남은 공고는 다음 번에 받는다
+    assert len(pending_details(store, expected)) == len(expected) - 5
+    assert enrich_details(store, expected, rate=RATE, base_url=base_url) == (len(expected) - 5, 5, 0)
@@ -0,0 +1,47 @@
+"""목록 조회 진입점 — HTTP 백엔드를 대역 서버로 확인하고, 실패할 때만 브라우저로 넘어가는지"""
+import sys
+import types
+
+import pytest
+
+from crawler import fetch, http_fetch
+from crawler.parser import parse_recruit_html
+
+
+@pytest.fixture
+def fake_browser(monkeypatch):
+    """Selenium 없이 브라우저 대체 수집을 흉내 낸다 (불린 횟수를 센다)"""
+    calls = []
+    module = types.ModuleType("crawler.browser")
+
+    def fetch_list_html_with_browser(page_index=500, curr_page=1):
+        calls.append((curr_page, page_index))
+        return "<div class='recruit_list'><ul></ul></div>"
+
+    module.fetch_list_html_with_browser = fetch_list_html_with_browser
+    monkeypatch.setitem(sys.modules, "crawler.browser", module)
+    return calls
+
+
+def test_http_backend_matches_fixture(stub, expected):
+    base_url = stub()
+    html = http_fetch.fetch_list_html(base_url=base_url)
+    assert http_fetch.looks_like_list_page(html)
+    assert parse_recruit_html(html) == expected
+
+
+def test_fetch_listing_prefers_http(stub, expected, fake_browser):
+    html = fetch.fetch_listing(backend="auto", base_url=stub())
+    assert parse_recruit_html(html) == expected
+    assert fake_browser == []
+
+
+def test_fetch_listing_falls_back_to_browser(stub, fake_browser, tmp_path):
+    blocked = tmp_path / "blocked.html"
+    blocked.write_text("<html><body>접근이 차단되었습니다</body></html>", encoding="utf-8")
+    base_url = stub(html_path=str(blocked))
+
+    fetch.fetch_listing(backend="auto", base_url=base_url)
+    assert fake_browser == [(1, 500)]
+    with pytest.raises(fetch.FetchError):
+        fetch.fetch_listing(backend="http", base_url=base_url)
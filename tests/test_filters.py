@@ -0,0 +1,120 @@
+"""벡터화한 필터 엔진 — 예전 app.py 의 pandas 필터와 같은 행을 고르는지, 결과 캐시"""
+import datetime
+
+import numpy as np
+import pytest
+
+from benchmarks.synthetic import generate_records
+from crawler.dates import parse_period
+from crawler.snapshot import ensure_snapshot, read_snapshot, to_dataframe
+from crawler.store import PostingStore
+from dashboard.filters import FilterEngine, LRUCache
+from dashboard.subjects import get_clean_tokens
+
+TODAY = datetime.date(2025, 12, 28)
+
+
+@pytest.fixture(scope="module")
+def df(tmp_path_factory):
+    store = PostingStore(str(tmp_path_factory.mktemp("filters") / "recruit.db"))
+    store.publish(generate_records(1500, seed=11))
+    path, _ = ensure_snapshot(store)
+    return to_dataframe(read_snapshot(path))
+
+
+@pytest.fixture(scope="module")
+def baseline(df):
+    """예전 load_data 처럼 문자열 열로 만든 DataFrame (지역도 예전 방식으로 다시 계산)"""
+    base = df[["pbancSn", "school", "title", "badge", "job_field", "recruit_info", "apply_period"]].astype(str)
+
+    def get_region(info_text):
+        if "|" in str(info_text):
+            return str(info_text).split("|")[-1].strip()
+        return "지역미기재"
+
+    base["region"] = base["recruit_info"].apply(get_region)
+    return base
+
+
+@pytest.fixture
+def engine(df):
+    return FilterEngine(df, 1, LRUCache())
+
+
+def rows_of(selected):
+    return selected.index.tolist()
+
+
+def test_regions_match_isin(engine, baseline):
+    regions = ["수원시", "지역미기재", "가평군"]
+    assert engine.query(regions=regions).tolist() == rows_of(baseline[baseline["region"].isin(regions)])
+    assert engine.regions()[-1] == "지역미기재"
+
+
+def test_subjects_match_token_prefix(engine, baseline):
+    # 화면은 대표 과목(root) 중에서만 고르게 한다
+    selected = engine.subjects.roots[::4]
+
+    def check_subject_match(row_text):
+        return any(token.startswith(s) for token in get_clean_tokens(row_text) for s in selected)
+
+    expected = baseline[baseline["job_field"].apply(check_subject_match)]
+    assert engine.query(subjects=selected).tolist() == rows_of(expected)
+
+
+@pytest.mark.parametrize("badge", ["마감임박", "오늘마감", ""])
+def test_badge_matches_equality(engine, baseline, badge):
+    expected = rows_of(baseline[baseline["badge"] == badge])
+    assert expected
+    assert engine.query(badge=badge).tolist() == expected
+
+
+def test_no_badge_filter_keeps_every_row(engine, baseline):
+    assert engine.query(badge=None).tolist() == list(range(len(baseline)))
+
+
+def test_closing_within_matches_deadline_range(engine, baseline):
+    deadline = TODAY + datetime.timedelta(days=7)
+
+    def closes_in_week(period):
+        end = parse_period(period)[1]
+        return end is not None and TODAY <= datetime.date.fromisoformat(end) <= deadline
+
+    expected = rows_of(baseline[baseline["apply_period"].apply(closes_in_week)])
+    assert expected
+    assert engine.query(closing_within=7, today=TODAY).tolist() == expected
+
+
+def test_combined_filters_match_baseline(engine, baseline):
+    mask = baseline["region"].isin(["수원시", "성남시"]) & (baseline["badge"] == "마감임박")
+    mask &= baseline["job_field"].apply(lambda t: any(tok.startswith("영어") for tok in get_clean_tokens(t)))
+    assert engine.query(regions=["성남시", "수원시"], subjects=["영어"], badge="마감임박").tolist() == rows_of(baseline[mask])
+
+
+def test_lru_cache_evicts_least_recently_used():
+    cache = LRUCache(maxsize=2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1
+    cache.put("c", 3)
+    assert cache.get("b") is None
+    assert (cache.get("a"), cache.get("c")) == (1, 3)
+
+
+def test_cache_key_includes_version(df):
+    cache = LRUCache()
+    old, new = FilterEngine(df, 1, cache), FilterEngine(df, 2, cache)
+    rows = old.query(regions=["수원시"])
+    assert old.query(regions=["수원시"]) is rows
+
+    # 다른 버전의 엔진은 같은 조건이어도 예전 버전 결과를 꺼내 쓰지 않는다
+    stale = np.array([0], dtype=np.int64)
+    cache.put((1,) + old.normalize(badge="오늘마감"), stale)
+    assert old.query(badge="오늘마감") is stale
+    assert new.query(badge="오늘마감") is not stale
+    assert {key[0] for key in cache.data} == {1, 2}
+
+
+def test_equivalent_filters_share_cache_key(engine):
+    assert engine.normalize(search=" 수원  고 ", regions=["b", "a", "a"]) == engine.normalize(search="수원 고", regions=["a", "b"])
+    assert engine.normalize(badge="") != engine.normalize(badge=None)
@@ -0,0 +1,89 @@
+"""증분 수집 — 아는 공고에서 멈추는 규칙과 기존 목록에 합치는 규칙"""
+import datetime
+
+import pytest
+
+from crawler.incremental import badge_for, crawl_new_pages, merge_incremental, update_incremental
+
+RATE = 1000.0
+TODAY = datetime.date(2026, 1, 5)
+
+
+@pytest.fixture
+def board(make_record):
+    """최신순 30건 (공고번호 130 → 101), 모두 2026/01/20 마감"""
+    return [make_record(pbancSn=str(sn), apply_period="2026/01/01 ~ 2026/01/20") for sn in range(130, 100, -1)]
+
+
+def _sns(records):
+    return [r["pbancSn"] for r in records]
+
+
+def test_stops_at_first_page_of_known_postings(stub, board):
+    known = set(_sns(board[10:]))
+    fetched = crawl_new_pages(known, page_size=5, rate=RATE, base_url=stub(records=board))
+    # 1, 2쪽은 새 공고, 3쪽은 전부 아는 공고라 거기서 멈춘다
+    assert _sns(fetched) == _sns(board[:15])
+
+
+def test_page_with_some_known_postings_continues(stub, board):
+    known = set(_sns(board[8:]))
+    fetched = crawl_new_pages(known, page_size=5, rate=RATE, base_url=stub(records=board))
+    assert _sns(fetched) == _sns(board[:15])
+
+
+def test_stops_at_short_last_page(stub, board):
+    fetched = crawl_new_pages(set(), page_size=7, rate=RATE, base_url=stub(records=board[:12]))
+    assert _sns(fetched) == _sns(board[:12])
+
+
+def test_max_pages_bounds_the_crawl(stub, board):
+    fetched = crawl_new_pages(set(), page_size=5, rate=RATE, base_url=stub(records=board), max_pages=2)
+    assert _sns(fetched) == _sns(board[:10])
+
+
+@pytest.mark.parametrize("apply_period, stored_badge, expected", [
+    ("2026/01/01 ~ 2026/01/20", "마감임박", ""),
+    ("2026/01/01 ~ 2026/01/10", "", "마감임박"),
+    ("2026/01/01 ~ 2026/01/05", "마감임박", "오늘마감"),
+    ("2026/01/01 ~ 2026/01/04", "", None),
+    ("상시 채용", "마감임박", "마감임박"),
+])
+def test_badge_from_deadline(make_record, apply_period, stored_badge, expected):
+    assert badge_for(make_record(apply_period=apply_period, badge=stored_badge), TODAY) == expected
+
+
+def test_merge_rules(make_record):
+    existing = [
+        make_record(pbancSn="10", apply_period="2026/01/01 ~ 2026/01/20", badge="마감임박"),
+        make_record(pbancSn="9", apply_period="2026/01/01 ~ 2026/01/04"),
+        make_record(pbancSn="invalid:abc", apply_period="", parse_error="상세 정보 부족"),
+        make_record(pbancSn="8", apply_period="2026/01/01 ~ 2026/01/08"),
+    ]
+    fetched = [
+        make_record(pbancSn="12"),
+        make_record(pbancSn="11"),
+        make_record(pbancSn="10", title="제목 수정", apply_period="2026/01/01 ~ 2026/01/20", badge=""),
+    ]
+    merged, new = merge_incremental(existing, fetched, today=TODAY)
+
+    assert _sns(new) == ["12", "11"]
+    # 새 공고가 앞, 다시 받은 공고는 사이트 값, 마감 지난 공고와 다시 안 받은 파싱 실패는 빠진다
+    assert _sns(merged) == ["12", "11", "10", "8"]
+    assert merged[2]["title"] == "제목 수정"
+    assert merged[3]["badge"] == "마감임박"
+
+
+def test_refetched_parse_failure_is_kept(make_record):
+    failed = make_record(pbancSn="invalid:abc", apply_period="", parse_error="상세 정보 부족")
+    merged, new = merge_incremental([failed], [dict(failed)], today=TODAY)
+    assert _sns(merged) == ["invalid:abc"] and new == []
+
+
+def test_update_incremental_merges_new_postings(stub, board):
+    existing = [dict(r, badge="마감임박") for r in board[10:]]
+    merged, new = update_incremental(existing, backend="http", today=TODAY, rate=RATE,
+                                     base_url=stub(records=board), page_size=5)
+    assert _sns(new) == _sns(board[:10])
+    assert _sns(merged) == _sns(board)
+    assert {r["badge"] for r in merged} == {""}
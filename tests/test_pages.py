@@ -0,0 +1,42 @@
+"""페이지 단위 병렬 수집 — 대역 서버의 currPage/pageIndex 응답으로 확인"""
+import time
+
+import pytest
+
+from crawler.pages import RateLimiter, crawl_all_pages, merge_pages
+from crawler.store import RECORD_FIELDS
+
+# 테스트에서는 요청 속도 제한을 사실상 풀어 둔다
+RATE = 1000.0
+
+
+def _fields(records):
+    return [{f: r[f] for f in RECORD_FIELDS} for r in records]
+
+
+@pytest.mark.parametrize("page_size, workers", [(5, 2), (4, 4), (12, 1), (50, 3)])
+def test_paged_crawl_collects_every_record(stub, expected, page_size, workers):
+    # 12건: 짧은 마지막 페이지, 꽉 찬 마지막 페이지 뒤 빈 페이지, 한 페이지 전부인 경우
+    records = crawl_all_pages(page_size=page_size, workers=workers, rate=RATE, base_url=stub(records=expected))
+    assert _fields(records) == expected
+
+
+def test_max_pages_stops_an_endless_board(stub, expected):
+    records = crawl_all_pages(page_size=2, workers=2, rate=RATE, base_url=stub(records=expected), max_pages=3)
+    assert _fields(records) == expected[:6]
+
+
+def test_merge_pages_keeps_first_duplicate_in_page_order():
+    pages = {2: [{"pbancSn": "3"}, {"pbancSn": "2", "page": 2}], 1: [{"pbancSn": "1"}, {"pbancSn": "2", "page": 1}]}
+    merged = merge_pages(pages)
+    assert [r["pbancSn"] for r in merged] == ["1", "2", "3"]
+    assert merged[1]["page"] == 1
+
+
+def test_rate_limiter_spaces_requests():
+    limiter = RateLimiter(rate=50, burst=1)
+    started = time.monotonic()
+    for _ in range(6):
+        limiter.acquire()
+    # 첫 요청은 바로, 나머지 5번은 1/50초씩
+    assert time.monotonic() - started >= 5 / 50 * 0.9
@@ -0,0 +1,46 @@
+"""목록 HTML 파서 — 저장해 둔 fixture 와 기존 Selenium 파서 결과(expected.json) 비교"""
+from crawler.parser import parse_recruit_html, parse_recruit_list
+from crawler.stub_server import render_listing_html
+
+
+def test_fixture_matches_expected(fixture_path, expected):
+    with open(fixture_path("hnfpPbancList.html"), "rb") as f:
+        assert parse_recruit_html(f.read()) == expected
+
+
+def test_str_and_bytes_input_agree(fixture_path):
+    with open(fixture_path("hnfpPbancList.html"), "rb") as f:
+        raw = f.read()
+    assert parse_recruit_html(raw.decode("utf-8")) == parse_recruit_html(raw)
+
+
+def test_driver_page_source_is_read_once(fixture_path, expected):
+    class FakeDriver:
+        reads = 0
+
+        @property
+        def page_source(self):
+            FakeDriver.reads += 1
+            with open(fixture_path("hnfpPbancList.html"), encoding="utf-8") as f:
+                return f.read()
+
+    assert parse_recruit_list(FakeDriver()) == expected
+    assert FakeDriver.reads == 1
+
+
+def test_missing_phone_is_empty_string(make_record):
+    [record] = parse_recruit_html(render_listing_html([make_record(phone="")]))
+    assert record["phone"] == ""
+    assert record["reg_date"] == "2026/01/03"
+
+
+def test_badge_is_stripped_from_title(make_record):
+    [record] = parse_recruit_html(render_listing_html([make_record(badge="마감임박")]))
+    assert record["badge"] == "마감임박"
+    assert record["title"] == "기간제교사 채용 공고"
+
+
+def test_empty_job_field_defaults_to_placeholder(make_record):
+    [record] = parse_recruit_html(render_listing_html([make_record(job_field="내용없음")]))
+    assert record["job_field"] == "내용없음"
+
@@ -0,0 +1,57 @@
+"""수집 품질 검사 — 파싱 실패 항목의 임시 번호, 규칙 비트 플래그와 저장"""
+from crawler import quality
+from crawler.parser import parse_recruit_html
+from crawler.snapshot import ensure_snapshot, read_snapshot, to_dataframe
+from crawler.store import PostingStore, normalize_record
+from crawler.stub_server import render_listing_html
+from dashboard.filters import FilterEngine, LRUCache
+
+
+def broken_listing(make_record, views=0):
+    """첫 공고의 공고번호 링크와 아랫줄이 깨진 목록"""
+    html = render_listing_html([make_record(), make_record(pbancSn="101")])
+    html = html.replace("goView('100')", "noView()").replace("cont_btm", "cont_xx", 1)
+    return parse_recruit_html(html.replace("조회수 : 0", f"조회수 : {views}"))
+
+
+def test_broken_item_is_kept_with_stable_id(make_record):
+    first, second = broken_listing(make_record, 10), broken_listing(make_record, 11)
+    assert [r["pbancSn"] for r in first][1] == "101"
+    failed = first[0]
+    assert failed["pbancSn"].startswith(quality.INVALID_SN_PREFIX)
+    assert failed["parse_error"] and failed["raw_snippet"]
+    # 조회수처럼 매번 바뀌는 값이 달라도 같은 임시 번호
+    assert second[0]["pbancSn"] == failed["pbancSn"]
+
+
+def test_flags_follow_rules(make_record):
+    clean = normalize_record(make_record())
+    assert quality.describe(clean["quality"]) == []
+
+    row = normalize_record(make_record(recruit_info="시급 신입", job_field="내용없음", phone="",
+                                       apply_period="접수 후 결정 ~ 2026/01/08"))
+    assert row["quality"] == (quality.FLAG_MISSING_REGION | quality.FLAG_MISSING_SUBJECT
+                              | quality.FLAG_BAD_DATES | quality.FLAG_NO_PHONE)
+    assert quality.describe(row["quality"]) == ["지역 누락", "직무 누락", "날짜 해석 불가", "연락처 없음"]
+
+
+def test_parse_failure_is_stored_without_link_or_change(tmp_path, make_record):
+    store = PostingStore(str(tmp_path / "recruit.db"))
+    store.publish([make_record(pbancSn="101")])
+    records = broken_listing(make_record)
+    failed_sn = records[0]["pbancSn"]
+    version = store.publish(records)
+
+    failures = store.load_parse_failures([failed_sn, "101"])
+    assert list(failures) == [failed_sn]
+    reason, snippet = failures[failed_sn]
+    assert reason == records[0]["parse_error"] and snippet == records[0]["raw_snippet"]
+    # 임시 번호로는 원본 링크를 만들지 않고, 변경 기록에도 남기지 않는다
+    assert store.changes_since(version - 1) == []
+
+    path, snapshot_version = ensure_snapshot(store)
+    df = to_dataframe(read_snapshot(path))
+    engine = FilterEngine(df, snapshot_version, LRUCache())
+    [row] = engine.flagged(quality.FLAG_PARSE_FAILED)
+    assert df["pbancSn"][row] == failed_sn and df["원본링크"][row] == ""
+    assert df["원본링크"][1 - row].endswith("=101")
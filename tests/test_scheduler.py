@@ -0,0 +1,93 @@
+"""크롤링 single-flight 잠금과 스케줄러의 새로고침 요청 처리"""
+import fcntl
+import threading
+
+import pytest
+
+from crawler import detail, scheduler
+from crawler.store import PostingStore
+
+
+@pytest.fixture
+def store(tmp_path, monkeypatch):
+    monkeypatch.setattr(detail, "ENABLED", False)
+    return PostingStore(str(tmp_path / "recruit.db"))
+
+
+@pytest.fixture
+def blocking_collect(monkeypatch, make_record):
+    """release 될 때까지 수집 단계에서 멈춰 있는 가짜 수집 (불린 전체/증분 여부를 남긴다)"""
+    started, release, calls = threading.Event(), threading.Event(), []
+
+    def collect(store, full=False, sources=None):
+        calls.append(full)
+        started.set()
+        release.wait(10)
+        return [make_record(pbancSn=str(len(calls)))], [], {}
+
+    monkeypatch.setattr(scheduler, "collect", collect)
+    return started, release, calls
+
+
+def test_second_crawl_is_skipped_while_one_runs(store, blocking_collect):
+    started, release, calls = blocking_collect
+    first = []
+    thread = threading.Thread(target=lambda: first.append(scheduler.run_crawl(store)))
+    thread.start()
+    assert started.wait(10)
+
+    assert scheduler.run_crawl(store, trigger="manual") is None
+    release.set()
+    thread.join(10)
+    assert first[0]["status"] == "ok" and calls == [False]
+    assert [r["trigger"] for r in store.recent_runs()] == ["schedule"]
+
+
+def test_lock_held_by_another_process_skips_the_crawl(store, blocking_collect):
+    _, release, calls = blocking_collect
+    release.set()
+    # flock 은 열린 파일마다 따로라 같은 프로세스에서도 다른 프로세스처럼 막힌다
+    with open(store.path + ".crawl.lock", "a") as f:
+        fcntl.flock(f, fcntl.LOCK_EX)
+        assert scheduler.run_crawl(store) is None
+        fcntl.flock(f, fcntl.LOCK_UN)
+    assert scheduler.run_crawl(store)["status"] == "ok"
+    assert calls == [False]
+
+
+def test_refresh_requested_during_a_crawl_runs_afterwards(store, blocking_collect):
+    started, release, calls = blocking_collect
+    store.set_meta("last_full_crawl_at", 2 ** 40)
+    crawler = scheduler.CrawlScheduler(store, interval=3600, poll=0.05)
+    crawler.start()
+    try:
+        # 처음 실행(주기 도래) 도중 새로고침을 요청한다
+        assert started.wait(10)
+        started.clear()
+        crawler.request_refresh()
+        release.set()
+        assert started.wait(10)
+    finally:
+        crawler.stop()
+        crawler.join(10)
+    triggers = [r["trigger"] for r in reversed(store.recent_runs())]
+    assert triggers[:2] == ["schedule", "manual"]
+
+
+def test_full_crawl_runs_when_due_then_incremental(store, blocking_collect):
+    started, release, calls = blocking_collect
+    release.set()
+    crawler = scheduler.CrawlScheduler(store, interval=0, poll=0.05, full_interval=3600)
+    crawler.start()
+    try:
+        # 전체 수집 기록이 없으면 처음은 전체 수집, 그다음부터는 증분 수집
+        for _ in range(2):
+            assert started.wait(10)
+            started.clear()
+    finally:
+        crawler.stop()
+        crawler.join(10)
+    assert calls[:2] == [True, False]
+    triggers = [r["trigger"] for r in reversed(store.recent_runs())]
+    assert triggers[:2] == ["full", "schedule"]
+    assert float(store.get_meta("last_full_crawl_at")) > 0
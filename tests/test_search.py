@@ -0,0 +1,68 @@
+"""학교명/제목 bigram 검색 — 예전 str.contains 검색과 비교"""
+import pandas as pd
+import pytest
+
+from benchmarks.synthetic import generate_records
+from dashboard.search import SearchIndex
+
+
+def build(records):
+    return SearchIndex.build({"school": [r["school"] for r in records], "title": [r["title"] for r in records]})
+
+
+def contains_rows(records, term, **kwargs):
+    """예전 app.py 검색: 학교명 또는 제목에 term 이 들어 있는 행"""
+    df = pd.DataFrame(records)
+    hit = df["school"].str.contains(term, na=False, **kwargs) | df["title"].str.contains(term, na=False, **kwargs)
+    return hit.to_numpy().nonzero()[0].tolist()
+
+
+@pytest.fixture(scope="module")
+def synthetic():
+    return generate_records(2000, seed=3)
+
+
+@pytest.mark.parametrize("term", ["고", "중학교", "안산", "기간제교사", "재공고", "수학", "1차", "없는말"])
+def test_single_term_matches_str_contains(synthetic, term):
+    assert sorted(build(synthetic).search(term).tolist()) == contains_rows(synthetic, term)
+
+
+def test_fixture_matches_str_contains(expected):
+    index = build(expected)
+    for term in ["고등학교", "기간제", "공고", "초"]:
+        assert sorted(index.search(term).tolist()) == contains_rows(expected, term)
+
+
+@pytest.mark.parametrize("term", ["(", ".", "[안", "*", "과)"])
+def test_regex_characters_are_literal(synthetic, term):
+    assert sorted(build(synthetic).search(term).tolist()) == contains_rows(synthetic, term, regex=False)
+
+
+def test_multiple_terms_are_and(synthetic):
+    index = build(synthetic)
+    both = set(contains_rows(synthetic, "안산")) & set(contains_rows(synthetic, "재공고"))
+    assert both
+    assert sorted(index.search("안산  재공고").tolist()) == sorted(both)
+    assert index.search("안산 없는말").tolist() == []
+
+
+def test_case_is_folded(make_record):
+    records = [make_record(school="ABC School"), make_record(title="abc 공고"), make_record()]
+    index = build(records)
+    assert index.search("abc").tolist() == index.search("ABC").tolist()
+    assert sorted(index.search("aBc").tolist()) == [0, 1]
+
+
+def test_results_are_ordered_by_relevance(make_record):
+    records = [
+        make_record(school="다라고등학교", title="기간제교사 채용"),
+        make_record(school="다라고등학교", title="수원 기간제교사 채용"),
+        make_record(school="수원고등학교", title="기간제교사 채용"),
+        make_record(school="수원고등학교", title="수원 기간제교사 채용"),
+    ]
+    # 학교명과 제목 모두(3+2) > 학교명(3) > 제목(2), 같으면 원래 순서
+    assert build(records).search("수원").tolist() == [3, 2, 1]
+
+
+def test_blank_query_returns_every_row(expected):
+    assert build(expected).search("  ").tolist() == list(range(len(expected)))
@@ -0,0 +1,28 @@
+"""Arrow 스냅샷 — 돌려받는 버전이 실제로 쓴 파일의 버전인지"""
+import os
+
+from crawler.snapshot import ensure_snapshot, read_snapshot, snapshot_version, to_dataframe
+from crawler.store import PostingStore
+
+
+def test_ensure_snapshot_returns_written_version(tmp_path, expected):
+    store = PostingStore(str(tmp_path / "recruit.db"))
+    store.publish(expected)
+    first = store.dataset_version()
+
+    path, version = ensure_snapshot(store)
+    assert version == first == snapshot_version(path)
+    assert to_dataframe(read_snapshot(path))["pbancSn"].tolist() == [r["pbancSn"] for r in expected]
+
+    # 예전 버전을 달라고 해도 이미 있는 새 스냅샷을 그대로 쓴다
+    store.publish(expected[1:])
+    newer_path, newer = ensure_snapshot(store)
+    assert newer == store.dataset_version() > first
+    inode = os.stat(newer_path).st_ino
+    assert ensure_snapshot(store, first) == (newer_path, newer)
+    assert os.stat(newer_path).st_ino == inode
+
+    # 요청한 버전보다 파일이 오래됐으면 지금 버전으로 다시 쓴다
+    store.publish(expected)
+    assert ensure_snapshot(store, store.dataset_version()) == (path, newer + 1)
+    assert len(to_dataframe(read_snapshot(path))) == len(expected)
@@ -0,0 +1,58 @@
+"""게시판 플러그인 — 공고번호 namespace, 게시판별 수집 결과 합치기와 실패 처리"""
+import pytest
+
+from crawler import detail, metrics, sources
+from crawler.scheduler import collect
+from crawler.store import DETAIL_URL, PostingStore
+from tests import plugin_sources
+from tests.plugin_sources import ALPHA, BETA, BROKEN
+
+
+@pytest.fixture
+def store(tmp_path, monkeypatch):
+    monkeypatch.setattr(detail, "ENABLED", False)
+    # spawn 으로 뜬 수집 프로세스도 같은 플러그인을 불러오도록 환경 변수로 넘긴다
+    monkeypatch.setenv("CRAWL_SOURCE_MODULES", plugin_sources.__name__)
+    return PostingStore(str(tmp_path / "recruit.db"))
+
+
+def test_records_get_namespace_and_link():
+    record = ALPHA.to_record({"pbancSn": "7", "title": "공고"})
+    assert (record["pbancSn"], record["source"], record["link"]) == ("alpha:7", "alpha", "http://alpha.test/view?sn=7")
+    assert ALPHA.to_record({"pbancSn": "invalid:ab12"})["link"] == ""
+    # 기본 게시판은 예전 데이터와 같도록 접두어를 붙이지 않는다
+    goe = sources.GOE.to_record({"pbancSn": "7"})
+    assert (goe["pbancSn"], goe["link"]) == ("7", DETAIL_URL + "7")
+
+
+def test_single_source_failure_is_reported_like_the_pool():
+    before = metrics.CRAWLER.counters.get(("recruit_source_errors_total", (("source", "broken"),)), 0)
+    assert sources.crawl_sources([BROKEN], {}) == ({}, {"broken": "게시판 점검 중"})
+    assert metrics.CRAWLER.counters[("recruit_source_errors_total", (("source", "broken"),))] == before + 1
+
+
+def test_single_source_crawls_in_process(store):
+    final, new, errors = collect(store, sources=[ALPHA])
+    assert errors == {}
+    assert [r["pbancSn"] for r in final] == [f"alpha:{sn}" for sn in range(130, 100, -1)]
+    assert len(new) == 30
+
+
+def test_spawn_pool_merges_sources_and_keeps_failed_source_records(store):
+    kept = BROKEN.to_record(plugin_sources.board(9, 1, "점검고등학교")[0])
+    store.publish([kept])
+
+    final, new, errors = collect(store, sources=[ALPHA, BETA, BROKEN])
+    assert errors == {"broken": "게시판 점검 중"}
+    by_source = {}
+    for record in final:
+        by_source.setdefault(record["source"], []).append(record["pbancSn"])
+    # 게시판끼리 같은 원래 공고번호(130...)도 namespace 로 구분된다
+    assert by_source["alpha"][:2] == ["alpha:130", "alpha:129"] and len(by_source["alpha"]) == 30
+    assert by_source["beta"] == [f"beta:{sn}" for sn in range(130, 125, -1)]
+    # 실패한 게시판은 저장된 공고를 그대로 둔다
+    assert by_source["broken"] == ["broken:9"]
+    assert {r["source"] for r in new} == {"alpha", "beta"} and len(new) == 35
+
+    store.publish(final)
+    assert store.count() == 36
@@ -0,0 +1,137 @@
+"""SQLite 저장소 — 스키마 이전, 반영(publish)과 변경 기록, 예전 JSON 가져오기/내보내기"""
+import json
+import sqlite3
+
+import pytest
+
+from crawler.store import DETAIL_URL, MIGRATIONS, RECORD_FIELDS, PostingStore, diff_postings, normalize_record, open_store
+
+
+@pytest.fixture
+def store(tmp_path):
+    return PostingStore(str(tmp_path / "recruit.db"))
+
+
+def _user_version(path):
+    with sqlite3.connect(path) as conn:
+        return conn.execute("PRAGMA user_version").fetchone()[0]
+
+
+def _changes(store, version):
+    return sorted((c["kind"], c["pbancSn"], c["fields"]) for c in store.changes_since(version - 1))
+
+
+def test_migrates_empty_database_and_rerun_does_nothing(tmp_path, make_record):
+    path = str(tmp_path / "recruit.db")
+    store = PostingStore(path)
+    assert _user_version(path) == len(MIGRATIONS)
+    store.publish([make_record()])
+
+    statements = []
+    with store.connect() as conn:
+        conn.set_trace_callback(statements.append)
+        store._migrate(conn)
+    assert statements == ["PRAGMA user_version"]
+    assert PostingStore(path).count() == 1
+    assert _user_version(path) == len(MIGRATIONS)
+
+
+def test_upgrade_from_first_schema_backfills_derived_columns(tmp_path, make_record):
+    path = str(tmp_path / "recruit.db")
+    record = make_record(pbancSn="42", recruit_info="시급 | 안산시", phone="")
+    with sqlite3.connect(path) as conn:
+        for statement in MIGRATIONS[0].split(";"):
+            if statement.strip():
+                conn.execute(statement)
+        conn.execute("PRAGMA user_version = 1")
+        conn.execute(
+            f"INSERT INTO postings ({', '.join(RECORD_FIELDS)}, region, updated_at) "
+            f"VALUES ({', '.join('?' for _ in RECORD_FIELDS)}, '안산시', 0)",
+            [record[f] for f in RECORD_FIELDS],
+        )
+
+    store = PostingStore(path)
+    assert _user_version(path) == len(MIGRATIONS)
+    [loaded] = store.load_records()
+    assert {f: loaded[f] for f in RECORD_FIELDS} == record
+    assert loaded["source"] == "goe" and loaded["link"] == DETAIL_URL + "42"
+    with store.connect() as conn:
+        row = conn.execute("SELECT apply_end, content_hash, quality FROM postings").fetchone()
+    assert row == ("2026-01-08", normalize_record(record)["content_hash"], normalize_record(record)["quality"])
+
+
+def test_first_publish_is_the_baseline(store, make_record):
+    version = store.publish([make_record(pbancSn="1"), make_record(pbancSn="2")])
+    assert version == 1 == store.dataset_version()
+    assert store.changes_since(0) == []
+
+
+def test_publish_logs_new_changed_and_closed(store, make_record):
+    store.publish([
+        make_record(pbancSn="1"),
+        make_record(pbancSn="2"),
+        make_record(pbancSn="3", apply_period="2026/01/03 ~ 2026/01/08"),
+        make_record(pbancSn="4"),
+    ])
+    version = store.publish([
+        make_record(pbancSn="5"),
+        make_record(pbancSn="1"),
+        make_record(pbancSn="2", badge="마감임박", title="제목 수정"),
+        make_record(pbancSn="3", apply_period="2026/01/03 ~ 2026/01/15"),
+    ])
+    assert version == 2
+    assert _changes(store, version) == [
+        ("changed", "2", "badge,content"),
+        ("changed", "3", "apply_end"),
+        ("closed", "4", ""),
+        ("new", "5", ""),
+    ]
+    assert [r["pbancSn"] for r in store.load_records()] == ["5", "3", "2", "1"]
+
+
+def test_parse_failures_are_left_out_of_changes(store, make_record):
+    failed = make_record(pbancSn="invalid:abc", parse_error="상세 정보 부족", raw_snippet="<li>...</li>")
+    store.publish([make_record(pbancSn="1"), dict(failed, pbancSn="invalid:old")])
+    version = store.publish([make_record(pbancSn="1"), failed])
+    assert _changes(store, version) == []
+
+    # 고쳐져서 처음 제대로 읽힌 공고는 새 공고
+    store.publish([make_record(pbancSn="1"), make_record(pbancSn="7", parse_error="x")])
+    version = store.publish([make_record(pbancSn="1"), make_record(pbancSn="7")])
+    assert _changes(store, version) == [("new", "7", "")]
+
+
+def test_diff_postings_reports_badge_only_change():
+    old = normalize_record({"pbancSn": "1", "title": "a", "badge": ""})
+    new = normalize_record({"pbancSn": "1", "title": "a", "badge": "마감임박"})
+    assert [(c["kind"], c["fields"]) for c in diff_postings({"1": old}, [new])] == [("changed", "badge")]
+
+
+def test_import_json_runs_once(tmp_path, expected):
+    legacy = tmp_path / "recruit_list.json"
+    legacy.write_text(json.dumps(expected, ensure_ascii=False), encoding="utf-8")
+    path = str(tmp_path / "recruit.db")
+
+    store = open_store(path, legacy_json=str(legacy))
+    assert store.count() == len(expected)
+    legacy.write_text(json.dumps(expected[:2], ensure_ascii=False), encoding="utf-8")
+    assert store.import_json(str(legacy)) == 0
+    store.replace_all(expected[:3])
+    assert open_store(path, legacy_json=str(legacy)).count() == 3
+
+
+def test_import_json_does_not_overwrite_crawled_data(tmp_path, expected, make_record):
+    legacy = tmp_path / "recruit_list.json"
+    legacy.write_text(json.dumps(expected, ensure_ascii=False), encoding="utf-8")
+    store = PostingStore(str(tmp_path / "recruit.db"))
+    store.publish([make_record()])
+    assert store.import_json(str(legacy)) == 0
+    assert store.count() == 1
+
+
+def test_export_json_writes_the_old_format(tmp_path, expected):
+    store = PostingStore(str(tmp_path / "recruit.db"))
+    store.publish([dict(r, source="goe", link="x") for r in expected])
+    out = tmp_path / "out.json"
+    store.export_json(str(out))
+    assert out.read_text(encoding="utf-8") == json.dumps(expected, ensure_ascii=False, indent=4)
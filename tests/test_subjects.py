@@ -0,0 +1,61 @@
+"""직무(과목) 역색인 — 예전 app.py 의 extract_root_subjects / 행 단위 startswith 필터와 비교"""
+import pytest
+
+from benchmarks.synthetic import generate_records
+from dashboard.subjects import SubjectIndex, covering_root, derive_roots, get_clean_tokens
+
+
+def baseline_roots(job_fields):
+    """예전 extract_root_subjects: 짧은 토큰부터 기존 root 를 모두 훑어 본다"""
+    all_tokens = set()
+    for text in job_fields:
+        all_tokens.update(get_clean_tokens(text))
+    roots = []
+    for token in sorted(all_tokens, key=len):
+        if not any(token.startswith(root) for root in roots):
+            roots.append(token)
+    return sorted(roots)
+
+
+def baseline_rows(job_fields, selected):
+    """예전 check_subject_match 를 행마다 apply 한 결과"""
+    return [
+        pos for pos, text in enumerate(job_fields)
+        if any(token.startswith(s) for token in get_clean_tokens(text) for s in selected)
+    ]
+
+
+def _job_fields(name, expected):
+    if name == "fixture":
+        return [r["job_field"] for r in expected]
+    if name == "synthetic":
+        return [r["job_field"] for r in generate_records(3000, seed=7)]
+    # 접두어 관계가 겹겹이 있는 과목과 빈 값/None
+    return ["정보", "정보.컴퓨터 1명", "정", "정치", "보건교사", "보건(1년)", "유아영어, 영어", None, "", "2명", "영어회화"]
+
+
+@pytest.mark.parametrize("name", ["fixture", "synthetic", "nested"])
+def test_roots_and_rows_match_baseline(name, expected):
+    job_fields = _job_fields(name, expected)
+    index = SubjectIndex.build(job_fields)
+
+    assert index.roots == baseline_roots(job_fields)
+    for root in index.roots:
+        assert index.rows([root]).tolist() == baseline_rows(job_fields, [root])
+    selected = index.roots[::3]
+    assert index.rows(selected).tolist() == baseline_rows(job_fields, selected)
+    assert index.mask(selected).nonzero()[0].tolist() == baseline_rows(job_fields, selected)
+
+
+def test_unknown_subject_matches_nothing():
+    index = SubjectIndex.build(["국어", "수학"])
+    assert index.rows(["과학"]).tolist() == []
+    assert not index.mask(["과학"]).any()
+
+
+def test_covering_root_needs_prefix_free_roots():
+    roots = derive_roots(["정보컴퓨터", "정보", "정", "정치", "보건교사"])
+    assert roots == ["보건교사", "정"]
+    assert covering_root(roots, "정보컴퓨터") == "정"
+    assert covering_root(roots, "보건") is None
+    assert covering_root(roots, "가") is None